@@ -0,0 +1,6 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+"""Benchmarks and fixtures for GitHub Backup Tools"""
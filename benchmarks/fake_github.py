@@ -0,0 +1,142 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeGitHubServer:
+    """Local stand-in for the parts of the GitHub REST API the tool uses.
+
+    Serves ``/user``, ``/user/repos``, ``/user/orgs``, ``/orgs/<org>/repos``
+    and ``/rate_limit`` with ``page``/``per_page`` pagination and ``Link``
+    headers, ``X-RateLimit-*`` headers and ETags (``If-None-Match`` answers
+    304 without consuming the rate limit, as GitHub does)."""
+
+    def __init__(self, login: str, repos: List[Dict], orgs: Optional[Dict[str, List[Dict]]] = None,
+                 rate_limit: int = 5000, latency: float = 0.0):
+        self.login = login
+        self.repos = repos
+        self.orgs = orgs or {}
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.reset_at = int(time.time()) + 3600
+        self.latency = latency
+        self.requests = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.not_modified = 0
+            self.remaining = self.rate_limit
+
+    def _route(self, path: str) -> Optional[object]:
+        if path == '/user':
+            return {"login": self.login, "name": self.login, "public_repos": len(self.repos)}
+        if path == '/user/repos':
+            return self.repos
+        if path == '/user/orgs':
+            return [{"login": org} for org in self.orgs]
+        if path.startswith('/orgs/') and path.endswith('/repos'):
+            return self.orgs.get(path.split('/')[2])
+        if path == '/rate_limit':
+            return {"resources": {"core": {"limit": self.rate_limit, "remaining": self.remaining,
+                                           "reset": self.reset_at}}}
+        return None
+
+    def _paginate(self, data, query: Dict[str, List[str]], path: str):
+        if not isinstance(data, list):
+            return data, None
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+        page = max(int(query.get('page', ['1'])[0]), 1)
+        items = data[(page - 1) * per_page:page * per_page]
+        links = []
+        last_page = max((len(data) + per_page - 1) // per_page, 1)
+        if page < last_page:
+            links.append(f'<{self.base_url}{path}?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<{self.base_url}{path}?per_page={per_page}&page={last_page}>; rel="last"')
+        return items, ', '.join(links) or None
+
+    def _make_handler(self):
+        server = self
+
+        class FakeGitHubHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                url = urlparse(self.path)
+                data = server._route(url.path)
+                if data is None:
+                    self._send(404, {"message": "Not Found"})
+                    return
+
+                body, link = server._paginate(data, parse_qs(url.query), url.path)
+                payload = json.dumps(body).encode('utf-8')
+                etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+
+                with server._lock:
+                    server.requests += 1
+                    if self.headers.get('If-None-Match') == etag:
+                        server.not_modified += 1
+                        self._send(304, None, etag=etag)
+                        return
+                    if server.remaining <= 0:
+                        self._send(403, {"message": "API rate limit exceeded"})
+                        return
+                    server.remaining -= 1
+
+                self._send(200, payload, etag=etag, link=link)
+
+            def _send(self, status: int, body, etag: Optional[str] = None, link: Optional[str] = None):
+                if isinstance(body, dict):
+                    body = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('X-RateLimit-Limit', str(server.rate_limit))
+                self.send_header('X-RateLimit-Remaining', str(server.remaining))
+                self.send_header('X-RateLimit-Reset', str(server.reset_at))
+                if etag:
+                    self.send_header('ETag', etag)
+                if link:
+                    self.send_header('Link', link)
+                self.send_header('Content-Length', str(len(body) if body else 0))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return FakeGitHubHandler
+
+    def start(self, host: str = '127.0.0.1', port: int = 0) -> 'FakeGitHubServer':
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        threading.Thread(target=self._server.serve_forever, name="fake-github", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
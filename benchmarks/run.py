@@ -0,0 +1,158 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+"""End-to-end benchmarks against a local fake GitHub API and synthetic repositories.
+
+Usage (from the repository root):
+    python -m benchmarks.run --repos 10,1000 --output results.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks.fake_github import FakeGitHubServer
+from benchmarks.synthetic_repos import SyntheticRepos
+from core.backup.archive_manager import ArchiveManager
+from core.backup.repo_manager import RepoManager
+from core.github.api_client import GitHubAPIClient
+
+SCENARIOS = ('inventory', 'cold', 'warm', 'archive')
+LOGIN = 'bench'
+
+
+def _timed(func: Callable, verbose: bool):
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        result = func()
+        wall = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+    return result, {"seconds": round(wall, 4), "cpu_seconds": round(cpu, 4)}
+
+
+def _stats_dict(stats) -> Dict:
+    return {
+        "cloned": stats.cloned,
+        "updated": stats.updated,
+        "synced": stats.synced,
+        "skipped": stats.skipped,
+        "failed": stats.failed,
+        "bytes_received": sum(r.bytes_received for r in stats.repo_records)
+    }
+
+
+def run_size(count: int, args, workdir: Path) -> Dict:
+    result: Dict = {"repos": count}
+
+    repos, result["generate"] = _timed(
+        lambda: SyntheticRepos(workdir / "remotes", args.size_kb, args.branches).generate(count, LOGIN),
+        verbose=False
+    )
+
+    home = workdir / f"home-{count}"
+    shutil.rmtree(home, ignore_errors=True)
+    home.mkdir(parents=True)
+    os.environ['HOME'] = str(home)
+
+    with FakeGitHubServer(LOGIN, repos, latency=args.latency / 1000) as server:
+        client = GitHubAPIClient('bench-token', timeout=args.timeout, base_url=server.base_url)
+        client.login = LOGIN
+
+        inventory, timing = _timed(client.get_all_repos, args.verbose)
+        result["inventory"] = {**timing, "requests": server.requests, "found": len(inventory)}
+
+        if 'cold' in args.scenarios:
+            stats, timing = _timed(
+                lambda: RepoManager(client, timeout=args.timeout, workers=args.workers).process_repositories(inventory), args.verbose
+            )
+            result["cold"] = {**timing, "repos_per_second": round(count / timing["seconds"], 2),
+                              **_stats_dict(stats)}
+
+        if 'warm' in args.scenarios:
+            stats, timing = _timed(
+                lambda: RepoManager(client, timeout=args.timeout, workers=args.workers).process_repositories(inventory), args.verbose
+            )
+            result["warm"] = {**timing, "repos_per_second": round(count / timing["seconds"], 2),
+                              **_stats_dict(stats)}
+
+    if 'archive' in args.scenarios:
+        manager = ArchiveManager(LOGIN)
+        path, timing = _timed(manager.create_archive, args.verbose)
+        result["archive"] = {**timing, **manager.stats.to_dict()} if path else {**timing, "error": "failed"}
+
+    if not args.keep:
+        shutil.rmtree(home, ignore_errors=True)
+    return result
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="GitHub Repositories Backup Tools benchmarks")
+    parser.add_argument("--repos", default="10,1000,10000",
+                        help="Comma separated repository counts (default: 10,1000,10000)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help=f"Comma separated scenarios out of {', '.join(SCENARIOS)} (inventory always runs)")
+    parser.add_argument("--size-kb", type=int, default=64, help="Payload size of each repository (default: 64)")
+    parser.add_argument("--branches", type=int, default=1, help="Branches per repository (default: 1)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake API latency per request in ms")
+    parser.add_argument("--workers", type=int, default=1, help="Repository workers (default: 1)")
+    parser.add_argument("--timeout", type=int, default=30, help="Timeout for git operations (default: 30)")
+    parser.add_argument("--workdir", help="Directory for synthetic repositories (default: temporary)")
+    parser.add_argument("--keep", action="store_true", help="Keep the cloned repositories and archives")
+    parser.add_argument("--output", help="Write results as JSON to this file (default: stdout)")
+    parser.add_argument("--verbose", action="store_true", help="Show the tool's console output")
+    args = parser.parse_args(argv)
+    args.scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="grbt-bench-"))
+    original_home = os.environ.get('HOME')
+    git_version = subprocess.run(['git', '--version'], capture_output=True, text=True).stdout.strip()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "git": git_version,
+            "size_kb": args.size_kb,
+            "branches": args.branches,
+            "latency_ms": args.latency,
+            "workers": args.workers,
+            "scenarios": args.scenarios
+        },
+        "results": []
+    }
+
+    try:
+        for count in [int(c) for c in args.repos.split(',') if c.strip()]:
+            print(f"⏱️  Benchmarking {count} repositories...", file=sys.stderr)
+            report["results"].append(run_size(count, args, workdir))
+    finally:
+        if original_home is not None:
+            os.environ['HOME'] = original_home
+        if not args.workdir and not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n', encoding='utf-8')
+        print(f"✅ Results written: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
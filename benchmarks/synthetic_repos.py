@@ -0,0 +1,78 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+PUSHED_AT = '2020-01-01T00:00:00Z'
+GIT_ENV = {
+    'GIT_AUTHOR_NAME': 'bench',
+    'GIT_AUTHOR_EMAIL': 'bench@example.com',
+    'GIT_COMMITTER_NAME': 'bench',
+    'GIT_COMMITTER_EMAIL': 'bench@example.com',
+    'GIT_AUTHOR_DATE': '2020-01-01T00:00:00Z',
+    'GIT_COMMITTER_DATE': '2020-01-01T00:00:00Z',
+}
+
+
+class SyntheticRepos:
+    """Generates ``count`` bare repositories under ``root``.
+
+    One template repository is built with ``git`` (a random payload of
+    ``size_kb`` plus ``branches`` extra branches) and copied for every
+    repository, which keeps generating 10k repositories fast. Existing
+    repositories are reused between runs."""
+
+    def __init__(self, root: Path, size_kb: int = 64, branches: int = 1):
+        self.root = root
+        self.size_kb = size_kb
+        self.branches = branches
+
+    @staticmethod
+    def _git(args: List[str], cwd: Path):
+        subprocess.run(['git'] + args, cwd=cwd, check=True, capture_output=True,
+                       env={**os.environ, **GIT_ENV})
+
+    def _template(self) -> Path:
+        template = self.root / f"_template_{self.size_kb}k_{self.branches}b.git"
+        if template.exists():
+            return template
+
+        work = self.root / "_template_work"
+        shutil.rmtree(work, ignore_errors=True)
+        work.mkdir(parents=True)
+        self._git(['init', '-q', '-b', 'main'], work)
+        (work / 'README.md').write_text("# synthetic benchmark repository\n")
+        (work / 'payload.bin').write_bytes(os.urandom(self.size_kb * 1024))
+        self._git(['add', '.'], work)
+        self._git(['commit', '-q', '-m', 'initial'], work)
+        for i in range(1, self.branches):
+            self._git(['branch', f'branch-{i}'], work)
+        self._git(['clone', '-q', '--bare', str(work), str(template)], self.root)
+        shutil.rmtree(work)
+        return template
+
+    def generate(self, count: int, owner: str) -> List[Dict]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        template = self._template()
+        repos = []
+        for i in range(count):
+            name = f"repo-{i:05d}"
+            path = self.root / f"{name}.git"
+            if not path.exists():
+                shutil.copytree(template, path)
+            repos.append({
+                "name": name,
+                "full_name": f"{owner}/{name}",
+                "clone_url": path.as_uri(),
+                "default_branch": "main",
+                "private": False,
+                "pushed_at": PUSHED_AT,
+                "size": self.size_kb
+            })
+        return repos
@@ -4,20 +4,51 @@
 # https://github.com/smartlegionlab/
 # --------------------------------------------------------
 import json
+import logging
+import os
 import signal
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 
+from core.backup.archive_formats import get_archive_format
 from core.backup.archive_manager import ArchiveManager
+from core.backup.archive_manifest import ArchiveManifest
+from core.backup.archive_verifier import ArchiveVerifier
+from core.backup.concurrency import ConcurrencyController
+from core.backup.backup_daemon import BackupDaemon
+from core.backup.dedup_store import DedupStore
+from core.backup.disk_budget import DiskPlanner, parse_size
+from core.backup.maintenance import RepoMaintenance
+from core.backup.restore_manager import RestoreManager
+from core.backup.retention import GFSRetention
+from core.backup.run_journal import RunJournal
+from core.backup.sharding import ShardSelector, parse_shard
+from core.backup.sync_policy import SyncPolicies
+from core.backup.snapshot_manager import SnapshotManager
+from core.backup.sync_queue import SyncQueue
+from core.backup.sync_scheduler import SyncScheduler
 from core.backup.repo_manager import RepoManager
 from core.config.args_manager import ArgumentsManager
 from core.config.settings import Config, ProjectPaths
 from core.github.api_client import GitHubAPIClient
 from core.github.auth_manager import GitHubAuthManager
+from core.github.repo_filter import RepoFilter
+from core.github.token_pool import TokenPool
+from core.github.webhook_server import WebhookServer
 from core.models import BackupStats
+from core.reports.history_db import HistoryDB
+from core.reports.metrics_exporter import MetricsExporter
 from core.reports.report_generator import ReportGenerator
+from core.reports.report_merger import ReportMerger
+from core.utils.events import NullStream, configure_events, log_event
 from core.utils.network import NetworkChecker
 from core.utils.printer import SmartPrinter
+from core.utils.throttle import ThrottlingProxy, parse_rate, set_process_priority
+from core.utils.tracing import NULL_TRACER, Tracer
 
 
 class AppManager:
@@ -28,9 +59,45 @@ class AppManager:
         self.username = None
         self.stats = BackupStats()
         self.original_sigint = None
+        self.tracer = NULL_TRACER
+        self.metrics = None
+        self.daemon = None
+        self.webhook_stopped = None
+        self.repo_managers = []
+        self.journals = []
+        self.policies = None
+        self.proxy = None
+        self.git_env = None
+        self.git_config = None
+        self.stop_event = threading.Event()
 
     def _signal_handler(self, signum, frame):
-        print(f"\n\n⚠️ Received Ctrl+C - exiting immediately")
+        if self.stop_event.is_set() or not (self.repo_managers or self.daemon):
+            print(f"\n\n⚠️ Received Ctrl+C - exiting immediately")
+            log_event('interrupted', logging.WARNING, forced=self.stop_event.is_set())
+            self.tracer.save()
+            self._show_footer()
+            if self.original_sigint:
+                signal.signal(signal.SIGINT, self.original_sigint)
+            sys.exit(1)
+
+        print("\n\n⚠️ Received Ctrl+C - stopping running git commands (press Ctrl+C again to exit immediately)")
+        log_event('interrupted', logging.WARNING)
+        self.stop_event.set()
+        for repo_manager in list(self.repo_managers):
+            repo_manager.stop()
+        if self.daemon:
+            self.daemon.stop()
+        if self.webhook_stopped:
+            self.webhook_stopped.set()
+
+    def _finish_interrupted(self):
+        for repo_manager in list(self.repo_managers):
+            repo_manager.quarantine_in_flight()
+        for journal in list(self.journals):
+            journal.interrupted()
+        if self.journals:
+            print("   Run journal saved - continue with --resume")
         self._show_footer()
         if self.original_sigint:
             signal.signal(signal.SIGINT, self.original_sigint)
@@ -76,20 +143,326 @@ class AppManager:
             print(f"❌ Failed to create app directory: {e}")
             return False
 
+    def _resolve_local_user(self):
+        users = ProjectPaths.get_all_users()
+        if not users:
+            print("\n❌ No local backups found - run with -r first")
+            return None
+        account = self.args_manager.args.account
+        if account and account not in users:
+            print(f"\n❌ No local backups found for account: {account}")
+            return None
+        return account or users[0]
+
+    def _run_store_command(self, args):
+        username = self._resolve_local_user()
+        if not username:
+            return
+
+        store = DedupStore(username)
+
+        if args.store_list:
+            snapshots = store.list_snapshots()
+            print(f"\n🧱 Deduplicated store: {store.store_dir}")
+            if not snapshots:
+                print("   ⚠️ No snapshots found")
+            for snapshot_id in snapshots:
+                print(f"   • {snapshot_id}")
+
+        if args.store_restore:
+            target = Path(args.restore_to) if args.restore_to else \
+                ProjectPaths.get_user_dir(username) / "restored" / args.store_restore
+            store.restore(args.store_restore, target, repo=args.restore_repo)
+
+        if args.store_prune:
+            print("\n🧹 Store Prune")
+            removed = store.prune(args.keep_last)
+            print(f"   Removed {len(removed)} snapshots (keeping last {args.keep_last})")
+            chunks, freed = store.gc()
+            print(f"   ✅ Garbage collected {chunks} chunks ({freed / (1024 * 1024):.2f} MB freed)")
+
+    @staticmethod
+    def _verify_archive(username: str, args, archive: str) -> bool:
+        verifier = ArchiveVerifier(
+            username,
+            workers=args.verify_workers,
+            sample=args.verify_sample,
+            full_every_days=args.verify_full_days
+        )
+        archive_path = verifier.resolve_archive(archive)
+        if not archive_path:
+            print(f"\n❌ Archive not found: {archive}")
+            return False
+        return verifier.verify(archive_path, mode=args.verify_mode)
+
+    def _restore_archive(self, args):
+        username = self._resolve_local_user()
+        if not username:
+            return
+
+        archive_path = ArchiveManifest.resolve_archive(
+            ProjectPaths.get_backups_dir(username), username, args.restore
+        )
+        if not archive_path:
+            print(f"\n❌ Archive not found: {args.restore}")
+            return
+
+        target = Path(args.restore_to) if args.restore_to else \
+            ProjectPaths.get_user_dir(username) / "restored" / archive_path.name.split('.')[0]
+        RestoreManager(username, workers=args.restore_workers).restore(
+            archive_path, target, repo=args.restore_repo
+        )
+
+    @staticmethod
+    def _merge_reports(args):
+        merger = ReportMerger([Path(path) for path in args.merge_reports])
+        merged = merger.merge()
+        if not merged:
+            print("\n❌ No readable reports to merge")
+            return
+        ReportMerger.print_summary(merged)
+        output = Path(args.merge_output) if args.merge_output else \
+            Path(f"fleet_report_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
+        ReportMerger.save(merged, output)
+
+    @staticmethod
+    def _make_controller(args, username):
+        if not args.adaptive_workers:
+            return None
+        return ConcurrencyController.load(username, initial=args.workers, max_workers=args.max_workers)
+
+    def _run_daemon(self, args, repos, shard=None):
+        repo_manager = RepoManager(
+            github_client=self.github_client,
+            timeout=args.timeout,
+            max_retries=5,
+            tracer=self.tracer,
+            workers=args.workers,
+            policies=self.policies,
+            controller=self._make_controller(args, self.username),
+            git_env=self.git_env,
+            git_config=self.git_config,
+            disk_reserve=args.min_free if args.disk_check != 'off' else 0,
+            stop_event=self.stop_event
+        )
+        self.repo_managers.append(repo_manager)
+        scheduler = SyncScheduler(
+            ProjectPaths.get_user_dir(self.username) / "scheduler_state.json",
+            min_interval=args.min_interval,
+            max_interval=args.max_interval
+        )
+        self.daemon = BackupDaemon(
+            self.github_client,
+            repo_manager,
+            scheduler,
+            refresh_interval=args.refresh_interval,
+            all_branches=args.all_branches,
+            metrics=self.metrics,
+            repo_filter=shard.select if shard else None
+        )
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.daemon.stop())
+        self.daemon.run(repos)
+        self.stats = self.daemon.totals
+        self.repo_managers.remove(repo_manager)
+        if self.stop_event.is_set():
+            repo_manager.quarantine_in_flight()
+        self._finish_metrics(args)
+
+    def _finish_metrics(self, args, stats=None, archive_stats=None):
+        if not self.metrics:
+            return
+        if stats is not None:
+            self.metrics.stats = stats
+            self.metrics.archive_stats = archive_stats
+        self.metrics.finish()
+        if args.metrics_file:
+            self.metrics.write_textfile(Path(args.metrics_file))
+        self.metrics.shutdown()
+
+    def _run_webhook(self, args):
+        repo_manager = RepoManager(
+            github_client=self.github_client,
+            timeout=args.timeout,
+            max_retries=5,
+            tracer=self.tracer,
+            workers=args.workers,
+            policies=self.policies,
+            git_env=self.git_env,
+            git_config=self.git_config,
+            disk_reserve=args.min_free if args.disk_check != 'off' else 0,
+            stop_event=self.stop_event
+        )
+        repo_manager.stats.start_time = datetime.now()
+        if self.metrics:
+            self.metrics.stats = repo_manager.stats
+
+        queue = SyncQueue(
+            lambda repo, updated, deleted: repo_manager.sync_refs(repo, updated, deleted, args.all_branches),
+            debounce=args.debounce,
+            workers=args.workers
+        )
+        repo_filter = self.github_client.repo_filter
+
+        def on_event(repo, updated, deleted):
+            if repo_filter and not repo_filter.accepts(repo):
+                log_event('webhook_filtered', logging.DEBUG, repo=repo.full_name, reason=repo_filter.rejection(repo))
+                return
+            queue.add(repo, updated, deleted)
+
+        server = WebhookServer(args.webhook_secret, on_event, host=args.webhook_host, port=args.webhook)
+        if not server.start():
+            return
+
+        self.webhook_stopped = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.webhook_stopped.set())
+        self.repo_managers.append(repo_manager)
+        queue.start()
+        print(f"   Debounce: {args.debounce:.0f}s, workers: {args.workers}")
+        print("   Press Ctrl+C to stop")
+        try:
+            self.webhook_stopped.wait()
+        finally:
+            server.stop()
+            queue.stop(drain=not self.stop_event.is_set(), timeout=max(args.timeout, 60))
+            self.repo_managers.remove(repo_manager)
+            if self.stop_event.is_set():
+                repo_manager.quarantine_in_flight()
+            if self.policies:
+                self.policies.save()
+            repo_manager.stats.end_time = datetime.now()
+            self.stats = repo_manager.stats
+            print(f"\n🛑 Webhook receiver stopped ({len(self.stats.repo_records)} syncs,"
+                  f" {self.stats.failed} failed)")
+
+    @staticmethod
+    def _record_history(username, stats, archive_stats):
+        try:
+            with HistoryDB(username) as history:
+                run_id = history.record_run(stats, archive_stats)
+                run = history.recent_runs(1)[0]
+                print(f"\n📉 Run recorded in history (#{run_id})")
+                if history.is_regression(run):
+                    print(f"   ⚠️ This run took {run['duration']:.1f}s, markedly slower than the"
+                          f" baseline of {history.baseline(run_id):.1f}s")
+        except Exception as e:
+            print(f"\n❌ Failed to record run history: {e}")
+
     def run(self):
         self.original_sigint = signal.getsignal(signal.SIGINT)
         signal.signal(signal.SIGINT, self._signal_handler)
 
+        args = self.args_manager.args
+        console = sys.stdout
+        if args.log_format == 'json':
+            configure_events(console, args.log_level)
+            sys.stdout = NullStream()
+
         self._show_header()
 
         backup_repos = self.args_manager.print_args_info()
-        args = self.args_manager.args
+
+        if args.trace:
+            self.tracer = Tracer(Path(args.trace))
+        log_event('run_start', repos=args.repos,
+                  archive=args.archive and args.archive_format, archive_mode=args.archive_mode,
+                  all_branches=args.all_branches, workers=args.workers)
+        start = time.perf_counter()
+        try:
+            self._run(args, backup_repos)
+        finally:
+            self.tracer.save()
+            if self.proxy:
+                self.proxy.stop()
+            log_event('run_end', user=self.username, duration=round(time.perf_counter() - start, 3),
+                      total=self.stats.total_repos, cloned=self.stats.cloned, updated=self.stats.updated,
+                      synced=self.stats.synced, skipped=self.stats.skipped, failed=self.stats.failed)
+            sys.stdout = console
+
+    def _run(self, args, backup_repos: bool):
+        if args.nice or args.ionice:
+            set_process_priority(args.nice, args.ionice)
+
+        if args.store_list or args.store_restore or args.store_prune:
+            self._run_store_command(args)
+            self._show_footer()
+            return
+
+        if args.restore:
+            self._restore_archive(args)
+            self._show_footer()
+            return
+
+        if args.stats:
+            username = self._resolve_local_user()
+            if username:
+                with HistoryDB(username) as history:
+                    history.show_stats()
+            self._show_footer()
+            return
+
+        if args.merge_reports:
+            self._merge_reports(args)
+            self._show_footer()
+            return
+
+        if args.verify and not args.repos:
+            username = self._resolve_local_user()
+            if username:
+                self._verify_archive(username, args, args.verify)
+            self._show_footer()
+            return
+
+        if args.maintenance and not args.repos:
+            username = self._resolve_local_user()
+            if username:
+                self._run_maintenance(args, username)
+            self._show_footer()
+            return
+
+        webhook_secret = args.webhook_secret or os.environ.get('GITHUB_WEBHOOK_SECRET')
+        if args.webhook and not webhook_secret:
+            print("\n❌ Error: --webhook needs --webhook-secret or GITHUB_WEBHOOK_SECRET")
+            self._show_footer()
+            return
+        args.webhook_secret = webhook_secret
+
+        if args.all_accounts and (args.daemon or args.webhook):
+            print("\n❌ Error: --all-accounts cannot be combined with --daemon or --webhook")
+            self._show_footer()
+            return
+
+        shard = None
+        if args.shard:
+            try:
+                shard = ShardSelector(*parse_shard(args.shard), weighted=args.shard_weighted)
+            except ValueError as e:
+                print(f"\n❌ Error: {e}")
+                self._show_footer()
+                return
+
+        try:
+            repo_filter = RepoFilter.from_args(args)
+            bandwidth = parse_rate(args.bandwidth) if args.bandwidth else None
+            args.min_free = parse_size(args.min_free)
+        except ValueError as e:
+            print(f"\n❌ Error: {e}")
+            self._show_footer()
+            return
 
         if not backup_repos and not args.token:
             print("\n❌ Error: Specify at least one operation (-r for repos or -t for token)")
             self._show_footer()
             return
 
+        archive_format = None
+        if args.archive and backup_repos:
+            try:
+                archive_format = get_archive_format(args.archive_format, args.compression_level)
+            except ValueError as e:
+                print(f"\n❌ Error: {e}")
+                self._show_footer()
+                return
+
         if not self._setup_app_directory():
             self._show_footer()
             return
@@ -97,9 +470,10 @@ class AppManager:
         if args.token:
             print("\n🔑 Token Update")
             users = ProjectPaths.get_all_users()
-            if users:
-                Config.delete_token(users[0])
-                print(f"✅ Old token deleted for user: {users[0]}")
+            target = args.account or (users[0] if users else None)
+            if target in users:
+                Config.delete_token(target)
+                print(f"✅ Old token deleted for user: {target}")
 
                 print("\n🔐 GitHub Authentication")
                 token = GitHubAuthManager.get_token_from_user()
@@ -138,20 +512,64 @@ class AppManager:
             self._show_footer()
             return
 
+        if bandwidth:
+            self.proxy = ThrottlingProxy(bandwidth)
+            if not self.proxy.start():
+                self.proxy = None
+                self._show_footer()
+                return
+            self.git_env = {key: value for key, value in os.environ.items()
+                            if key.lower() not in ('no_proxy', 'https_proxy', 'http_proxy', 'all_proxy')}
+            self.git_config = [f"http.proxy={self.proxy.url}"]
+
+        if args.metrics_file or args.metrics_port:
+            self.metrics = MetricsExporter(args.account or '')
+            if args.metrics_port:
+                self.metrics.serve(args.metrics_port)
+
+        if args.all_accounts:
+            self._run_all_accounts(args, shard, repo_filter)
+            self._finish_metrics(args)
+            self._show_footer()
+            return
+
         self.github_client = GitHubAuthManager.authenticate(
             token=None,
-            timeout=args.timeout
+            timeout=args.timeout,
+            username=args.account
         )
 
         if not self.github_client:
             print("\n❌ Authentication failed")
+            log_event('auth_failed', logging.ERROR)
             self._show_footer()
             return
 
         self.username = self.github_client.login
+        self.github_client.tracer = self.tracer
+        self.github_client.repo_filter = repo_filter
+        try:
+            self.policies = SyncPolicies.load(self.username)
+        except ValueError as e:
+            print(f"\n❌ Error: {e}")
+            self._show_footer()
+            return
+        unfinished = RunJournal(self.username).recover()
+
+        if self.metrics:
+            self.metrics.username = self.username
+            self.metrics.github_client = self.github_client
+
+        if args.webhook:
+            self._run_webhook(args)
+            self._show_footer()
+            return
 
         print("\n🔍 Scanning repositories...")
+        inventory_start = time.perf_counter()
         repos = self.github_client.get_all_repos()
+        log_event('inventory', user=self.username, repos=len(repos),
+                  duration=round(time.perf_counter() - inventory_start, 3))
 
         if not repos:
             print("\n⚠️ No repositories found")
@@ -160,37 +578,350 @@ class AppManager:
 
         print(f"\n✅ Found {len(repos)} repositories total")
 
+        if shard:
+            total = len(repos)
+            repos = shard.select(repos)
+            print(f"🧩 Shard {shard}: {len(repos)} of {total} repositories"
+                  f" ({sum(repo.size for repo in repos) / 1024:.1f} MB)")
+            log_event('shard', shard=str(shard), weighted=shard.weighted, repos=len(repos), total=total)
+
         self.save_user_info()
+        if self.proxy:
+            self.proxy.allow_clone_urls(repo.clone_url for repo in repos)
+
+        if args.daemon:
+            self._run_daemon(args, repos, shard)
+            self._show_footer()
+            return
 
+        archive_manager = None
+        archive_stats = None
+        disk_plan = None
         if backup_repos:
+            with HistoryDB(self.username) as history:
+                predictions = history.predict_durations()
+
+            if args.resume and unfinished:
+                repos = [repo for repo in repos if repo.full_name not in unfinished.completed]
+                print(f"\n⏯️  Resuming run {unfinished.run_id}: {len(unfinished.completed)} repositories"
+                      f" already done, {len(repos)} remaining")
+            elif args.resume:
+                print("\n⏯️  No interrupted run to resume - starting a new run")
+
+            disk_plan = self._plan_disk(args, self.username, repos, archive_format)
+            if disk_plan:
+                if not disk_plan.fits:
+                    print("\n❌ Error: Not enough disk space - free some space, lower --min-free"
+                          " or use --disk-check fit")
+                    self._show_footer()
+                    return
+                repos = disk_plan.repos
+
+            if args.archive and args.archive_mode in ('full', 'diff'):
+                archive_manager = ArchiveManager(
+                    username=self.username,
+                    archive_format=archive_format,
+                    mode=args.archive_mode,
+                    full_every=args.full_every
+                )
+                if not archive_manager.start_pipeline():
+                    archive_manager = None
+
+            journal = RunJournal(self.username)
+            journal.start(len(repos), resume_from=unfinished if args.resume else None)
+            self.journals.append(journal)
+
             repo_manager = RepoManager(
                 github_client=self.github_client,
                 timeout=args.timeout,
-                max_retries=5
+                max_retries=5,
+                tracer=self.tracer,
+                workers=args.workers,
+                predictions=predictions,
+                journal=journal,
+                policies=self.policies,
+                controller=self._make_controller(args, self.username),
+                git_env=self.git_env,
+                git_config=self.git_config,
+                disk_reserve=args.min_free if args.disk_check != 'off' else 0,
+                stop_event=self.stop_event
             )
-
-            self.stats = repo_manager.process_repositories(repos, all_branches=args.all_branches)
+            self.repo_managers.append(repo_manager)
+            if self.metrics:
+                self.metrics.stats = repo_manager.stats
+
+            self.stats = repo_manager.process_repositories(
+                repos,
+                all_branches=args.all_branches,
+                on_repo_done=(lambda repo: archive_manager.submit_repo(repo.name)) if archive_manager else None
+            )
+            if self.stop_event.is_set():
+                if archive_manager:
+                    archive_manager.abort_pipeline()
+                self._finish_interrupted()
+            journal.finish()
+            self.journals.remove(journal)
+            self.repo_managers.remove(repo_manager)
+
+        if archive_manager and archive_manager.finish_pipeline():
+            archive_stats = archive_manager.stats
+            log_event('archive', **archive_stats.to_dict())
+            if args.verify:
+                self._verify_archive(self.username, args, archive_stats.path)
+        elif args.archive and backup_repos and args.archive_mode in ('store', 'snapshot'):
+            self._create_snapshot(args, self.username, archive_format)
+
+        if args.maintenance and backup_repos:
+            self._run_maintenance(args, self.username)
 
         report_gen = ReportGenerator(
             github_client=self.github_client,
-            stats=self.stats
+            stats=self.stats,
+            archive_stats=archive_stats,
+            shard=str(shard) if shard else None,
+            disk=disk_plan.to_dict() if disk_plan else None
         )
         report_data = report_gen.generate()
         report_gen.save(report_data)
 
-        if args.archive and backup_repos:
-            archive_manager = ArchiveManager(
-                username=self.username
-            )
-            archive_manager.create_archive()
+        if backup_repos:
+            self._record_history(self.username, self.stats, archive_stats)
+
+        self._finish_metrics(args, self.stats, archive_stats)
 
         self._show_footer()
 
-    def save_user_info(self):
-        print("\n📄 Saving user information...")
+    @staticmethod
+    def _create_snapshot(args, username, archive_format):
+        if args.archive_mode == 'store':
+            DedupStore(username, level=archive_format.level).create_snapshot()
+        else:
+            retention = GFSRetention(
+                daily=args.keep_daily,
+                weekly=args.keep_weekly,
+                monthly=args.keep_monthly,
+                yearly=args.keep_yearly
+            )
+            SnapshotManager(username, retention=retention).create_snapshot()
+
+    @staticmethod
+    def _archive_kind(args, username, archive_format):
+        if not args.archive:
+            return None
+        if args.archive_mode == 'store':
+            return 'incremental' if DedupStore(username).list_snapshots() else 'full'
+        if args.archive_mode == 'snapshot':
+            return 'incremental' if SnapshotManager(username).list_snapshots() else 'full'
+        archive_manager = ArchiveManager(username, archive_format=archive_format, mode=args.archive_mode,
+                                         full_every=args.full_every)
+        return 'incremental' if archive_manager.next_kind() == 'diff' else 'full'
+
+    def _plan_disk(self, args, username, repos, archive_format, committed=0):
+        if args.disk_check == 'off':
+            return None
+        planner = DiskPlanner(username, reserve=args.min_free, mode=args.disk_check, workers=args.workers)
+        return planner.plan(repos, archive_kind=self._archive_kind(args, username, archive_format),
+                            committed=committed)
+
+    def _run_maintenance(self, args, username):
+        RepoMaintenance(
+            username,
+            workers=args.workers,
+            time_budget=args.maintenance_budget,
+            loose_threshold=args.maintenance_loose,
+            pack_threshold=args.maintenance_packs,
+            max_age_days=args.maintenance_days,
+            tracer=self.tracer,
+            git_env=self.git_env
+        ).run()
+
+    def _backup_account(self, args, client, repos, unfinished, slots, policies, disk_plan):
+        username = client.login
+        with HistoryDB(username) as history:
+            predictions = history.predict_durations()
+
+        if (disk_plan and not disk_plan.fits) or self.stop_event.is_set():
+            return BackupStats(), None, disk_plan
+
+        journal = RunJournal(username)
+        journal.start(len(repos), resume_from=unfinished if args.resume else None)
+        self.journals.append(journal)
+        repo_manager = None
+        archive_manager = None
+        archive_format = get_archive_format(args.archive_format, args.compression_level) if args.archive else None
+        try:
+            repo_manager = RepoManager(
+                github_client=client,
+                timeout=args.timeout,
+                max_retries=5,
+                tracer=self.tracer,
+                workers=args.workers,
+                predictions=predictions,
+                journal=journal,
+                slots=slots,
+                shared_output=True,
+                policies=policies,
+                controller=self._make_controller(args, username),
+                git_env=self.git_env,
+                git_config=self.git_config,
+                disk_reserve=args.min_free if args.disk_check != 'off' else 0,
+                stop_event=self.stop_event
+            )
+            self.repo_managers.append(repo_manager)
+
+            if args.archive and args.archive_mode in ('full', 'diff'):
+                archive_manager = ArchiveManager(
+                    username=username,
+                    archive_format=archive_format,
+                    mode=args.archive_mode,
+                    full_every=args.full_every
+                )
+                if not archive_manager.start_pipeline():
+                    archive_manager = None
+
+            stats = repo_manager.process_repositories(
+                repos,
+                all_branches=args.all_branches,
+                on_repo_done=(lambda repo: archive_manager.submit_repo(repo.name)) if archive_manager else None
+            )
+        except Exception:
+            if archive_manager:
+                archive_manager.abort_pipeline()
+            if repo_manager:
+                self.repo_managers.remove(repo_manager)
+                repo_manager.quarantine_in_flight()
+            self.journals.remove(journal)
+            journal.interrupted()
+            raise
+        if self.stop_event.is_set():
+            if archive_manager:
+                archive_manager.abort_pipeline()
+            return stats, None, disk_plan
+        journal.finish()
+        self.journals.remove(journal)
+        self.repo_managers.remove(repo_manager)
+
+        archive_stats = None
+        if archive_manager and archive_manager.finish_pipeline():
+            archive_stats = archive_manager.stats
+            log_event('archive', user=username, **archive_stats.to_dict())
+            if args.verify:
+                self._verify_archive(username, args, archive_stats.path)
+        elif args.archive and args.archive_mode in ('store', 'snapshot'):
+            self._create_snapshot(args, username, archive_format)
+        if args.maintenance:
+            self._run_maintenance(args, username)
+        return stats, archive_stats, disk_plan
+
+    def _run_all_accounts(self, args, shard, repo_filter):
+        pool = TokenPool.authenticate_all(timeout=args.timeout, tracer=self.tracer)
+        if not pool.clients:
+            print("\n❌ No valid accounts configured - add one with -t --account LOGIN")
+            log_event('auth_failed', logging.ERROR)
+            return
+
+        pool.set_filter(repo_filter)
+        inventory_start = time.perf_counter()
+        inventory = pool.get_all_repos()
+        if self.proxy:
+            self.proxy.allow_clone_urls(repo.clone_url for repos in inventory.values() for repo in repos)
+        log_event('inventory', users=[client.login for client in pool.clients],
+                  repos=sum(len(repos) for repos in inventory.values()),
+                  duration=round(time.perf_counter() - inventory_start, 3))
+
+        unfinished = {}
+        policies = {}
+        disk_plans = {}
+        committed = 0
+        archive_format = get_archive_format(args.archive_format, args.compression_level) if args.archive else None
+        for client in pool.clients:
+            username = client.login
+            try:
+                policies[username] = SyncPolicies.load(username)
+            except ValueError as e:
+                print(f"\n❌ Error: {e}")
+                return
+            if shard:
+                inventory[username] = shard.select(inventory[username])
+            unfinished[username] = RunJournal(username).recover()
+            if args.resume and unfinished[username]:
+                inventory[username] = [repo for repo in inventory[username]
+                                       if repo.full_name not in unfinished[username].completed]
+            self.save_user_info(client)
+            disk_plans[username] = self._plan_disk(args, username, inventory[username], archive_format, committed)
+            if disk_plans[username]:
+                if not disk_plans[username].fits:
+                    print(f"   ❌ {username}: Not enough disk space - account skipped")
+                    continue
+                inventory[username] = disk_plans[username].repos
+                committed += disk_plans[username].required - args.min_free
+
+        total_workers = args.max_workers if args.adaptive_workers else args.workers
+        slots = threading.BoundedSemaphore(total_workers)
+        print(f"\n👥 Backing up {len(pool.clients)} accounts, {total_workers} repositories at a time in total")
+        for client in pool.clients:
+            disk_plan = disk_plans[client.login]
+            print(f"   • {client.login}: " + ("skipped (disk space)" if disk_plan and not disk_plan.fits
+                                             else f"{len(inventory[client.login])} repositories"))
+
+        self.stats = BackupStats(start_time=datetime.now())
+        if self.metrics:
+            self.metrics.username = ','.join(client.login for client in pool.clients)
+            self.metrics.stats = self.stats
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(pool.clients), thread_name_prefix="account") as executor:
+            futures = {executor.submit(self._backup_account, args, client, inventory[client.login],
+                                       unfinished[client.login], slots, policies[client.login],
+                                       disk_plans[client.login]): client
+                       for client in pool.clients}
+            for future in as_completed(futures):
+                if self.stop_event.is_set():
+                    break
+                username = futures[future].login
+                try:
+                    results[username] = future.result()
+                except Exception as e:
+                    print(f"\n❌ {username}: Backup failed: {type(e).__name__}: {e}")
+                    log_event('account_failed', logging.ERROR, user=username, error=f"{type(e).__name__}: {e}")
+                    continue
+                self._add_account_stats(results[username][0])
+            executor.shutdown(wait=True, cancel_futures=True)
+        if self.stop_event.is_set():
+            self._finish_interrupted()
+        self.stats.end_time = datetime.now()
+
+        failed_accounts = [client.login for client in pool.clients if client.login not in results]
+        for client in pool.clients:
+            if client.login in failed_accounts:
+                continue
+            stats, archive_stats, disk_plan = results[client.login]
+            report_gen = ReportGenerator(
+                github_client=client,
+                stats=stats,
+                archive_stats=archive_stats,
+                shard=str(shard) if shard else None,
+                disk=disk_plan.to_dict() if disk_plan else None
+            )
+            report_gen.save(report_gen.generate())
+            self._record_history(client.login, stats, archive_stats)
+
+        print(f"\n👥 All accounts: {self.stats.total_repos} repositories, {self.stats.failed} failed")
+        if failed_accounts:
+            print(f"   ❌ Accounts that did not finish: {', '.join(failed_accounts)}")
+
+    def _add_account_stats(self, stats):
+        for counter in ('total_repos', 'cloned', 'updated', 'synced', 'skipped', 'failed', 'total_branches'):
+            setattr(self.stats, counter, getattr(self.stats, counter) + getattr(stats, counter))
+        self.stats.failed_repos.extend(stats.failed_repos)
+        self.stats.repo_records.extend(stats.repo_records)
+
+    def save_user_info(self, client=None):
+        client = client or self.github_client
+        print(f"\n📄 Saving user information for {client.login}...")
 
-        url = f"https://api.github.com/user"
-        user_data = self.github_client._make_request(url)
+        url = f"{client.base_url}/user"
+        user_data = client._make_request(url)
 
         if user_data:
             user_info = {
@@ -207,7 +938,7 @@ class AppManager:
                 "last_backup": datetime.now().isoformat()
             }
 
-            user_info_path = ProjectPaths.get_user_dir(self.username) / "user_info.json"
+            user_info_path = ProjectPaths.get_user_dir(client.login) / "user_info.json"
             with open(user_info_path, 'w', encoding='utf-8') as f:
                 json.dump(user_info, f, indent=2)
 
@@ -0,0 +1,287 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import abc
+import hashlib
+import io
+import lzma
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Optional, Type
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+INCOMPRESSIBLE_EXTENSIONS = {
+    '.pack', '.idx', '.rev', '.bitmap',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.txz', '.zst', '.7z', '.rar', '.lz4', '.br',
+    '.jar', '.war', '.whl', '.egg', '.apk', '.aab', '.ipa', '.nupkg', '.deb', '.rpm',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.heic', '.ico',
+    '.mp3', '.mp4', '.m4a', '.m4v', '.mkv', '.mov', '.avi', '.webm', '.ogg', '.opus', '.flac',
+    '.woff', '.woff2', '.pdf', '.docx', '.xlsx', '.pptx', '.odt', '.ods', '.epub',
+}
+
+
+class CompressionClassifier:
+
+    def __init__(self, extensions: Optional[set] = None):
+        self.extensions = extensions if extensions is not None else INCOMPRESSIBLE_EXTENSIONS
+
+    def should_compress(self, arc_name: str) -> bool:
+        if '/.git/objects/' in arc_name or arc_name.startswith('.git/objects/'):
+            return False
+        return Path(arc_name).suffix.lower() not in self.extensions
+
+
+class ArchiveWriter(abc.ABC):
+
+    def __init__(self):
+        self.bytes_in = 0
+        self.files = 0
+        self.stored_files = 0
+        self.stored_bytes = 0
+
+    @abc.abstractmethod
+    def add_file(self, file_path: Path, arc_name: str, compress: bool = True) -> str:
+        pass
+
+    @abc.abstractmethod
+    def add_bytes(self, arc_name: str, data: bytes, compress: bool = True):
+        pass
+
+    @abc.abstractmethod
+    def close(self):
+        pass
+
+    def _count(self, size: int, compress: bool):
+        self.files += 1
+        self.bytes_in += size
+        if not compress:
+            self.stored_files += 1
+            self.stored_bytes += size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ZipArchiveWriter(ArchiveWriter):
+
+    def __init__(self, path: Path, level: int):
+        super().__init__()
+        self.level = level
+        self._zip = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=level, allowZip64=True)
+
+    def _member_info(self, zinfo: zipfile.ZipInfo, compress: bool) -> zipfile.ZipInfo:
+        if compress:
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            if hasattr(zinfo, 'compress_level'):
+                zinfo.compress_level = self.level
+            else:
+                zinfo._compresslevel = self.level
+        else:
+            zinfo.compress_type = zipfile.ZIP_STORED
+        return zinfo
+
+    def add_file(self, file_path: Path, arc_name: str, compress: bool = True) -> str:
+        zinfo = self._member_info(zipfile.ZipInfo.from_file(file_path, arc_name), compress)
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as src, self._zip.open(zinfo, 'w', force_zip64=True) as dst:
+            while True:
+                chunk = src.read(COPY_BUFFER_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                dst.write(chunk)
+        self._count(zinfo.file_size, compress)
+        return digest.hexdigest()
+
+    def add_bytes(self, arc_name: str, data: bytes, compress: bool = True):
+        zinfo = self._member_info(zipfile.ZipInfo(arc_name), compress)
+        self._zip.writestr(zinfo, data)
+        self._count(len(data), compress)
+
+    def close(self):
+        self._zip.close()
+
+
+class _SegmentedCompressedStream:
+    """Write-only stream that compresses each run of members as its own
+    xz stream / zstd frame, so incompressible runs can use a cheaper level.
+    Concatenated streams and frames are read back transparently."""
+
+    def __init__(self, path: Path, compressor_factory, level: int, store_level: int):
+        self._file = open(path, 'wb')
+        self._factory = compressor_factory
+        self._level = level
+        self._store_level = store_level
+        self._compress = None
+        self._compressor = None
+        self._position = 0
+
+    def set_compress(self, compress: bool):
+        if self._compressor is not None and compress == self._compress:
+            return
+        self._end_segment()
+        self._compress = compress
+        self._compressor = self._factory(self._level if compress else self._store_level)
+
+    def _end_segment(self):
+        if self._compressor is not None:
+            self._file.write(self._compressor.flush())
+            self._compressor = None
+
+    def write(self, data) -> int:
+        if self._compressor is None:
+            self.set_compress(True)
+        self._file.write(self._compressor.compress(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self):
+        self._end_segment()
+        self._file.close()
+
+
+class _HashingReader:
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+
+class TarArchiveWriter(ArchiveWriter):
+
+    def __init__(self, path: Path, compressor_factory, level: int, store_level: int):
+        super().__init__()
+        self._stream = _SegmentedCompressedStream(path, compressor_factory, level, store_level)
+        self._tar = tarfile.TarFile(fileobj=self._stream, mode='w', format=tarfile.PAX_FORMAT)
+
+    def add_file(self, file_path: Path, arc_name: str, compress: bool = True) -> str:
+        tarinfo = self._tar.gettarinfo(str(file_path), arc_name)
+        self._stream.set_compress(compress)
+        if not tarinfo.isreg():
+            self._tar.addfile(tarinfo)
+            return hashlib.sha256().hexdigest()
+        with open(file_path, 'rb') as src:
+            reader = _HashingReader(src)
+            self._tar.addfile(tarinfo, reader)
+        self._count(tarinfo.size, compress)
+        return reader.digest.hexdigest()
+
+    def add_bytes(self, arc_name: str, data: bytes, compress: bool = True):
+        tarinfo = tarfile.TarInfo(arc_name)
+        tarinfo.size = len(data)
+        tarinfo.mtime = int(time.time())
+        self._stream.set_compress(compress)
+        self._tar.addfile(tarinfo, io.BytesIO(data))
+        self._count(len(data), compress)
+
+    def close(self):
+        self._tar.close()
+        self._stream.close()
+
+
+class ArchiveFormat(abc.ABC):
+    name = ''
+    extension = ''
+    default_level = 0
+    min_level = 0
+    max_level = 9
+
+    def __init__(self, level: Optional[int] = None):
+        self.level = self.default_level if level is None else level
+        if not self.min_level <= self.level <= self.max_level:
+            raise ValueError(
+                f"Compression level for {self.name} must be between {self.min_level} and {self.max_level}"
+            )
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def open(self, path: Path) -> ArchiveWriter:
+        pass
+
+
+class ZipFormat(ArchiveFormat):
+    name = 'zip'
+    extension = '.zip'
+    default_level = 6
+    min_level = 0
+    max_level = 9
+
+    def open(self, path: Path) -> ArchiveWriter:
+        return ZipArchiveWriter(path, self.level)
+
+
+class TarXzFormat(ArchiveFormat):
+    name = 'tar.xz'
+    extension = '.tar.xz'
+    default_level = 6
+    min_level = 0
+    max_level = 9
+
+    def open(self, path: Path) -> ArchiveWriter:
+        return TarArchiveWriter(
+            path,
+            lambda level: lzma.LZMACompressor(format=lzma.FORMAT_XZ, preset=level),
+            level=self.level,
+            store_level=0
+        )
+
+
+class TarZstFormat(ArchiveFormat):
+    name = 'tar.zst'
+    extension = '.tar.zst'
+    default_level = 3
+    min_level = 1
+    max_level = 22
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return zstd is not None
+
+    def open(self, path: Path) -> ArchiveWriter:
+        return TarArchiveWriter(
+            path,
+            lambda level: zstd.ZstdCompressor(level=level),
+            level=self.level,
+            store_level=1
+        )
+
+
+ARCHIVE_FORMATS: Dict[str, Type[ArchiveFormat]] = {
+    ZipFormat.name: ZipFormat,
+    TarXzFormat.name: TarXzFormat,
+    TarZstFormat.name: TarZstFormat,
+}
+
+
+def get_archive_format(name: str, level: Optional[int] = None) -> ArchiveFormat:
+    format_cls = ARCHIVE_FORMATS.get(name)
+    if format_cls is None:
+        raise ValueError(f"Unknown archive format: {name}")
+    if not format_cls.is_available():
+        raise ValueError(f"Archive format {name} is not available in this Python build")
+    return format_cls(level)
@@ -3,21 +3,73 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 # https://github.com/smartlegionlab/
 # --------------------------------------------------------
+import json
 import os
-import zipfile
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from core.backup.archive_formats import ArchiveFormat, CompressionClassifier, ZipFormat
+from core.backup.archive_manifest import ArchiveManifest, hash_file
 from core.config.settings import ProjectPaths
+from core.models import ArchiveStats
+
+DELETED_MEMBER = 'deleted.json'
 
 
 class ArchiveManager:
 
-    def __init__(self, username: str):
+    def __init__(self, username: str, archive_format: Optional[ArchiveFormat] = None,
+                 classifier: Optional[CompressionClassifier] = None,
+                 mode: str = 'full', full_every: int = 7):
         self.username = username
         self.user_dir = ProjectPaths.get_user_dir(username)
         self.repos_dir = ProjectPaths.get_repos_dir(username)
+        self.backups_dir = ProjectPaths.get_backups_dir(username)
+        self.archive_format = archive_format or ZipFormat()
+        self.classifier = classifier or CompressionClassifier()
+        self.mode = mode
+        self.full_every = max(1, full_every)
+        self.stats = ArchiveStats(format=self.archive_format.name, level=self.archive_format.level)
+        self._base = None
+        self._previous = {}
+        self._manifest = None
+        self._writer = None
+        self._archive_path = None
+        self._started = 0.0
+        self._error = None
+        self._queue = None
+        self._submitted = set()
+        self._worker = None
+
+    def _select_base(self, verbose: bool = True) -> Optional[ArchiveManifest]:
+        if self.mode != 'diff':
+            return None
+
+        base = ArchiveManifest.find_latest(self.backups_dir, self.username)
+        if not base:
+            if verbose:
+                print("   ℹ️  No previous manifest found - creating full archive")
+            return None
+
+        if base.archive_format != self.archive_format.name:
+            if verbose:
+                print(f"   ℹ️  Previous archive is {base.archive_format} - creating full archive")
+            return None
+
+        chain = ArchiveManifest.chain_length(self.backups_dir, self.username)
+        if chain >= self.full_every:
+            if verbose:
+                print(f"   ℹ️  {chain} archives since last full - creating full archive")
+            return None
+
+        return base
+
+    def next_kind(self) -> str:
+        return 'diff' if self._select_base(verbose=False) else 'full'
 
     def create_archive(self) -> Optional[Path]:
         print("\n📦 Archive Creation")
@@ -27,31 +79,190 @@ class ArchiveManager:
             return None
 
         try:
-            backups_dir = ProjectPaths.get_backups_dir(self.username)
-            backups_dir.mkdir(exist_ok=True)
+            self._begin()
+            self._archive_tree(self.repos_dir)
+            return self._finish()
 
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            archive_name = f"{self.username}_github_backup_{timestamp}"
-            archive_path = backups_dir / f"{archive_name}.zip"
+        except Exception as e:
+            self._abort()
+            print(f"   ❌ Archive creation failed: {e}")
+            return None
+
+    def start_pipeline(self) -> bool:
+        print("\n📦 Archive Creation (pipelined with repository sync)")
+
+        try:
+            self.repos_dir.mkdir(exist_ok=True, parents=True)
+            self._begin()
+        except Exception as e:
+            self._abort()
+            print(f"   ❌ Archive creation failed: {e}")
+            return False
 
-            print(f"   Creating archive: {archive_name}.zip")
-            print(f"   From: {self.repos_dir}")
-            print(f"   To: {archive_path}")
+        self._queue = queue.Queue()
+        self._submitted = set()
+        self._worker = threading.Thread(target=self._pipeline_worker, name="archive-worker", daemon=True)
+        self._worker.start()
+        return True
 
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, _, files in os.walk(self.repos_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arc_name = f"repositories/{file_path.relative_to(self.repos_dir)}"
-                        zipf.write(file_path, arc_name)
+    def submit_repo(self, repo_name: str):
+        if self._queue is None or repo_name in self._submitted:
+            return
+        self._submitted.add(repo_name)
+        self._queue.put(repo_name)
+
+    def finish_pipeline(self) -> Optional[Path]:
+        if self._queue is None:
+            return None
 
-            size_mb = archive_path.stat().st_size / (1024 * 1024)
-            print(f"   ✅ Archive created successfully!")
-            print(f"   📊 Size: {size_mb:.2f} MB")
-            print(f"   📁 Location: {archive_path}")
+        for entry in sorted(os.listdir(self.repos_dir)):
+            self.submit_repo(entry)
+        self._queue.put(None)
+        self._worker.join()
+        self._queue = None
 
-            return archive_path
+        if self._error:
+            self._abort()
+            print(f"\n📦 Archive Creation")
+            print(f"   ❌ Archive creation failed: {self._error}")
+            return None
 
+        print(f"\n📦 Archive Creation")
+        try:
+            return self._finish()
         except Exception as e:
+            self._abort()
             print(f"   ❌ Archive creation failed: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def abort_pipeline(self):
+        if self._queue is None:
+            return
+        self._error = self._error or RuntimeError("run interrupted")
+        self._queue.put(None)
+        self._worker.join()
+        self._queue = None
+        self._abort()
+        print("   🗑️  Unfinished archive removed")
+
+    def _pipeline_worker(self):
+        while True:
+            repo_name = self._queue.get()
+            if repo_name is None:
+                return
+            if self._error:
+                continue
+            try:
+                path = self.repos_dir / repo_name
+                if path.is_dir():
+                    self._archive_tree(path)
+                elif path.exists():
+                    self._archive_file(path)
+            except Exception as e:
+                self._error = e
+
+    def _begin(self):
+        self.backups_dir.mkdir(exist_ok=True)
+
+        self._base = self._select_base()
+        kind = 'diff' if self._base else 'full'
+
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        suffix = '_diff' if self._base else ''
+        archive_name = f"{self.username}_github_backup_{timestamp}{suffix}{self.archive_format.extension}"
+        self._archive_path = self.backups_dir / archive_name
+
+        print(f"   Creating archive: {archive_name}")
+        print(f"   Format: {self.archive_format.name} (level {self.archive_format.level})")
+        if self._base:
+            print(f"   Mode: differential against {self._base.archive}")
+        print(f"   From: {self.repos_dir}")
+        print(f"   To: {self._archive_path}")
+
+        self._manifest = ArchiveManifest(
+            archive=archive_name,
+            kind=kind,
+            base=self._base.archive if self._base else None,
+            archive_format=self.archive_format.name
+        )
+        self._previous = self._base.files if self._base else {}
+        self._error = None
+        self._started = time.perf_counter()
+        self._writer = self.archive_format.open(self._archive_path)
+        self.stats.kind = kind
+
+    def _archive_tree(self, path: Path):
+        cpu_start = time.thread_time()
+        for root, _, files in os.walk(path):
+            for file in files:
+                self._add(Path(root) / file)
+        self.stats.cpu_seconds += time.thread_time() - cpu_start
+
+    def _archive_file(self, file_path: Path):
+        cpu_start = time.thread_time()
+        self._add(file_path)
+        self.stats.cpu_seconds += time.thread_time() - cpu_start
+
+    def _add(self, file_path: Path):
+        rel_path = file_path.relative_to(self.repos_dir).as_posix()
+        st = file_path.stat()
+        arc_name = f"repositories/{rel_path}"
+        old = self._previous.get(rel_path)
+
+        if old and old['size'] == st.st_size:
+            if old['mtime_ns'] == st.st_mtime_ns:
+                self._manifest.add_entry(rel_path, st.st_size, st.st_mtime_ns, old['sha256'], False)
+                return
+            sha256 = hash_file(file_path)
+            if sha256 == old['sha256']:
+                self._manifest.add_entry(rel_path, st.st_size, st.st_mtime_ns, sha256, False)
+                return
+
+        sha256 = self._writer.add_file(file_path, arc_name, self.classifier.should_compress(arc_name))
+        self._manifest.add_entry(rel_path, st.st_size, st.st_mtime_ns, sha256, True)
+
+    def _finish(self) -> Path:
+        manifest = self._manifest
+        writer = self._writer
+        archive_path = self._archive_path
+
+        cpu_start = time.thread_time()
+        if self._base:
+            manifest.deleted = sorted(set(self._previous) - set(manifest.files))
+            writer.add_bytes(DELETED_MEMBER, json.dumps(manifest.deleted, indent=2).encode('utf-8'))
+        writer.close()
+        self._writer = None
+        manifest.save(ArchiveManifest.path_for(archive_path))
+        self.stats.cpu_seconds += time.thread_time() - cpu_start
+
+        self.stats.wall_seconds = time.perf_counter() - self._started
+        self.stats.path = str(archive_path)
+        self.stats.files = writer.files
+        self.stats.stored_files = writer.stored_files
+        self.stats.bytes_in = writer.bytes_in
+        self.stats.stored_bytes = writer.stored_bytes
+        self.stats.bytes_out = archive_path.stat().st_size
+        self.stats.deleted_files = len(manifest.deleted)
+
+        size_mb = self.stats.bytes_out / (1024 * 1024)
+        print(f"   ✅ Archive created successfully!")
+        if self._base:
+            print(f"   🔄 Changed: {len(manifest.members)} of {len(manifest.files)} files, "
+                  f"deleted: {len(manifest.deleted)}")
+        print(f"   📊 Size: {size_mb:.2f} MB "
+              f"({self.stats.ratio * 100:.1f}% of {self.stats.bytes_in / (1024 * 1024):.2f} MB)")
+        print(f"   🗜️  Stored without recompression: {self.stats.stored_files} of {self.stats.files} files")
+        print(f"   ⏱️  CPU: {self.stats.cpu_seconds:.2f}s, wall: {self.stats.wall_seconds:.2f}s")
+        print(f"   📁 Location: {archive_path}")
+
+        return archive_path
+
+    def _abort(self):
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            self._writer = None
+        if self._archive_path is not None and self._archive_path.exists():
+            self._archive_path.unlink()
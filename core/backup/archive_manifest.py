@@ -0,0 +1,133 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+MANIFEST_SUFFIX = '.manifest.json'
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_BUFFER_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArchiveManifest:
+    """Sidecar index stored next to an archive as ``<archive>.manifest.json``.
+
+    ``files`` describes the whole repositories tree at archive time
+    (path -> size, mtime_ns, sha256), ``members`` lists the paths actually
+    written into this archive and ``deleted`` the paths removed since ``base``.
+    """
+
+    def __init__(self, archive: str, kind: str = 'full', base: Optional[str] = None,
+                 archive_format: str = 'zip', created_at: Optional[str] = None):
+        self.archive = archive
+        self.kind = kind
+        self.base = base
+        self.archive_format = archive_format
+        self.created_at = created_at or datetime.now().isoformat()
+        self.files: Dict[str, dict] = {}
+        self.members: List[str] = []
+        self.deleted: List[str] = []
+
+    @staticmethod
+    def path_for(archive_path: Path) -> Path:
+        return archive_path.with_name(archive_path.name + MANIFEST_SUFFIX)
+
+    @staticmethod
+    def archive_for(manifest_path: Path) -> Path:
+        return manifest_path.with_name(manifest_path.name[:-len(MANIFEST_SUFFIX)])
+
+    def add_entry(self, rel_path: str, size: int, mtime_ns: int, sha256: str, archived: bool):
+        self.files[rel_path] = {"size": size, "mtime_ns": mtime_ns, "sha256": sha256}
+        if archived:
+            self.members.append(rel_path)
+
+    def to_dict(self) -> dict:
+        return {
+            "archive": self.archive,
+            "kind": self.kind,
+            "base": self.base,
+            "format": self.archive_format,
+            "created_at": self.created_at,
+            "members": self.members,
+            "deleted": self.deleted,
+            "files": self.files
+        }
+
+    def save(self, manifest_path: Path):
+        tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        tmp_path.replace(manifest_path)
+
+    @classmethod
+    def load(cls, manifest_path: Path) -> Optional['ArchiveManifest']:
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        manifest = cls(
+            archive=data.get('archive', cls.archive_for(manifest_path).name),
+            kind=data.get('kind', 'full'),
+            base=data.get('base'),
+            archive_format=data.get('format', 'zip'),
+            created_at=data.get('created_at')
+        )
+        manifest.files = data.get('files', {})
+        manifest.members = data.get('members', [])
+        manifest.deleted = data.get('deleted', [])
+        return manifest
+
+    @classmethod
+    def find_all(cls, backups_dir: Path, username: str) -> List[Path]:
+        if not backups_dir.exists():
+            return []
+        pattern = f"{username}_github_backup_*{MANIFEST_SUFFIX}"
+        return sorted(
+            (p for p in backups_dir.glob(pattern) if cls.archive_for(p).exists()),
+            key=lambda p: p.name
+        )
+
+    @classmethod
+    def find_latest(cls, backups_dir: Path, username: str) -> Optional['ArchiveManifest']:
+        manifests = cls.find_all(backups_dir, username)
+        return cls.load(manifests[-1]) if manifests else None
+
+    @classmethod
+    def resolve_archive(cls, backups_dir: Path, username: str, archive: Optional[str]) -> Optional[Path]:
+        if archive and archive != 'latest':
+            path = Path(archive)
+            if not path.is_absolute() and not path.exists():
+                path = backups_dir / archive
+            return path if path.exists() else None
+
+        manifests = cls.find_all(backups_dir, username)
+        return cls.archive_for(manifests[-1]) if manifests else None
+
+    @classmethod
+    def chain_length(cls, backups_dir: Path, username: str) -> int:
+        count = 0
+        for manifest_path in reversed(cls.find_all(backups_dir, username)):
+            manifest = cls.load(manifest_path)
+            if not manifest:
+                break
+            count += 1
+            if manifest.kind == 'full':
+                break
+        return count
@@ -0,0 +1,170 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import hashlib
+import json
+import os
+import random
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.backup.archive_manifest import ArchiveManifest, HASH_BUFFER_SIZE
+from core.config.settings import ProjectPaths
+
+BATCH_SIZE = 256
+
+_worker_zip: Optional[zipfile.ZipFile] = None
+
+
+def _verify_members(zf: zipfile.ZipFile, batch: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    failures = []
+    for arc_name, expected in batch:
+        try:
+            digest = hashlib.sha256()
+            with zf.open(arc_name) as member:
+                while True:
+                    chunk = member.read(HASH_BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+            if digest.hexdigest() != expected:
+                failures.append((arc_name, "sha256 mismatch"))
+        except KeyError:
+            failures.append((arc_name, "missing"))
+        except Exception as e:
+            failures.append((arc_name, str(e)))
+    return failures
+
+
+def _open_worker_zip(archive_path: str):
+    global _worker_zip
+    _worker_zip = zipfile.ZipFile(archive_path)
+
+
+def _verify_zip_batch(batch: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    return _verify_members(_worker_zip, batch)
+
+
+class ArchiveVerifier:
+    """Checks archive members against the SHA-256 hashes in the sidecar
+    manifest. Zip members are verified in parallel worker processes. Each
+    process parses the central directory once and seeks straight to its
+    members. Tar streams can only be read front to back and are verified
+    sequentially."""
+
+    def __init__(self, username: str, workers: Optional[int] = None,
+                 sample: float = 0.05, full_every_days: int = 7):
+        self.username = username
+        self.backups_dir = ProjectPaths.get_backups_dir(username)
+        self.state_file = self.backups_dir / "verify_state.json"
+        self.workers = workers or os.cpu_count() or 1
+        self.sample = sample
+        self.full_every_days = full_every_days
+
+    def _load_state(self) -> Dict:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: Dict):
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+
+    def _full_due(self) -> bool:
+        last_full = self._load_state().get('last_full')
+        if not last_full:
+            return True
+        return datetime.now() - datetime.fromisoformat(last_full) >= timedelta(days=self.full_every_days)
+
+    def resolve_archive(self, archive: Optional[str]) -> Optional[Path]:
+        return ArchiveManifest.resolve_archive(self.backups_dir, self.username, archive)
+
+    def verify(self, archive_path: Path, mode: str = 'auto') -> bool:
+        print("\n🔎 Archive Verification")
+        print(f"   Archive: {archive_path}")
+
+        manifest = ArchiveManifest.load(ArchiveManifest.path_for(archive_path))
+        if not manifest:
+            print("   ❌ Manifest not found - cannot verify this archive")
+            return False
+
+        if mode == 'auto':
+            mode = 'full' if self._full_due() else 'sample'
+
+        expected = [(f"repositories/{rel}", manifest.files[rel]['sha256'])
+                    for rel in manifest.members if rel in manifest.files]
+        if mode == 'sample' and expected:
+            count = max(1, int(len(expected) * self.sample))
+            expected = random.sample(expected, min(count, len(expected)))
+
+        print(f"   Mode: {mode} ({len(expected)} of {len(manifest.members)} members)")
+
+        start = time.perf_counter()
+        if zipfile.is_zipfile(archive_path):
+            failures = self._verify_zip(archive_path, expected)
+        else:
+            failures = self._verify_tar(archive_path, dict(expected))
+        duration = time.perf_counter() - start
+
+        if failures:
+            print(f"   ❌ {len(failures)} members failed verification:")
+            for arc_name, reason in failures[:10]:
+                print(f"      • {arc_name}: {reason}")
+            if len(failures) > 10:
+                print(f"      ... and {len(failures) - 10} more")
+            return False
+
+        if mode == 'full':
+            state = self._load_state()
+            state['last_full'] = datetime.now().isoformat()
+            state['last_full_archive'] = archive_path.name
+            self._save_state(state)
+
+        print(f"   ✅ {len(expected)} members verified in {duration:.2f}s")
+        return True
+
+    def _verify_zip(self, archive_path: Path, expected: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        batches = [expected[i:i + BATCH_SIZE] for i in range(0, len(expected), BATCH_SIZE)]
+        if len(batches) <= 1 or self.workers <= 1:
+            with zipfile.ZipFile(archive_path) as zf:
+                return _verify_members(zf, expected)
+
+        failures = []
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(batches)), initializer=_open_worker_zip,
+                                 initargs=(str(archive_path),)) as executor:
+            futures = [executor.submit(_verify_zip_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                failures.extend(future.result())
+        return failures
+
+    @staticmethod
+    def _verify_tar(archive_path: Path, expected: Dict[str, str]) -> List[Tuple[str, str]]:
+        failures = []
+        remaining = dict(expected)
+        with tarfile.open(archive_path, 'r:*') as tf:
+            for tarinfo in tf:
+                want = remaining.pop(tarinfo.name, None)
+                if want is None or not tarinfo.isreg():
+                    continue
+                digest = hashlib.sha256()
+                member = tf.extractfile(tarinfo)
+                while True:
+                    chunk = member.read(HASH_BUFFER_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                if digest.hexdigest() != want:
+                    failures.append((tarinfo.name, "sha256 mismatch"))
+                if not remaining:
+                    break
+        failures.extend((arc_name, "missing") for arc_name in remaining)
+        return failures
@@ -0,0 +1,108 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from core.backup.repo_manager import RepoManager
+from core.backup.sync_scheduler import SyncScheduler
+from core.github.api_client import GitHubAPIClient
+from core.models import BackupStats, RepoInfo
+from core.utils.events import log_event
+
+
+class BackupDaemon:
+    """Keeps the authenticated client and the inventory warm between syncs.
+
+    The inventory is refreshed every ``refresh_interval`` seconds. Unchanged
+    pages are answered from the client's ETag cache and do not count against
+    the rate limit. Repositories are synced in small batches whenever the
+    scheduler marks them as due."""
+
+    def __init__(self, github_client: GitHubAPIClient, repo_manager: RepoManager, scheduler: SyncScheduler,
+                 refresh_interval: float = 300, all_branches: bool = False, batch_size: Optional[int] = None,
+                 metrics=None, repo_filter: Optional[Callable[[List[RepoInfo]], List[RepoInfo]]] = None):
+        self.github_client = github_client
+        self.repo_manager = repo_manager
+        self.scheduler = scheduler
+        self.refresh_interval = refresh_interval
+        self.all_branches = all_branches
+        self.batch_size = batch_size or max(1, repo_manager.workers * 4)
+        self.metrics = metrics
+        self.repo_filter = repo_filter
+        self.repos: Dict[str, RepoInfo] = {}
+        self.totals = BackupStats()
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    def _is_present(self, repo: RepoInfo) -> bool:
+        return (self.repo_manager._get_local_path(repo) / '.git').exists()
+
+    def _update_inventory(self, repos: List[RepoInfo]):
+        self.repos = {repo.full_name: repo for repo in repos}
+        self.scheduler.update_inventory(repos, time.time(), self._is_present)
+
+    def _refresh(self):
+        start = time.perf_counter()
+        remaining = self.github_client._rate_limit_remaining
+        repos = self.github_client.get_all_repos()
+        if repos and self.repo_filter:
+            repos = self.repo_filter(repos)
+        if repos:
+            self._update_inventory(repos)
+        log_event('inventory', repos=len(repos), duration=round(time.perf_counter() - start, 3),
+                  api_calls=max(0, remaining - self.github_client._rate_limit_remaining))
+
+    def _sync(self, repos: List[RepoInfo]):
+        self.repo_manager.stats = BackupStats()
+        stats = self.repo_manager.process_repositories(repos, all_branches=self.all_branches)
+        now = time.time()
+        for record in stats.repo_records:
+            self.scheduler.mark_synced(record.full_name, record.outcome == 'ok', now)
+        self.scheduler.save()
+
+        for field in ('cloned', 'updated', 'synced', 'skipped', 'failed', 'total_branches'):
+            setattr(self.totals, field, getattr(self.totals, field) + getattr(stats, field))
+        self.totals.total_repos = len(self.repos)
+        self.totals.repo_records.extend(stats.repo_records)
+        if self.metrics:
+            self.metrics.stats = self.totals
+
+        log_event('daemon_batch', repos=len(repos), cloned=stats.cloned, updated=stats.updated,
+                  skipped=stats.skipped, failed=stats.failed)
+
+    def run(self, repos: List[RepoInfo]):
+        self.totals.start_time = datetime.now()
+        self._update_inventory(repos)
+        next_refresh = time.time() + self.refresh_interval
+
+        print("\n🛰️  Daemon mode")
+        print(f"   Inventory refresh: every {self.refresh_interval:.0f}s")
+        print(f"   Sync interval: {self.scheduler.min_interval:.0f}s - {self.scheduler.max_interval:.0f}s"
+              f" (activity weighted)")
+        print("   Press Ctrl+C to stop")
+
+        while not self._stop.is_set():
+            now = time.time()
+            if now >= next_refresh:
+                self._refresh()
+                next_refresh = time.time() + self.refresh_interval
+
+            due = self.scheduler.due(now)[:self.batch_size]
+            if due:
+                self._sync([self.repos[name] for name in due])
+                continue
+
+            next_due = self.scheduler.next_due()
+            wake = min(next_refresh, next_due) if next_due else next_refresh
+            print(f"   💤 Next sync in {max(0.0, wake - time.time()):.0f}s")
+            self._stop.wait(max(1.0, wake - time.time()))
+
+        self.scheduler.save()
+        print("\n🛑 Daemon stopped")
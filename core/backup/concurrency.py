@@ -0,0 +1,138 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional
+
+from core.config.settings import ProjectPaths
+from core.models import RepoRecord
+from core.utils.events import log_event
+
+CONGESTION_ERRORS = ('TimeoutExpired', 'RateLimited')
+NETWORK_PHASES = ('clone', 'fetch', 'pull')
+
+
+class ConcurrencyController:
+    """AIMD limit on the number of repositories processed at once.
+
+    Completed repositories are grouped into windows of at least ``window``
+    seconds and ``limit`` repositories. The limit grows by one while
+    throughput (bytes/s, or repos/s for no-op syncs) keeps growing. It
+    drops back by one when the last increase made throughput worse. It is
+    halved on congestion: git timeouts, HTTP 429/403 from GitHub, or a
+    median network phase more than ``latency_factor`` times the best
+    window seen. The final limit is saved as the next run's starting
+    point."""
+
+    GROWTH = 0.05
+    DECLINE = 0.10
+    STATE_FILE_NAME = "concurrency_state.json"
+
+    def __init__(self, initial: int = 4, min_workers: int = 1, max_workers: int = 16,
+                 window: float = 5.0, latency_factor: float = 2.0, state_path: Optional[Path] = None):
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.limit = min(max(initial, self.min_workers), self.max_workers)
+        self.window = window
+        self.latency_factor = latency_factor
+        self.state_path = state_path
+        self.on_change = None
+        self._active = 0
+        self._condition = threading.Condition()
+        self._window_start = time.perf_counter()
+        self._window: List[RepoRecord] = []
+        self._previous_throughput: Optional[float] = None
+        self._previous_unit: Optional[str] = None
+        self._last_increase = False
+        self._best_latency: Optional[float] = None
+
+    @classmethod
+    def load(cls, username: str, initial: int, max_workers: int) -> 'ConcurrencyController':
+        state_path = ProjectPaths.get_user_dir(username) / cls.STATE_FILE_NAME
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                initial = int(json.load(f).get('workers', initial))
+        except (OSError, ValueError, TypeError):
+            pass
+        return cls(initial=initial, max_workers=max_workers, state_path=state_path)
+
+    @contextmanager
+    def slot(self):
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    @staticmethod
+    def _network_seconds(record: RepoRecord) -> float:
+        return sum(seconds for phase, seconds in record.phases.items() if phase in NETWORK_PHASES)
+
+    def observe(self, record: RepoRecord):
+        with self._condition:
+            self._window.append(record)
+            elapsed = time.perf_counter() - self._window_start
+            if elapsed < self.window or len(self._window) < self.limit:
+                return
+            window, self._window = self._window, []
+            self._window_start = time.perf_counter()
+            self._adjust(window, elapsed)
+            self._condition.notify_all()
+
+    def _adjust(self, window: List[RepoRecord], elapsed: float):
+        transferred = sum(record.bytes_received for record in window)
+        throughput = transferred / elapsed if transferred else len(window) / elapsed
+        unit = 'bytes/s' if transferred else 'repos/s'
+        latencies = [self._network_seconds(record) for record in window if record.bytes_received]
+        latency = statistics.median(latencies) if latencies else None
+        congested = any(record.error in CONGESTION_ERRORS for record in window)
+        spike = latency is not None and self._best_latency is not None and \
+            latency > self._best_latency * self.latency_factor
+        if latency is not None:
+            self._best_latency = latency if self._best_latency is None else min(self._best_latency, latency)
+
+        previous_limit = self.limit
+        previous = self._previous_throughput if unit == self._previous_unit else None
+        if congested or spike:
+            self.limit = max(self.min_workers, self.limit // 2)
+            reason = 'congestion' if congested else 'latency'
+        elif previous is None or throughput > previous * (1 + self.GROWTH):
+            self.limit = min(self.max_workers, self.limit + 1)
+            reason = 'growth'
+        elif self._last_increase and throughput < previous * (1 - self.DECLINE):
+            self.limit = max(self.min_workers, self.limit - 1)
+            reason = 'decline'
+        else:
+            reason = 'plateau'
+        self._last_increase = self.limit > previous_limit
+        self._previous_throughput = throughput
+        self._previous_unit = unit
+
+        log_event('concurrency', workers=self.limit, previous=previous_limit, reason=reason,
+                  throughput=round(throughput, 1), unit=unit, repos=len(window),
+                  latency=round(latency, 3) if latency is not None else None)
+        if self.limit != previous_limit and self.on_change:
+            self.on_change(self.limit)
+
+    def save(self):
+        if not self.state_path:
+            return
+        try:
+            tmp_path = self.state_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps({"workers": self.limit, "max_workers": self.max_workers,
+                                            "updated": time.time()}, indent=2), encoding='utf-8')
+            tmp_path.replace(self.state_path)
+        except OSError as e:
+            print(f"   ❌ Failed to save concurrency state: {e}")
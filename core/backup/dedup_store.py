@@ -0,0 +1,255 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.backup.archive_formats import CompressionClassifier
+from core.config.settings import ProjectPaths
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+COMPRESSED_SUFFIX = '.z'
+
+
+class DedupStore:
+    """Content-addressed snapshot store under ``backups/store``.
+
+    Files are split into fixed-size chunks named by their SHA-256; each
+    unique chunk is written once. A snapshot is a gzip'd JSON index mapping
+    every file to its chunk list, so retaining many snapshots costs one copy
+    of the data plus whatever changed between them.
+    """
+
+    def __init__(self, username: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 classifier: Optional[CompressionClassifier] = None, level: int = 6):
+        self.username = username
+        self.repos_dir = ProjectPaths.get_repos_dir(username)
+        self.store_dir = ProjectPaths.get_backups_dir(username) / "store"
+        self.chunks_dir = self.store_dir / "chunks"
+        self.snapshots_dir = self.store_dir / "snapshots"
+        self.chunk_size = chunk_size
+        self.classifier = classifier or CompressionClassifier()
+        self.level = level
+
+    def _chunk_path(self, digest: str, compressed: bool) -> Path:
+        suffix = COMPRESSED_SUFFIX if compressed else ''
+        return self.chunks_dir / digest[:2] / f"{digest}{suffix}"
+
+    def _find_chunk(self, digest: str) -> Optional[Path]:
+        for compressed in (True, False):
+            path = self._chunk_path(digest, compressed)
+            if path.exists():
+                return path
+        return None
+
+    def _write_chunk(self, data: bytes, compress: bool) -> Tuple[str, int]:
+        digest = hashlib.sha256(data).hexdigest()
+        if self._find_chunk(digest):
+            return digest, 0
+
+        payload = data
+        if compress:
+            packed = zlib.compress(data, self.level)
+            if len(packed) < len(data):
+                payload = packed
+            else:
+                compress = False
+
+        chunk_path = self._chunk_path(digest, compress)
+        chunk_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = chunk_path.with_name(chunk_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        tmp_path.replace(chunk_path)
+        return digest, len(payload)
+
+    def _read_chunk(self, digest: str) -> bytes:
+        chunk_path = self._find_chunk(digest)
+        if chunk_path is None:
+            raise FileNotFoundError(f"Missing chunk {digest}")
+        with open(chunk_path, 'rb') as f:
+            data = f.read()
+        if chunk_path.name.endswith(COMPRESSED_SUFFIX):
+            data = zlib.decompress(data)
+        return data
+
+    def _snapshot_path(self, snapshot_id: str) -> Path:
+        return self.snapshots_dir / f"{snapshot_id}.json.gz"
+
+    def _load_index(self, snapshot_id: str) -> Dict:
+        with gzip.open(self._snapshot_path(snapshot_id), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_index(self, snapshot_id: str, index: Dict):
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        snapshot_path = self._snapshot_path(snapshot_id)
+        tmp_path = snapshot_path.with_name(snapshot_path.name + '.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(index, f)
+        tmp_path.replace(snapshot_path)
+
+    def list_snapshots(self) -> List[str]:
+        if not self.snapshots_dir.exists():
+            return []
+        return sorted(p.name[:-len('.json.gz')] for p in self.snapshots_dir.glob('*.json.gz'))
+
+    def _new_snapshot_id(self) -> str:
+        base = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        snapshot_id = base
+        suffix = 1
+        while self._snapshot_path(snapshot_id).exists():
+            suffix += 1
+            snapshot_id = f"{base}_{suffix}"
+        return snapshot_id
+
+    def create_snapshot(self) -> Optional[str]:
+        print("\n🧱 Deduplicated Snapshot")
+
+        if not self.repos_dir.exists():
+            print("   ❌ Repositories directory does not exist")
+            return None
+
+        try:
+            snapshots = self.list_snapshots()
+            previous = self._load_index(snapshots[-1])['files'] if snapshots else {}
+
+            snapshot_id = self._new_snapshot_id()
+            files = {}
+            dirs = []
+            bytes_in = 0
+            bytes_written = 0
+            new_chunks = 0
+
+            for root, subdirs, names in os.walk(self.repos_dir):
+                if not subdirs and not names:
+                    dirs.append(Path(root).relative_to(self.repos_dir).as_posix())
+                for name in names:
+                    file_path = Path(root) / name
+                    rel_path = file_path.relative_to(self.repos_dir).as_posix()
+                    st = file_path.stat()
+                    bytes_in += st.st_size
+
+                    old = previous.get(rel_path)
+                    if old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+                        files[rel_path] = old
+                        continue
+
+                    compress = self.classifier.should_compress(rel_path)
+                    chunks = []
+                    with open(file_path, 'rb') as f:
+                        while True:
+                            data = f.read(self.chunk_size)
+                            if not data:
+                                break
+                            digest, written = self._write_chunk(data, compress)
+                            chunks.append(digest)
+                            if written:
+                                new_chunks += 1
+                                bytes_written += written
+
+                    files[rel_path] = {
+                        "size": st.st_size,
+                        "mtime_ns": st.st_mtime_ns,
+                        "mode": st.st_mode & 0o777,
+                        "chunks": chunks
+                    }
+
+            self._save_index(snapshot_id, {
+                "id": snapshot_id,
+                "created_at": datetime.now().isoformat(),
+                "chunk_size": self.chunk_size,
+                "dirs": dirs,
+                "files": files
+            })
+
+            print(f"   ✅ Snapshot created: {snapshot_id}")
+            print(f"   📊 Files: {len(files)}, data: {bytes_in / (1024 * 1024):.2f} MB")
+            print(f"   🧩 New chunks: {new_chunks} ({bytes_written / (1024 * 1024):.2f} MB written)")
+            print(f"   📁 Store: {self.store_dir}")
+            return snapshot_id
+
+        except Exception as e:
+            print(f"   ❌ Snapshot creation failed: {e}")
+            return None
+
+    def restore(self, snapshot_id: str, target_dir: Path, repo: Optional[str] = None) -> bool:
+        print(f"\n♻️  Restoring snapshot {snapshot_id}")
+
+        if snapshot_id not in self.list_snapshots():
+            print(f"   ❌ Snapshot not found: {snapshot_id}")
+            return False
+
+        try:
+            index = self._load_index(snapshot_id)
+            files = index['files']
+            prefix = f"{repo}/" if repo else ''
+            restored = 0
+
+            for rel_dir in index.get('dirs', []):
+                if not prefix or rel_dir.startswith(prefix):
+                    (target_dir / rel_dir).mkdir(parents=True, exist_ok=True)
+
+            for rel_path, entry in files.items():
+                if prefix and not rel_path.startswith(prefix):
+                    continue
+                dest = target_dir / rel_path
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = dest.with_name(dest.name + '.tmp')
+                with open(tmp_path, 'wb') as f:
+                    for digest in entry['chunks']:
+                        f.write(self._read_chunk(digest))
+                os.chmod(tmp_path, entry.get('mode', 0o644))
+                os.utime(tmp_path, ns=(entry['mtime_ns'], entry['mtime_ns']))
+                os.replace(tmp_path, dest)
+                restored += 1
+
+            if prefix and not restored:
+                print(f"   ❌ Repository not found in snapshot: {repo}")
+                return False
+
+            print(f"   ✅ Restored {restored} files to {target_dir}")
+            return True
+
+        except Exception as e:
+            print(f"   ❌ Restore failed: {e}")
+            return False
+
+    def _referenced_chunks(self) -> Set[str]:
+        referenced = set()
+        for snapshot_id in self.list_snapshots():
+            for entry in self._load_index(snapshot_id)['files'].values():
+                referenced.update(entry['chunks'])
+        return referenced
+
+    def prune(self, keep_last: int) -> List[str]:
+        snapshots = self.list_snapshots()
+        keep = set(snapshots[-max(1, keep_last):])
+        removed = [s for s in snapshots if s not in keep]
+        for snapshot_id in removed:
+            self._snapshot_path(snapshot_id).unlink()
+        return removed
+
+    def gc(self) -> Tuple[int, int]:
+        if not self.chunks_dir.exists():
+            return 0, 0
+
+        referenced = self._referenced_chunks()
+        removed = 0
+        freed = 0
+        for chunk_path in self.chunks_dir.glob('*/*'):
+            digest = chunk_path.name
+            if digest.endswith(COMPRESSED_SUFFIX):
+                digest = digest[:-len(COMPRESSED_SUFFIX)]
+            if digest not in referenced:
+                freed += chunk_path.stat().st_size
+                chunk_path.unlink()
+                removed += 1
+        return removed, freed
@@ -0,0 +1,201 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.config.settings import ProjectPaths
+from core.models import RepoInfo
+from core.utils.events import log_event
+
+SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+CLONE_FACTOR = 2.0
+MB = 1024 * 1024
+
+
+def parse_size(value: str) -> int:
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*', value, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size '{value}', expected bytes such as 500M or 10G")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def _existing(path: Path) -> Path:
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path
+
+
+def disk_usage(path: Path) -> Tuple[int, int]:
+    """Allocated bytes under ``path`` and under its ``.git``."""
+    total = git = 0
+    for root, dirs, files in os.walk(path):
+        in_git = Path(root).relative_to(path).parts[:1] == ('.git',)
+        for name in files + [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+            try:
+                size = os.lstat(os.path.join(root, name)).st_blocks * 512
+            except OSError:
+                continue
+            total += size
+            if in_git:
+                git += size
+    return total, git
+
+
+class DiskPlan:
+
+    def __init__(self):
+        self.free = 0
+        self.archive_free = 0
+        self.reserve = 0
+        self.current = 0
+        self.clones = 0
+        self.growth = 0
+        self.archive = 0
+        self.archive_kind: Optional[str] = None
+        self.same_device = True
+        self.fits = True
+        self.repos: List[RepoInfo] = []
+        self.deferred: List[str] = []
+
+    @property
+    def required(self) -> int:
+        required = self.clones + self.growth + self.reserve
+        return required + self.archive if self.same_device else required
+
+    @property
+    def projected(self) -> int:
+        return self.current + self.clones + self.growth
+
+    def to_dict(self) -> Dict:
+        return {
+            "free_bytes": self.free,
+            "required_bytes": self.required,
+            "reserve_bytes": self.reserve,
+            "current_bytes": self.current,
+            "projected_bytes": self.projected,
+            "clone_bytes": self.clones,
+            "growth_bytes": self.growth,
+            "archive_bytes": self.archive,
+            "archive_kind": self.archive_kind,
+            "fits": self.fits,
+            "deferred_repos": self.deferred
+        }
+
+
+class DiskPlanner:
+    """Preflight check that a run fits on the volume before it starts.
+
+    A new clone is estimated at ``CLONE_FACTOR`` times the API ``size``
+    (packs plus the checked-out tree). An existing clone grows by the part
+    of ``size`` its ``.git`` does not hold yet. A full archive or first
+    snapshot needs room for the whole projected repositories directory,
+    later ones only for the growth. ``reserve`` bytes are always left free,
+    and ``committed`` bytes already promised to other accounts on the same
+    volume are not counted as free.
+
+    When the estimate does not fit, ``refuse`` stops the run. ``fit``
+    keeps every update, then adds new clones smallest first while they fit
+    and defers the rest to a later run."""
+
+    def __init__(self, username: str, reserve: int = 1024 ** 3, mode: str = 'refuse', workers: int = 1):
+        self.username = username
+        self.repos_dir = ProjectPaths.get_repos_dir(username)
+        self.backups_dir = ProjectPaths.get_backups_dir(username)
+        self.reserve = reserve
+        self.mode = mode
+        self.workers = max(1, workers)
+
+    def _measure(self) -> Dict[str, Tuple[int, int]]:
+        if not self.repos_dir.exists():
+            return {}
+        entries = sorted(self.repos_dir.iterdir())
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="disk-usage") as executor:
+            usage = list(executor.map(disk_usage, entries))
+        return {entry.name: size for entry, size in zip(entries, usage)}
+
+    def plan(self, repos: List[RepoInfo], archive_kind: Optional[str] = None, committed: int = 0) -> DiskPlan:
+        plan = DiskPlan()
+        plan.reserve = self.reserve
+        plan.archive_kind = archive_kind
+        repos_root = _existing(self.repos_dir)
+        backups_root = _existing(self.backups_dir)
+        plan.same_device = repos_root.stat().st_dev == backups_root.stat().st_dev
+        plan.free = shutil.disk_usage(repos_root).free - committed
+        plan.archive_free = shutil.disk_usage(backups_root).free - (committed if plan.same_device else 0)
+
+        usage = self._measure()
+        plan.current = sum(total for total, _ in usage.values())
+        updates, clones = [], []
+        for repo in repos:
+            estimate = repo.size * 1024
+            if repo.name in usage and (self.repos_dir / repo.name / '.git').is_dir():
+                plan.growth += int(max(0, estimate - usage[repo.name][1]) * CLONE_FACTOR)
+                updates.append(repo)
+            else:
+                clones.append((int(estimate * CLONE_FACTOR), repo))
+        plan.clones = sum(size for size, _ in clones)
+        plan.archive = self._archive_bytes(plan)
+        plan.repos = list(repos)
+        plan.fits = self._fits(plan)
+
+        if not plan.fits and self.mode == 'fit':
+            plan.clones = 0
+            plan.archive = self._archive_bytes(plan)
+            if self._fits(plan):
+                accepted = []
+                for size, repo in sorted(clones, key=lambda item: item[0]):
+                    if self._fits(plan, clone=size):
+                        plan.clones += size
+                        plan.archive = self._archive_bytes(plan)
+                        accepted.append(repo)
+                    else:
+                        plan.deferred.append(repo.full_name)
+                plan.repos = updates + accepted
+                plan.fits = True
+            else:
+                plan.clones = sum(size for size, _ in clones)
+                plan.archive = self._archive_bytes(plan)
+
+        self._print(plan)
+        log_event('disk_budget', user=self.username, **{key: value for key, value in plan.to_dict().items()
+                                                        if key != 'deferred_repos'},
+                  deferred=len(plan.deferred))
+        return plan
+
+    @staticmethod
+    def _archive_bytes(plan: DiskPlan) -> int:
+        if plan.archive_kind == 'full':
+            return plan.projected
+        if plan.archive_kind == 'incremental':
+            return plan.clones + plan.growth
+        return 0
+
+    def _fits(self, plan: DiskPlan, clone: int = 0) -> bool:
+        archived = clone if plan.archive_kind else 0
+        if plan.same_device:
+            return plan.required + clone + archived <= plan.free
+        return plan.required + clone <= plan.free and plan.archive + archived + self.reserve <= plan.archive_free
+
+    def _print(self, plan: DiskPlan):
+        print(f"\n💾 Disk Budget")
+        print(f"   Repositories: {plan.current / MB:.1f} MB → {plan.projected / MB:.1f} MB projected"
+              f" (+{plan.clones / MB:.1f} MB new clones, +{plan.growth / MB:.1f} MB updates)")
+        if plan.archive_kind:
+            print(f"   Archive headroom: {plan.archive / MB:.1f} MB ({plan.archive_kind})"
+                  + ("" if plan.same_device else f", {plan.archive_free / MB:.1f} MB free on its volume"))
+        print(f"   Needed: {plan.required / MB:.1f} MB including {plan.reserve / MB:.0f} MB reserve,"
+              f" free: {plan.free / MB:.1f} MB")
+        if not plan.fits:
+            print("   ❌ Not enough disk space for this run")
+        elif plan.deferred:
+            print(f"   ⚠️ Over budget: {len(plan.repos)} repositories fit, {len(plan.deferred)} new clones"
+                  f" deferred to a later run (updates first, then smallest clones)")
+        else:
+            print("   ✅ Fits")
@@ -0,0 +1,199 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.config.settings import ProjectPaths
+from core.utils.events import log_event
+from core.utils.tracing import NULL_TRACER
+
+MAINTENANCE_TASKS = (
+    ('repack', ['repack', '-d', '-l', '--no-write-bitmap-index']),
+    ('geometric-repack', ['repack', '-d', '-l', '--geometric=2', '--no-write-bitmap-index']),
+    ('pack-refs', ['pack-refs', '--all']),
+    ('commit-graph', ['commit-graph', 'write', '--reachable', '--split']),
+    ('multi-pack-index', ['multi-pack-index', 'write']),
+)
+
+
+class MaintenanceStats:
+
+    def __init__(self):
+        self.candidates = 0
+        self.maintained = 0
+        self.failed = 0
+        self.deferred = 0
+        self.loose_before = 0
+        self.loose_after = 0
+        self.packs_before = 0
+        self.packs_after = 0
+        self.duration = 0.0
+
+
+class RepoMaintenance:
+    """Keeps long-lived backup clones fast to fetch and query.
+
+    A repository is due when it has at least ``loose_threshold`` loose
+    objects, ``pack_threshold`` packs, no commit-graph, or no maintenance
+    for ``max_age_days`` (or never). Due repositories are maintained in parallel,
+    worst first. No new repository is started once ``time_budget`` seconds
+    have passed; the rest stay due for the next run. The cost is spread
+    over runs instead of one long gc."""
+
+    STATE_FILE_NAME = "maintenance_state.json"
+
+    def __init__(self, username: str, workers: int = 1, time_budget: float = 600,
+                 loose_threshold: int = 1000, pack_threshold: int = 20, max_age_days: float = 30,
+                 timeout: int = 1800, tracer=None, git_env: Optional[Dict[str, str]] = None):
+        self.username = username
+        self.repos_dir = ProjectPaths.get_repos_dir(username)
+        self.state_path = ProjectPaths.get_user_dir(username) / self.STATE_FILE_NAME
+        self.workers = max(1, workers)
+        self.time_budget = time_budget
+        self.loose_threshold = loose_threshold
+        self.pack_threshold = pack_threshold
+        self.max_age = max_age_days * 86400
+        self.timeout = timeout
+        self.tracer = tracer or NULL_TRACER
+        self.git_env = git_env
+        self.stats = MaintenanceStats()
+        self._lock = threading.Lock()
+        self.state: Dict[str, float] = {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            self.state = {}
+
+    def _git(self, repo_path: Path, args: List[str], timeout: int = 60) -> subprocess.CompletedProcess:
+        with self.tracer.span(f"git {args[0]}", "git", repo=repo_path.name, phase='maintenance') as span:
+            result = subprocess.run(['git', '-C', str(repo_path)] + args, capture_output=True, text=True,
+                                    timeout=timeout, env=self.git_env)
+            span['exit_code'] = result.returncode
+        return result
+
+    def inspect(self, repo_path: Path) -> Optional[Dict[str, int]]:
+        try:
+            result = self._git(repo_path, ['count-objects', '-v'])
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+        counts = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(':')
+            if value.strip().isdigit():
+                counts[key.strip()] = int(value)
+        return {"loose": counts.get('count', 0), "packs": counts.get('packs', 0)}
+
+    def _due_reason(self, repo_path: Path, info: Dict[str, int], now: float) -> Optional[str]:
+        if info['loose'] >= self.loose_threshold:
+            return 'loose'
+        if info['packs'] >= self.pack_threshold:
+            return 'packs'
+        objects_info = repo_path / '.git' / 'objects' / 'info'
+        if info['packs'] and not ((objects_info / 'commit-graph').exists()
+                                  or (objects_info / 'commit-graphs').exists()):
+            return 'commit-graph'
+        last = self.state.get(repo_path.name)
+        if last is None:
+            return 'never'
+        if now - last >= self.max_age:
+            return 'age'
+        return None
+
+    def plan(self) -> List[tuple]:
+        now = time.time()
+        if not self.repos_dir.exists():
+            return []
+        repo_paths = [path for path in sorted(self.repos_dir.iterdir()) if (path / '.git').is_dir()]
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="maintenance") as executor:
+            infos = list(executor.map(self.inspect, repo_paths))
+        due = []
+        for repo_path, info in zip(repo_paths, infos):
+            reason = self._due_reason(repo_path, info, now) if info else None
+            if reason:
+                due.append((repo_path, info, reason))
+        due.sort(key=lambda item: (-item[1]['loose'], -item[1]['packs'], self.state.get(item[0].name, 0)))
+        return due
+
+    def _maintain(self, repo_path: Path, info: Dict[str, int], reason: str, deadline: float) -> bool:
+        if time.monotonic() >= deadline:
+            with self._lock:
+                self.stats.deferred += 1
+            return False
+
+        start = time.perf_counter()
+        failed_tasks = []
+        for task, args in MAINTENANCE_TASKS:
+            if task == 'geometric-repack' and info['packs'] < self.pack_threshold:
+                continue
+            try:
+                if self._git(repo_path, args, timeout=self.timeout).returncode != 0:
+                    failed_tasks.append(task)
+            except (OSError, subprocess.SubprocessError):
+                failed_tasks.append(task)
+
+        after = self.inspect(repo_path) or info
+        with self._lock:
+            self.stats.loose_before += info['loose']
+            self.stats.packs_before += info['packs']
+            self.stats.loose_after += after['loose']
+            self.stats.packs_after += after['packs']
+            if failed_tasks:
+                self.stats.failed += 1
+            else:
+                self.stats.maintained += 1
+                self.state[repo_path.name] = time.time()
+        log_event('maintenance_repo', repo=repo_path.name, reason=reason, loose=info['loose'],
+                  packs=info['packs'], loose_after=after['loose'], packs_after=after['packs'],
+                  failed_tasks=failed_tasks or None, duration=round(time.perf_counter() - start, 3))
+        return not failed_tasks
+
+    def run(self) -> MaintenanceStats:
+        print(f"\n🧹 Repository maintenance (budget {self.time_budget:.0f}s, workers {self.workers})")
+        start = time.perf_counter()
+        due = self.plan()
+        self.stats.candidates = len(due)
+        if not due:
+            self.save()
+            print("   ✅ All repositories are in good shape")
+            return self.stats
+
+        deadline = time.monotonic() + self.time_budget
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="maintenance") as executor:
+            for future in [executor.submit(self._maintain, repo_path, info, reason, deadline)
+                           for repo_path, info, reason in due]:
+                future.result()
+
+        self.stats.duration = time.perf_counter() - start
+        self.save()
+        print(f"   ✅ Maintained {self.stats.maintained} of {len(due)} due repositories"
+              f" in {self.stats.duration:.1f}s (loose objects {self.stats.loose_before} → {self.stats.loose_after},"
+              f" packs {self.stats.packs_before} → {self.stats.packs_after})")
+        if self.stats.deferred:
+            print(f"   ⏳ {self.stats.deferred} deferred to the next run (time budget reached)")
+        if self.stats.failed:
+            print(f"   ❌ {self.stats.failed} failed")
+        log_event('maintenance', user=self.username, due=len(due), maintained=self.stats.maintained,
+                  deferred=self.stats.deferred, failed=self.stats.failed,
+                  duration=round(self.stats.duration, 3))
+        return self.stats
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self.state, indent=2)
+        try:
+            tmp_path = self.state_path.with_suffix('.tmp')
+            tmp_path.write_text(data, encoding='utf-8')
+            tmp_path.replace(self.state_path)
+        except OSError as e:
+            print(f"   ❌ Failed to save maintenance state: {e}")
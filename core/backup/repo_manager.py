@@ -3,29 +3,90 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 # https://github.com/smartlegionlab/
 # --------------------------------------------------------
+import logging
+import re
 import subprocess
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
+from core.backup.concurrency import ConcurrencyController
+from core.backup.run_journal import quarantine
+from core.backup.sync_policy import RepoPolicy, SyncPolicies
 from core.config.settings import ProjectPaths
 from core.github.api_client import GitHubAPIClient
-from core.models import BackupStats, RepoInfo
-from core.utils.progress import ProgressBar
+from core.models import BackupStats, RepoInfo, RepoRecord
+from core.utils.events import events_enabled, log_event
+from core.utils.progress import ProgressDashboard
+from core.utils.tracing import NULL_TRACER, redact
+
+RATE_LIMIT_PATTERN = re.compile(r'error: (429|403)|rate limit', re.IGNORECASE)
+RECEIVED_PATTERN = re.compile(r'Receiving objects:\s+100% \(\d+/\d+\), ([\d.]+) (bytes|KiB|MiB|GiB)')
+SIZE_UNITS = {'bytes': 1, 'KiB': 1024, 'MiB': 1024 ** 2, 'GiB': 1024 ** 3}
+NETWORK_PHASES = ('clone', 'fetch', 'pull')
+OPERATION_RESULTS = {
+    "CLONE": ("cloned", "clone"),
+    "CLONE (recover)": ("cloned", "clone-recover"),
+    "PULL": ("updated", "update"),
+    "FETCH": ("updated", "fetch"),
+    "SKIP": ("skipped", None),
+    "SYNC": ("synced", None),
+}
+DEFAULT_POLICY = RepoPolicy()
+
+
+class Interrupted(BaseException):
+    """Raised in a worker once the run is stopping. It derives from
+    ``BaseException`` so the ``except Exception`` fallbacks (rmtree, recover
+    by re-cloning) never treat a terminated git command as a failed one."""
 
 
 class RepoManager:
 
     def __init__(self, github_client: GitHubAPIClient,
                  timeout: int = 30,
-                 max_retries: int = 5):
+                 max_retries: int = 5,
+                 tracer=None,
+                 workers: int = 1,
+                 predictions: Optional[Dict[str, float]] = None,
+                 journal=None,
+                 slots: Optional[threading.Semaphore] = None,
+                 shared_output: bool = False,
+                 policies: Optional[SyncPolicies] = None,
+                 controller: Optional[ConcurrencyController] = None,
+                 git_env: Optional[Dict[str, str]] = None,
+                 git_config: Optional[List[str]] = None,
+                 disk_reserve: int = 0,
+                 stop_event: Optional[threading.Event] = None):
         self.github_client = github_client
+        self.tracer = tracer or NULL_TRACER
         self.username = github_client.login
         self.timeout = timeout
         self.max_retries = max_retries
+        self.workers = max(1, workers)
+        self.predictions = predictions or {}
+        self.journal = journal
+        self.slots = slots
+        self.shared_output = shared_output
+        self.policies = policies
+        self.controller = controller
+        self.git_env = git_env
+        self.git_config = git_config or []
+        self.disk_reserve = disk_reserve
+        self.stop_event = stop_event or threading.Event()
+        self._processes = set()
+        self._process_lock = threading.Lock()
+        self._in_flight: Dict[str, Path] = {}
         self.stats = BackupStats()
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        self._progress: Optional[ProgressDashboard] = None
 
         self.user_dir = ProjectPaths.get_user_dir(self.username)
         self.repos_dir = ProjectPaths.get_repos_dir(self.username)
@@ -38,22 +99,130 @@ class RepoManager:
     def _get_local_path(self, repo: RepoInfo) -> Path:
         return self.repos_dir / repo.name
 
+    @property
+    def _record(self) -> Optional[RepoRecord]:
+        return getattr(self._local, 'record', None)
+
+    @property
+    def _policy(self) -> RepoPolicy:
+        return getattr(self._local, 'policy', None) or DEFAULT_POLICY
+
+    @property
+    def _timeout(self) -> int:
+        return self._policy.timeout or self.timeout
+
+    def _resolve_policy(self, repo: RepoInfo) -> RepoPolicy:
+        self._local.policy = self.policies.resolve(repo) if self.policies else DEFAULT_POLICY
+        return self._local.policy
+
+    @staticmethod
+    def _parse_received_bytes(stderr) -> int:
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode('utf-8', errors='replace')
+        matches = RECEIVED_PATTERN.findall(stderr or '')
+        if not matches:
+            return 0
+        value, unit = matches[-1]
+        return int(float(value) * SIZE_UNITS[unit])
+
+    @staticmethod
+    def _git_subcommand(cmd: List[str]) -> str:
+        args = iter(cmd[1:])
+        for arg in args:
+            if arg in ('-C', '--git-dir', '-c'):
+                next(args, None)
+            elif not arg.startswith('-'):
+                return arg
+        return 'git'
+
+    def _run_git(self, cmd: List[str], phase: str, timeout: int, text: bool = True) -> subprocess.CompletedProcess:
+        record = self._record
+        start = time.perf_counter()
+        if self.git_config and cmd[0] == 'git':
+            cmd = ['git'] + [arg for setting in self.git_config for arg in ('-c', setting)] + cmd[1:]
+        try:
+            with self.tracer.span(
+                    f"git {self._git_subcommand(cmd)}", "git",
+                    command=redact(' '.join(cmd)),
+                    repo=record.full_name if record else None,
+                    phase=phase) as span:
+                result = self._communicate(cmd, text, timeout)
+                span['exit_code'] = result.returncode
+            if record and '--progress' in cmd:
+                record.bytes_received += self._parse_received_bytes(result.stderr)
+            if record and result.returncode != 0 and phase in NETWORK_PHASES:
+                stderr = result.stderr.decode('utf-8', errors='replace') \
+                    if isinstance(result.stderr, bytes) else result.stderr or ''
+                record.error = 'RateLimited' if RATE_LIMIT_PATTERN.search(stderr) else 'GitCommandError'
+            if events_enabled(logging.DEBUG):
+                log_event('git', logging.DEBUG, repo=record.full_name if record else None, phase=phase,
+                          command=self._git_subcommand(cmd), exit_code=result.returncode,
+                          duration=round(time.perf_counter() - start, 3))
+            return result
+        except Exception as e:
+            if record:
+                record.error = type(e).__name__
+            raise
+        finally:
+            if record:
+                record.add_phase(phase, time.perf_counter() - start)
+
+    def _communicate(self, cmd: List[str], text: bool, timeout: int) -> subprocess.CompletedProcess:
+        with self._process_lock:
+            if self.stop_event.is_set():
+                raise Interrupted()
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=text,
+                                       env=self.git_env)
+            self._processes.add(process)
+        try:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            if process.returncode != 0 and self.stop_event.is_set():
+                raise Interrupted()
+            return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+        finally:
+            with self._process_lock:
+                self._processes.discard(process)
+
+    def stop(self):
+        with self._process_lock:
+            self.stop_event.set()
+            processes = list(self._processes)
+        for process in processes:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+
+    def _backoff(self, retry_count: int):
+        record = self._record
+        wait_time = 2 ** retry_count
+        if record:
+            record.retries += 1
+            record.add_phase('backoff', wait_time)
+            log_event('git_retry', logging.WARNING, repo=record.full_name, retry=retry_count + 1,
+                      wait=wait_time, error=record.error)
+        if self.stop_event.wait(wait_time):
+            raise Interrupted()
+
     def _get_local_commit_date(self, repo_path: Path) -> Optional[datetime]:
         try:
-            check_result = subprocess.run(
+            check_result = self._run_git(
                 ['git', '-C', str(repo_path), 'rev-parse', '--verify', 'HEAD'],
-                capture_output=True,
-                text=True,
+                phase='needs_update',
                 timeout=10
             )
 
             if check_result.returncode != 0:
                 return None
 
-            result = subprocess.run(
+            result = self._run_git(
                 ['git', '-C', str(repo_path), 'log', '-1', '--format=%cI'],
-                capture_output=True,
-                text=True,
+                phase='needs_update',
                 timeout=10
             )
 
@@ -91,10 +260,9 @@ class RepoManager:
             if diff_seconds <= 300:
                 return False
 
-            remote_result = subprocess.run(
+            remote_result = self._run_git(
                 ['git', '-C', str(repo_path), 'ls-remote', 'origin', 'HEAD'],
-                capture_output=True,
-                text=True,
+                phase='needs_update',
                 timeout=10
             )
 
@@ -107,10 +275,9 @@ class RepoManager:
 
             remote_hash = remote_data.split()[0]
 
-            local_hash_result = subprocess.run(
+            local_hash_result = self._run_git(
                 ['git', '-C', str(repo_path), 'rev-parse', 'HEAD'],
-                capture_output=True,
-                text=True,
+                phase='needs_update',
                 timeout=5
             )
 
@@ -129,10 +296,11 @@ class RepoManager:
             if not (repo_path / '.git').exists():
                 return False
 
-            result = subprocess.run(
+            result = self._run_git(
                 ['git', '-C', str(repo_path), 'rev-parse', 'HEAD'],
-                capture_output=True,
-                timeout=10
+                phase='health_check',
+                timeout=10,
+                text=False
             )
 
             return result.returncode == 0
@@ -142,18 +310,16 @@ class RepoManager:
 
     def _create_local_branches_from_remote(self, repo_path: Path) -> bool:
         try:
-            current_branch_result = subprocess.run(
+            current_branch_result = self._run_git(
                 ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
-                capture_output=True,
-                text=True,
+                phase='branches',
                 timeout=5
             )
             current_branch = current_branch_result.stdout.strip() if current_branch_result.returncode == 0 else 'master'
 
-            branch_result = subprocess.run(
+            branch_result = self._run_git(
                 ['git', '-C', str(repo_path), 'branch', '-r'],
-                capture_output=True,
-                text=True,
+                phase='branches',
                 timeout=10
             )
 
@@ -166,34 +332,74 @@ class RepoManager:
                 remote_branch = remote_branch.strip()
                 if remote_branch and not remote_branch.startswith('origin/HEAD'):
                     local_branch = remote_branch.replace('origin/', '', 1)
+                    pattern = self._policy.branch_pattern
+                    if pattern and local_branch != current_branch and not pattern.search(local_branch):
+                        continue
 
-                    check_branch = subprocess.run(
+                    check_branch = self._run_git(
                         ['git', '-C', str(repo_path), 'rev-parse', '--verify', local_branch],
-                        capture_output=True,
-                        timeout=5
+                        phase='branches',
+                        timeout=5,
+                        text=False
                     )
 
                     if check_branch.returncode != 0:
                         checkout_cmd = ['git', '-C', str(repo_path), 'checkout', '-b', local_branch, remote_branch]
-                        subprocess.run(checkout_cmd, timeout=30, capture_output=True)
+                        self._run_git(checkout_cmd, phase='branches', timeout=30, text=False)
 
             checkout_back = ['git', '-C', str(repo_path), 'checkout', current_branch]
-            subprocess.run(checkout_back, timeout=10, capture_output=True)
+            self._run_git(checkout_back, phase='branches', timeout=10, text=False)
 
             return True
 
         except Exception:
             return False
 
+    def _depth_args(self) -> List[str]:
+        return ['--depth', str(self._policy.depth)] if self._policy.depth else []
+
+    def _matching_refspecs(self, repo_path: Path) -> Optional[List[str]]:
+        current_result = self._run_git(
+            ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
+            phase='fetch',
+            timeout=5
+        )
+        current_branch = current_result.stdout.strip() if current_result.returncode == 0 else None
+
+        remote_result = self._run_git(
+            ['git', '-C', str(repo_path), 'ls-remote', '--heads', 'origin'],
+            phase='fetch',
+            timeout=self._timeout
+        )
+        if remote_result.returncode != 0:
+            return None
+
+        refspecs = []
+        for line in remote_result.stdout.strip().split('\n'):
+            parts = line.split()
+            if len(parts) > 1 and parts[1].startswith('refs/heads/'):
+                branch = parts[1][len('refs/heads/'):]
+                if branch == current_branch or self._policy.branch_pattern.search(branch):
+                    refspecs.append(f"+refs/heads/{branch}:refs/remotes/origin/{branch}")
+        return refspecs
+
     def _fetch_all_branches(self, repo_path: Path) -> bool:
         try:
-            git_dir = repo_path / '.git'
-            config_cmd = ['git', '--git-dir', str(git_dir), 'config', 'remote.origin.fetch',
-                          '+refs/heads/*:refs/remotes/origin/*']
-            subprocess.run(config_cmd, timeout=10, capture_output=True)
+            if self._policy.branch_pattern:
+                refspecs = self._matching_refspecs(repo_path)
+                if refspecs is None:
+                    return False
+                fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--prune', '--tags', '--progress'] + \
+                    self._depth_args() + ['origin'] + refspecs
+            else:
+                git_dir = repo_path / '.git'
+                config_cmd = ['git', '--git-dir', str(git_dir), 'config', 'remote.origin.fetch',
+                              '+refs/heads/*:refs/remotes/origin/*']
+                self._run_git(config_cmd, phase='fetch', timeout=10, text=False)
 
-            fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--all', '--prune', '--tags']
-            fetch_result = subprocess.run(fetch_cmd, timeout=self.timeout, capture_output=True)
+                fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--all', '--prune', '--tags',
+                             '--progress'] + self._depth_args()
+            fetch_result = self._run_git(fetch_cmd, phase='fetch', timeout=self._timeout, text=False)
 
             if fetch_result.returncode != 0:
                 return False
@@ -212,38 +418,41 @@ class RepoManager:
         try:
             auth_url = repo.clone_url.replace('https://', f'https://oauth2:{self.github_client.token}@')
 
-            cmd = ['git', 'clone', auth_url, str(repo_path)]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout
-            )
+            policy = self._policy
+            cmd = ['git', 'clone', '--progress'] + self._depth_args()
+            if policy.clone_filter:
+                cmd.append(f'--filter={policy.clone_filter}')
+            if policy.branches in ('default', 'regex'):
+                cmd.append('--single-branch')
+            result = self._run_git(cmd + [auth_url, str(repo_path)], phase='clone', timeout=self._timeout)
 
             if result.returncode != 0:
                 if repo_path.exists():
                     shutil.rmtree(repo_path, ignore_errors=True)
 
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                self._backoff(retry_count)
                 return self._clone_with_retry(repo_path, repo, retry_count + 1)
 
             git_dir = repo_path / '.git'
-            config_cmd = ['git', '--git-dir', str(git_dir), 'config', 'remote.origin.fetch',
-                          '+refs/heads/*:refs/remotes/origin/*']
-            subprocess.run(config_cmd, timeout=10, capture_output=True)
-
             pull_config_cmd = ['git', '--git-dir', str(git_dir), 'config', 'pull.rebase', 'false']
-            subprocess.run(pull_config_cmd, timeout=10, capture_output=True)
+            self._run_git(pull_config_cmd, phase='clone', timeout=10, text=False)
 
-            fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--all', '--tags', '--prune']
-            subprocess.run(fetch_cmd, timeout=self.timeout, capture_output=True)
+            if policy.branches == 'regex':
+                self._fetch_all_branches(repo_path)
+            elif policy.branches != 'default':
+                config_cmd = ['git', '--git-dir', str(git_dir), 'config', 'remote.origin.fetch',
+                              '+refs/heads/*:refs/remotes/origin/*']
+                self._run_git(config_cmd, phase='clone', timeout=10, text=False)
 
-            self._create_local_branches_from_remote(repo_path)
+                fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--all', '--tags', '--prune',
+                             '--progress'] + self._depth_args()
+                self._run_git(fetch_cmd, phase='fetch', timeout=self._timeout, text=False)
+
+                self._create_local_branches_from_remote(repo_path)
 
             default_branch = repo.default_branch or 'master'
             checkout_default = ['git', '-C', str(repo_path), 'checkout', default_branch]
-            subprocess.run(checkout_default, timeout=10, capture_output=True)
+            self._run_git(checkout_default, phase='branches', timeout=10, text=False)
 
             if not self._verify_repo_health(repo_path):
                 shutil.rmtree(repo_path, ignore_errors=True)
@@ -255,8 +464,7 @@ class RepoManager:
             if repo_path.exists():
                 shutil.rmtree(repo_path, ignore_errors=True)
 
-            wait_time = 2 ** retry_count
-            time.sleep(wait_time)
+            self._backoff(retry_count)
             return self._clone_with_retry(repo_path, repo, retry_count + 1)
 
         except Exception:
@@ -270,25 +478,22 @@ class RepoManager:
 
         try:
             if not self._fetch_all_branches(repo_path):
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                self._backoff(retry_count)
                 return self._update_with_retry(repo_path, repo, retry_count + 1)
 
-            branch_result = subprocess.run(
+            branch_result = self._run_git(
                 ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
-                capture_output=True,
-                text=True,
+                phase='pull',
                 timeout=5
             )
 
             current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else 'master'
 
-            pull_cmd = ['git', '-C', str(repo_path), 'pull', 'origin', current_branch]
-            pull_result = subprocess.run(pull_cmd, timeout=self.timeout, capture_output=True)
+            pull_cmd = ['git', '-C', str(repo_path), 'pull', '--progress', 'origin', current_branch]
+            pull_result = self._run_git(pull_cmd, phase='pull', timeout=self._timeout, text=False)
 
             if pull_result.returncode != 0:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                self._backoff(retry_count)
                 return self._update_with_retry(repo_path, repo, retry_count + 1)
 
             if not self._verify_repo_health(repo_path):
@@ -298,8 +503,7 @@ class RepoManager:
             return True
 
         except subprocess.TimeoutExpired:
-            wait_time = 2 ** retry_count
-            time.sleep(wait_time)
+            self._backoff(retry_count)
             return self._update_with_retry(repo_path, repo, retry_count + 1)
 
         except Exception:
@@ -310,29 +514,27 @@ class RepoManager:
             return False
 
         try:
-            fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--prune', '--tags']
-            fetch_result = subprocess.run(fetch_cmd, timeout=self.timeout, capture_output=True)
+            fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--prune', '--tags', '--progress'] + \
+                self._depth_args()
+            fetch_result = self._run_git(fetch_cmd, phase='fetch', timeout=self._timeout, text=False)
 
             if fetch_result.returncode != 0:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                self._backoff(retry_count)
                 return self._update_with_retry_fast(repo_path, repo, retry_count + 1)
 
-            branch_result = subprocess.run(
+            branch_result = self._run_git(
                 ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
-                capture_output=True,
-                text=True,
+                phase='pull',
                 timeout=5
             )
 
             current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else 'master'
 
-            pull_cmd = ['git', '-C', str(repo_path), 'pull', 'origin', current_branch]
-            pull_result = subprocess.run(pull_cmd, timeout=self.timeout, capture_output=True)
+            pull_cmd = ['git', '-C', str(repo_path), 'pull', '--progress', 'origin', current_branch]
+            pull_result = self._run_git(pull_cmd, phase='pull', timeout=self._timeout, text=False)
 
             if pull_result.returncode != 0:
-                wait_time = 2 ** retry_count
-                time.sleep(wait_time)
+                self._backoff(retry_count)
                 return self._update_with_retry_fast(repo_path, repo, retry_count + 1)
 
             if not self._verify_repo_health(repo_path):
@@ -342,8 +544,7 @@ class RepoManager:
             return True
 
         except subprocess.TimeoutExpired:
-            wait_time = 2 ** retry_count
-            time.sleep(wait_time)
+            self._backoff(retry_count)
             return self._update_with_retry_fast(repo_path, repo, retry_count + 1)
 
         except Exception:
@@ -351,10 +552,9 @@ class RepoManager:
 
     def _count_branches(self, repo_path: Path) -> int:
         try:
-            result = subprocess.run(
+            result = self._run_git(
                 ['git', '-C', str(repo_path), 'branch'],
-                capture_output=True,
-                text=True,
+                phase='branch_count',
                 timeout=10
             )
 
@@ -366,18 +566,16 @@ class RepoManager:
 
     def _prune_local_branches(self, repo_path: Path) -> bool:
         try:
-            current_branch_result = subprocess.run(
+            current_branch_result = self._run_git(
                 ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
-                capture_output=True,
-                text=True,
+                phase='branches',
                 timeout=5
             )
             current_branch = current_branch_result.stdout.strip() if current_branch_result.returncode == 0 else 'master'
 
-            remote_result = subprocess.run(
+            remote_result = self._run_git(
                 ['git', '-C', str(repo_path), 'ls-remote', '--heads', 'origin'],
-                capture_output=True,
-                text=True,
+                phase='branches',
                 timeout=10
             )
 
@@ -393,10 +591,9 @@ class RepoManager:
                         branch_name = branch_ref.replace('refs/heads/', '')
                         remote_branches.add(branch_name)
 
-            local_result = subprocess.run(
+            local_result = self._run_git(
                 ['git', '-C', str(repo_path), 'branch', '--format=%(refname:short)'],
-                capture_output=True,
-                text=True,
+                phase='branches',
                 timeout=10
             )
 
@@ -412,10 +609,11 @@ class RepoManager:
 
             for branch in to_delete:
                 if branch and branch != 'master' and not branch.startswith('*'):
-                    subprocess.run(
+                    self._run_git(
                         ['git', '-C', str(repo_path), 'branch', '-D', branch],
-                        capture_output=True,
-                        timeout=10
+                        phase='branches',
+                        timeout=10,
+                        text=False
                     )
 
             return True
@@ -423,96 +621,237 @@ class RepoManager:
         except Exception:
             return False
 
-    def process_repositories(self, repos: List[RepoInfo], all_branches: bool = False) -> BackupStats:
+    def _low_on_disk(self) -> bool:
+        return bool(self.disk_reserve) and shutil.disk_usage(self.repos_dir).free < self.disk_reserve
+
+    def _process_repo(self, repo: RepoInfo, all_branches: bool) -> Tuple[str, bool]:
+        policy = self._resolve_policy(repo)
+        if self.policies and (self._get_local_path(repo) / '.git').exists():
+            reason = self.policies.skip_reason(repo, policy)
+            if reason:
+                self._progress.begin(repo.full_name, "SKIP")
+                log_event('policy_skip', logging.DEBUG, repo=repo.full_name, reason=reason)
+                return "SKIP", True
+
+        op_type, success = self._sync_repo(repo, policy.all_branches(all_branches))
+        if success and self.policies:
+            self.policies.mark_synced(repo)
+        return op_type, success
+
+    def _sync_repo(self, repo: RepoInfo, all_branches: bool) -> Tuple[str, bool]:
+        repo_path = self._get_local_path(repo)
+        progress = self._progress
+
+        if not (repo_path.exists() and (repo_path / '.git').exists()):
+            progress.begin(repo.full_name, "CLONE")
+            if self._low_on_disk():
+                self._record.error = 'DiskFull'
+                return "CLONE", False
+            return "CLONE", self._clone_with_retry(repo_path, repo)
+
+        if not all_branches:
+            progress.begin(repo.full_name, "CHECK")
+            if not self._needs_update(repo_path, repo):
+                return "SKIP", True
+            progress.set_operation("PULL")
+            return "PULL", self._update_with_retry_fast(repo_path, repo)
+
+        progress.begin(repo.full_name, "FETCH")
+        if not self._fetch_all_branches(repo_path):
+            shutil.rmtree(repo_path, ignore_errors=True)
+            progress.set_operation("CLONE (recover)")
+            return "CLONE (recover)", self._clone_with_retry(repo_path, repo)
+
+        if not self._needs_update(repo_path, repo):
+            return "SYNC", True
+        progress.set_operation("PULL")
+        return "PULL", self._update_with_retry(repo_path, repo)
+
+    def _fetch_refs(self, repo_path: Path, updated: List[str], deleted: List[str], all_branches: bool) -> bool:
+        current_result = self._run_git(
+            ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
+            phase='fetch',
+            timeout=5
+        )
+        current_branch = current_result.stdout.strip() if current_result.returncode == 0 else None
+
+        refspecs = []
+        for ref in updated:
+            if ref.startswith('refs/heads/'):
+                branch = ref[len('refs/heads/'):]
+                refspecs.append(f"+{ref}:refs/remotes/origin/{branch}")
+                pattern = self._policy.branch_pattern
+                if all_branches and branch != current_branch and (not pattern or pattern.search(branch)):
+                    refspecs.append(f"+{ref}:{ref}")
+            elif ref.startswith('refs/tags/'):
+                refspecs.append(f"+{ref}:{ref}")
+
+        if refspecs:
+            fetch_cmd = ['git', '-C', str(repo_path), 'fetch', '--progress', 'origin'] + refspecs
+            if self._run_git(fetch_cmd, phase='fetch', timeout=self._timeout, text=False).returncode != 0:
+                return False
+
+        if current_branch and f"refs/heads/{current_branch}" in updated:
+            merge_cmd = ['git', '-C', str(repo_path), 'merge', '--ff-only', f"refs/remotes/origin/{current_branch}"]
+            if self._run_git(merge_cmd, phase='pull', timeout=self._timeout, text=False).returncode != 0:
+                return False
+
+        for ref in deleted:
+            if ref.startswith('refs/heads/'):
+                branch = ref[len('refs/heads/'):]
+                self._run_git(['git', '-C', str(repo_path), 'update-ref', '-d', f"refs/remotes/origin/{branch}"],
+                              phase='branches', timeout=10, text=False)
+                if branch != current_branch:
+                    self._run_git(['git', '-C', str(repo_path), 'branch', '-D', branch],
+                                  phase='branches', timeout=10, text=False)
+            elif ref.startswith('refs/tags/'):
+                self._run_git(['git', '-C', str(repo_path), 'tag', '-d', ref[len('refs/tags/'):]],
+                              phase='branches', timeout=10, text=False)
+
+        return self._verify_repo_health(repo_path)
+
+    def _process_refs(self, repo: RepoInfo, updated: List[str], deleted: List[str],
+                      all_branches: bool) -> Tuple[str, bool]:
+        all_branches = self._resolve_policy(repo).all_branches(all_branches)
+        repo_path = self._get_local_path(repo)
+        if not (repo_path.exists() and (repo_path / '.git').exists()):
+            if self._low_on_disk():
+                self._record.error = 'DiskFull'
+                return "CLONE", False
+            op_type, success = "CLONE", self._clone_with_retry(repo_path, repo)
+        else:
+            op_type, success = "FETCH", self._fetch_refs(repo_path, updated, deleted, all_branches)
+        if success and self.policies:
+            self.policies.mark_synced(repo)
+        return op_type, success
+
+    def sync_refs(self, repo: RepoInfo, updated: List[str], deleted: List[str],
+                  all_branches: bool = False) -> bool:
+        return self._handle_repo(repo, partial(self._process_refs, repo, updated, deleted, all_branches))
+
+    def _handle_repo(self, repo: RepoInfo, operation: Callable[[], Tuple[str, bool]],
+                     on_repo_done: Optional[Callable[[RepoInfo], None]] = None) -> bool:
+        if self.stop_event.is_set():
+            return False
+        with self.controller.slot() if self.controller else nullcontext():
+            with self.slots or nullcontext():
+                return self._handle_repo_slot(repo, operation, on_repo_done)
+
+    def _handle_repo_slot(self, repo: RepoInfo, operation: Callable[[], Tuple[str, bool]],
+                          on_repo_done: Optional[Callable[[RepoInfo], None]] = None) -> bool:
+        if self.stop_event.is_set():
+            return False
+        record = RepoRecord(full_name=repo.full_name)
+        self._local.record = record
+        repo_start = time.perf_counter()
+        repo_path = self._get_local_path(repo)
+        with self._stats_lock:
+            self._in_flight[threading.current_thread().name] = repo_path
+        if self.journal:
+            self.journal.begin(repo.full_name, repo_path)
+
+        try:
+            op_type, success = operation()
+            branches = self._count_branches(repo_path) if success and repo_path.exists() else 0
+        except Interrupted:
+            log_event('repo_interrupted', logging.WARNING, repo=repo.full_name)
+            self._local.record = None
+            self._local.policy = None
+            return False
+        except Exception as e:
+            record.error = type(e).__name__
+            op_type, success, branches = "ERROR", False, 0
+
+        record.operation = op_type.lower()
+        record.outcome = 'ok' if success else 'failed'
+        record.duration = time.perf_counter() - repo_start
+        self._local.record = None
+        self._local.policy = None
+
+        counter, failure_label = OPERATION_RESULTS.get(op_type, (None, op_type.lower()))
+        with self._stats_lock:
+            if success:
+                setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+                self.stats.total_branches += branches
+            else:
+                self.stats.failed += 1
+                self.stats.failed_repos.append(f"{repo.full_name} ({failure_label})")
+            self.stats.repo_records.append(record)
+            self._in_flight.pop(threading.current_thread().name, None)
+        if self.journal:
+            self.journal.end(repo.full_name, record.outcome)
+        if self.controller:
+            self.controller.observe(record)
+        if self._progress:
+            self._progress.end(success, record.bytes_received)
+        log_event('repo', logging.INFO if success else logging.ERROR, repo=repo.full_name,
+                  operation=record.operation, outcome=record.outcome, duration=round(record.duration, 3),
+                  retries=record.retries, bytes_received=record.bytes_received,
+                  error=None if success else record.error)
+
+        if on_repo_done:
+            on_repo_done(repo)
+        return success
+
+    def quarantine_in_flight(self):
+        with self._stats_lock:
+            in_flight = list(self._in_flight.values())
+            self._in_flight.clear()
+        for repo_path in in_flight:
+            quarantine(repo_path, self.username)
+
+    def process_repositories(self, repos: List[RepoInfo], all_branches: bool = False,
+                             on_repo_done: Optional[Callable[[RepoInfo], None]] = None) -> BackupStats:
         self.stats.start_time = datetime.now()
         self.stats.total_repos = len(repos)
 
         print(f"\n📂 Processing {len(repos)} repositories...")
         print(f"   Location: {self.user_dir}")
         print(f"   Repos: {self.repos_dir}")
+        pool_size = self.controller.max_workers if self.controller else self.workers
+        if self.controller:
+            print(f"   Workers: adaptive (starting at {self.controller.limit}, max {self.controller.max_workers})")
+        else:
+            print(f"   Workers: {self.workers}")
         if all_branches:
             print(f"   Mode: 🔄 Full branch sync (slower, clones ALL branches)\n")
         else:
             print(f"   Mode: ⚡ Fast mode (default branch only)\n")
 
-        progress = ProgressBar()
-
-        for i, repo in enumerate(repos, 1):
-            repo_path = self._get_local_path(repo)
-
-            exists = repo_path.exists() and (repo_path / '.git').exists()
-
-            if not exists:
-                op_type = "CLONE"
-                progress.update(i, self.stats.total_repos, self.stats.failed, f"{op_type} | {repo.full_name}")
-
-                success = self._clone_with_retry(repo_path, repo)
-                if success:
-                    self.stats.cloned += 1
-                else:
-                    self.stats.failed += 1
-                    self.stats.failed_repos.append(f"{repo.full_name} (clone)")
+        progress_workers = self.controller.limit if self.controller else self.workers
+        self._progress = ProgressDashboard(len(repos), workers=progress_workers, predictions=self.predictions,
+                                           interactive=False if self.shared_output else None,
+                                           label=self.username if self.shared_output else '')
+        self._progress.start([repo.full_name for repo in repos])
+        if self.controller:
+            self.controller.on_change = partial(setattr, self._progress, 'workers')
 
+        try:
+            if pool_size == 1:
+                for repo in repos:
+                    if self.stop_event.is_set():
+                        break
+                    self._handle_repo(repo, partial(self._process_repo, repo, all_branches), on_repo_done)
             else:
-                if not all_branches:
-                    needs_update = self._needs_update(repo_path, repo)
-
-                    if needs_update:
-                        op_type = "PULL "
-                        progress.update(i, self.stats.total_repos, self.stats.failed, f"{op_type} | {repo.full_name}")
-
-                        success = self._update_with_retry_fast(repo_path, repo)
-                        if success:
-                            self.stats.updated += 1
-                        else:
-                            self.stats.failed += 1
-                            self.stats.failed_repos.append(f"{repo.full_name} (update)")
-                    else:
-                        op_type = "SKIP "
-                        progress.update(i, self.stats.total_repos, self.stats.failed, f"{op_type} | {repo.full_name}")
-                        self.stats.skipped += 1
-                        success = True
-
-                else:
-                    fetch_success = self._fetch_all_branches(repo_path)
-
-                    if not fetch_success:
-                        shutil.rmtree(repo_path, ignore_errors=True)
-                        op_type = "CLONE (recover)"
-                        progress.update(i, self.stats.total_repos, self.stats.failed, f"{op_type} | {repo.full_name}")
-
-                        success = self._clone_with_retry(repo_path, repo)
-                        if success:
-                            self.stats.cloned += 1
-                        else:
-                            self.stats.failed += 1
-                            self.stats.failed_repos.append(f"{repo.full_name} (clone-recover)")
-
-                    else:
-                        needs_update = self._needs_update(repo_path, repo)
-
-                        if needs_update:
-                            op_type = "PULL "
-                            progress.update(i, self.stats.total_repos, self.stats.failed,
-                                            f"{op_type} | {repo.full_name}")
-
-                            success = self._update_with_retry(repo_path, repo)
-                            if success:
-                                self.stats.updated += 1
-                            else:
-                                self.stats.failed += 1
-                                self.stats.failed_repos.append(f"{repo.full_name} (update)")
-                        else:
-                            op_type = "SYNC "
-                            progress.update(i, self.stats.total_repos, self.stats.failed,
-                                            f"{op_type} | {repo.full_name}")
-                            self.stats.synced += 1
-                            success = True
-
-            if success and repo_path.exists():
-                self.stats.total_branches += self._count_branches(repo_path)
-
-        progress.finish("Repository processing complete!")
+                with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="repo-worker") as executor:
+                    futures = [executor.submit(self._handle_repo, repo,
+                                               partial(self._process_repo, repo, all_branches), on_repo_done)
+                               for repo in repos]
+                    for future in futures:
+                        if self.stop_event.is_set():
+                            break
+                        future.result()
+                    executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            self._progress.finish("Repository processing stopped" if self.stop_event.is_set()
+                                  else "Repository processing complete!")
+            self._progress = None
+            if self.policies:
+                self.policies.save()
+            if self.controller:
+                self.controller.on_change = None
+                self.controller.save()
+                print(f"   Concurrency settled at {self.controller.limit} workers")
 
         self.stats.end_time = datetime.now()
 
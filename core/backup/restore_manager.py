@@ -0,0 +1,232 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import os
+import shutil
+import subprocess
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.backup.archive_manifest import ArchiveManifest
+from core.config.settings import ProjectPaths
+
+COPY_BUFFER_SIZE = 1024 * 1024
+GIT_LAYOUT_DIRS = ('refs/heads', 'refs/tags', 'objects/info', 'objects/pack')
+
+
+class RestoreManager:
+    """Extracts selected repositories from an archive without reading the rest.
+
+    Zip members are located through the manifest (or the central directory
+    when there is no manifest) and extracted by parallel writers, each with
+    its own archive handle. For a differential archive every file is taken
+    from the newest archive in the chain that contains it.
+
+    Every member must stay inside the target directory: absolute names,
+    ``..`` components and paths through an existing symlink are refused,
+    and symlinks pointing outside the target are not created."""
+
+    def __init__(self, username: str, workers: Optional[int] = None):
+        self.username = username
+        self.backups_dir = ProjectPaths.get_backups_dir(username)
+        self.workers = workers or min(8, (os.cpu_count() or 1) * 2)
+        self._local = threading.local()
+        self._handles: List[zipfile.ZipFile] = []
+        self._handles_lock = threading.Lock()
+
+    def _load_chain(self, archive_path: Path) -> List[ArchiveManifest]:
+        chain = []
+        manifest = ArchiveManifest.load(ArchiveManifest.path_for(archive_path))
+        while manifest:
+            chain.append(manifest)
+            if manifest.kind == 'full' or not manifest.base:
+                break
+            base_path = self.backups_dir / manifest.base
+            manifest = ArchiveManifest.load(ArchiveManifest.path_for(base_path))
+            if manifest is None:
+                raise FileNotFoundError(f"Base archive manifest missing: {base_path.name}")
+        return chain
+
+    def _plan(self, archive_path: Path, prefix: str) -> Dict[Path, List[str]]:
+        chain = self._load_chain(archive_path)
+        if not chain:
+            if not zipfile.is_zipfile(archive_path):
+                with tarfile.open(archive_path, 'r:*') as tf:
+                    names = [m.name for m in tf if m.isreg()]
+            else:
+                with zipfile.ZipFile(archive_path) as zf:
+                    names = [n for n in zf.namelist() if not n.endswith('/')]
+            return {archive_path: [n for n in names if n.startswith(f"repositories/{prefix}")]}
+
+        plan: Dict[Path, List[str]] = {}
+        wanted = {rel for rel in chain[0].files if rel.startswith(prefix)}
+        for manifest in chain:
+            members = [rel for rel in manifest.members if rel in wanted]
+            if members:
+                plan.setdefault(self.backups_dir / manifest.archive, []).extend(
+                    f"repositories/{rel}" for rel in members
+                )
+                wanted.difference_update(members)
+        if wanted:
+            raise FileNotFoundError(f"{len(wanted)} files not found in the archive chain")
+        return plan
+
+    @staticmethod
+    def _destination(target_dir: Path, arc_name: str) -> Path:
+        rel = arc_name[len("repositories/"):]
+        parts = rel.split('/')
+        if not rel or rel.startswith('/') or '..' in parts:
+            raise ValueError(f"Unsafe archive member: {arc_name}")
+        path = target_dir
+        for part in parts[:-1]:
+            path = path / part
+            if path.is_symlink():
+                raise ValueError(f"Archive member would be written through a symlink: {arc_name}")
+        dest = target_dir / rel
+        parent = dest.parent.resolve()
+        if parent != target_dir and target_dir not in parent.parents:
+            raise ValueError(f"Archive member escapes the target directory: {arc_name}")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        return dest
+
+    @staticmethod
+    def _link_inside(target_dir: Path, dest: Path, linkname: str) -> bool:
+        if os.path.isabs(linkname):
+            return False
+        resolved = Path(os.path.normpath(dest.parent / linkname))
+        return resolved == target_dir or target_dir in resolved.parents
+
+    @staticmethod
+    def _temp_path(dest: Path) -> Path:
+        tmp_path = dest.with_name(dest.name + '.tmp')
+        if tmp_path.is_symlink():
+            tmp_path.unlink()
+        return tmp_path
+
+    def _zip_handle(self, archive_path: Path) -> zipfile.ZipFile:
+        handles = getattr(self._local, 'handles', None)
+        if handles is None:
+            handles = self._local.handles = {}
+        if archive_path not in handles:
+            handles[archive_path] = zipfile.ZipFile(archive_path)
+            with self._handles_lock:
+                self._handles.append(handles[archive_path])
+        return handles[archive_path]
+
+    def _close_handles(self):
+        with self._handles_lock:
+            handles, self._handles = self._handles, []
+        for handle in handles:
+            handle.close()
+        self._local = threading.local()
+
+    def _extract_zip_member(self, archive_path: Path, arc_name: str, target_dir: Path):
+        zf = self._zip_handle(archive_path)
+        zinfo = zf.getinfo(arc_name)
+        dest = self._destination(target_dir, arc_name)
+        tmp_path = self._temp_path(dest)
+        with zf.open(zinfo) as src, open(tmp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        mode = (zinfo.external_attr >> 16) & 0o777
+        if mode:
+            os.chmod(tmp_path, mode)
+        mtime = time.mktime(zinfo.date_time + (0, 0, -1))
+        os.utime(tmp_path, (mtime, mtime))
+        os.replace(tmp_path, dest)
+
+    def _extract_zip(self, archive_path: Path, members: List[str], target_dir: Path):
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for future in [executor.submit(self._extract_zip_member, archive_path, name, target_dir)
+                               for name in members]:
+                    future.result()
+        finally:
+            self._close_handles()
+
+    def _extract_tar(self, archive_path: Path, members: List[str], target_dir: Path):
+        remaining = set(members)
+        with tarfile.open(archive_path, 'r:*') as tf:
+            for tarinfo in tf:
+                if tarinfo.name not in remaining:
+                    continue
+                remaining.discard(tarinfo.name)
+                dest = self._destination(target_dir, tarinfo.name)
+                if tarinfo.issym():
+                    if not self._link_inside(target_dir, dest, tarinfo.linkname):
+                        print(f"   ⚠️  Skipped symlink pointing outside the target: {tarinfo.name}"
+                              f" -> {tarinfo.linkname}")
+                        continue
+                    if dest.is_symlink() or dest.exists():
+                        dest.unlink()
+                    os.symlink(tarinfo.linkname, dest)
+                    continue
+                tmp_path = self._temp_path(dest)
+                with tf.extractfile(tarinfo) as src, open(tmp_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+                os.chmod(tmp_path, tarinfo.mode & 0o777)
+                os.utime(tmp_path, (tarinfo.mtime, tarinfo.mtime))
+                os.replace(tmp_path, dest)
+                if not remaining:
+                    break
+
+    def _rebuild_repo(self, repo_dir: Path) -> bool:
+        git_dir = repo_dir / '.git'
+        if not git_dir.is_dir():
+            return True
+        for layout_dir in GIT_LAYOUT_DIRS:
+            (git_dir / layout_dir).mkdir(parents=True, exist_ok=True)
+        return self._git_ok(repo_dir)
+
+    @staticmethod
+    def _git_ok(repo_dir: Path) -> bool:
+        result = subprocess.run(
+            ['git', '-C', str(repo_dir), 'rev-parse', '--verify', 'HEAD'],
+            capture_output=True,
+            timeout=10
+        )
+        return result.returncode == 0
+
+    def restore(self, archive_path: Path, target_dir: Path, repo: Optional[str] = None) -> bool:
+        print("\n♻️  Archive Restore")
+        print(f"   Archive: {archive_path.name}")
+        print(f"   Repository: {repo or 'all'}")
+        print(f"   To: {target_dir}")
+
+        try:
+            prefix = f"{repo}/" if repo else ''
+            start = time.perf_counter()
+            plan = self._plan(archive_path, prefix)
+            total = sum(len(members) for members in plan.values())
+            if not total:
+                print(f"   ❌ Nothing to restore{f' for {repo}' if repo else ''}")
+                return False
+
+            target_dir.mkdir(parents=True, exist_ok=True)
+            target_dir = target_dir.resolve()
+            for source, members in plan.items():
+                if zipfile.is_zipfile(source):
+                    self._extract_zip(source, members, target_dir)
+                else:
+                    self._extract_tar(source, members, target_dir)
+
+            restored = {name[len("repositories/"):].split('/', 1)[0]
+                        for members in plan.values() for name in members if name.count('/') > 1}
+            repo_dirs = [target_dir / name for name in sorted(restored) if (target_dir / name).is_dir()]
+            healthy = all([self._rebuild_repo(repo_dir) for repo_dir in repo_dirs])
+
+            duration = time.perf_counter() - start
+            print(f"   ✅ Restored {total} files from {len(plan)} archive(s) in {duration:.2f}s")
+            if not healthy:
+                print("   ⚠️  Some restored repositories failed the git health check")
+            return healthy
+
+        except Exception as e:
+            print(f"   ❌ Restore failed: {e}")
+            return False
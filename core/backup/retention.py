@@ -0,0 +1,63 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+from datetime import datetime
+from typing import Iterable, List, Set
+
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+
+class GFSRetention:
+    """Grandfather-father-son retention: keep the newest snapshot of each of
+    the last ``daily`` days, ``weekly`` ISO weeks, ``monthly`` months and
+    ``yearly`` years. The newest snapshot is always kept."""
+
+    def __init__(self, daily: int = 7, weekly: int = 4, monthly: int = 12, yearly: int = 0):
+        self.daily = daily
+        self.weekly = weekly
+        self.monthly = monthly
+        self.yearly = yearly
+
+    @staticmethod
+    def parse(name: str) -> datetime:
+        return datetime.strptime(name[:19], TIMESTAMP_FORMAT)
+
+    @staticmethod
+    def _keep_newest_per_period(stamps: List[datetime], key, count: int) -> Set[datetime]:
+        kept = set()
+        seen = set()
+        for stamp in stamps:
+            if len(seen) >= count:
+                break
+            period = key(stamp)
+            if period not in seen:
+                seen.add(period)
+                kept.add(stamp)
+        return kept
+
+    def select_keep(self, stamps: Iterable[datetime]) -> Set[datetime]:
+        ordered = sorted(set(stamps), reverse=True)
+        if not ordered:
+            return set()
+
+        keep = {ordered[0]}
+        keep |= self._keep_newest_per_period(ordered, lambda d: d.date(), self.daily)
+        keep |= self._keep_newest_per_period(ordered, lambda d: d.isocalendar()[:2], self.weekly)
+        keep |= self._keep_newest_per_period(ordered, lambda d: (d.year, d.month), self.monthly)
+        keep |= self._keep_newest_per_period(ordered, lambda d: d.year, self.yearly)
+        return keep
+
+    def select_prune(self, names: Iterable[str]) -> List[str]:
+        parsed = {}
+        for name in names:
+            try:
+                parsed[name] = self.parse(name)
+            except ValueError:
+                continue
+        keep = self.select_keep(parsed.values())
+        return sorted(name for name, stamp in parsed.items() if stamp not in keep)
+
+    def describe(self) -> str:
+        return f"{self.daily} daily, {self.weekly} weekly, {self.monthly} monthly, {self.yearly} yearly"
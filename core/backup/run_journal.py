@@ -0,0 +1,141 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+import os
+import subprocess
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from core.config.settings import ProjectPaths
+
+
+def is_healthy_repo(repo_path: Path) -> bool:
+    if not (repo_path / '.git').exists():
+        return False
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(repo_path), 'rev-parse', '--verify', 'HEAD'],
+            capture_output=True,
+            timeout=10
+        )
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def quarantine(repo_path: Path, username: str) -> Optional[Path]:
+    if not repo_path.exists() or is_healthy_repo(repo_path):
+        return None
+    quarantine_dir = ProjectPaths.get_user_dir(username) / "quarantine"
+    quarantine_dir.mkdir(parents=True, exist_ok=True)
+    target = quarantine_dir / f"{repo_path.name}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+    repo_path.rename(target)
+    print(f"   🧪 Quarantined incomplete repository: {repo_path.name} -> {target}")
+    return target
+
+
+class UnfinishedRun:
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.completed: Set[str] = set()
+        self.failed: Set[str] = set()
+        self.in_flight: Dict[str, str] = {}
+
+
+class RunJournal:
+    """Write-ahead journal of the current run (``<user>/journal.jsonl``).
+
+    Each repository gets a ``begin`` entry before any git work and an
+    ``end`` entry after it, each flushed as it is written. A journal without
+    ``run_end`` belongs to an interrupted run. Its in-flight repositories
+    are quarantined if they are broken, and ``--resume`` skips the
+    repositories it already completed. The file is only truncated once the
+    previous run has finished, so an unfinished run stays on record until
+    the next run has written its own ``run_start``."""
+
+    def __init__(self, username: str):
+        self.username = username
+        self.path = ProjectPaths.get_user_dir(username) / "journal.jsonl"
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load_unfinished(self) -> Optional[UnfinishedRun]:
+        run = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    kind = entry.get('type')
+                    if kind == 'run_start':
+                        if not entry.get('resume') or run is None:
+                            run = UnfinishedRun(entry['run_id'])
+                    elif run is None:
+                        continue
+                    elif kind == 'begin':
+                        run.in_flight[entry['repo']] = entry['path']
+                    elif kind == 'end':
+                        run.in_flight.pop(entry['repo'], None)
+                        if entry.get('outcome') == 'ok':
+                            run.completed.add(entry['repo'])
+                            run.failed.discard(entry['repo'])
+                        else:
+                            run.failed.add(entry['repo'])
+                    elif kind == 'run_end':
+                        run = None
+        except OSError:
+            return None
+        return run
+
+    def recover(self) -> Optional[UnfinishedRun]:
+        run = self.load_unfinished()
+        if not run:
+            return None
+        print(f"\n⚠️ Previous run {run.run_id} did not finish "
+              f"({len(run.completed)} completed, {len(run.in_flight)} in flight)")
+        for repo_path in run.in_flight.values():
+            quarantine(Path(repo_path), self.username)
+        return run
+
+    def _write(self, entry: dict):
+        entry['ts'] = datetime.now().isoformat()
+        with self._lock:
+            if self._file:
+                self._file.write(json.dumps(entry) + '\n')
+                self._file.flush()
+
+    def start(self, total: int, resume_from: Optional[UnfinishedRun] = None):
+        append = resume_from is not None or self.load_unfinished() is not None
+        self._file = open(self.path, 'a' if append else 'w', encoding='utf-8')
+        run_id = resume_from.run_id if resume_from else datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        self._write({"type": "run_start", "run_id": run_id, "repos": total, "resume": bool(resume_from)})
+        os.fsync(self._file.fileno())
+
+    def begin(self, full_name: str, repo_path: Path):
+        self._write({"type": "begin", "repo": full_name, "path": str(repo_path)})
+
+    def end(self, full_name: str, outcome: str):
+        self._write({"type": "end", "repo": full_name, "outcome": outcome})
+
+    def interrupted(self):
+        self._write({"type": "interrupted"})
+        self.close()
+
+    def finish(self):
+        self._write({"type": "run_end"})
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
@@ -0,0 +1,62 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import hashlib
+from typing import List, Tuple
+
+from core.models import RepoInfo
+
+REPO_OVERHEAD_KB = 1024
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/N (e.g. 1/4)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', i must be between 1 and N")
+    return index, count
+
+
+def stable_hash(full_name: str) -> int:
+    return int(hashlib.sha1(full_name.lower().encode('utf-8')).hexdigest()[:16], 16)
+
+
+class ShardSelector:
+    """Splits the inventory between N independent backup nodes.
+
+    By default a repository belongs to shard ``hash(full_name) % N + 1``,
+    so the assignment only changes when N changes. With ``weighted=True``
+    repositories are dealt largest-first to the currently lightest shard,
+    by API size plus a fixed per-repository overhead. Shards then take
+    similar time, but a repository can move to another node when sizes
+    change. Every node computes the same split from the same inventory,
+    so no coordination is needed."""
+
+    def __init__(self, index: int, count: int, weighted: bool = False):
+        self.index = index
+        self.count = count
+        self.weighted = weighted
+
+    def assign(self, repos: List[RepoInfo]) -> List[List[RepoInfo]]:
+        shards: List[List[RepoInfo]] = [[] for _ in range(self.count)]
+        if not self.weighted:
+            for repo in repos:
+                shards[stable_hash(repo.full_name) % self.count].append(repo)
+            return shards
+
+        loads = [0] * self.count
+        for repo in sorted(repos, key=lambda r: (-r.size, stable_hash(r.full_name))):
+            lightest = min(range(self.count), key=lambda i: (loads[i], i))
+            shards[lightest].append(repo)
+            loads[lightest] += repo.size + REPO_OVERHEAD_KB
+        return shards
+
+    def select(self, repos: List[RepoInfo]) -> List[RepoInfo]:
+        return self.assign(repos)[self.index - 1]
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
@@ -0,0 +1,123 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from core.backup.retention import GFSRetention, TIMESTAMP_FORMAT
+from core.config.settings import ProjectPaths
+
+IN_PROGRESS_SUFFIX = '.partial'
+
+
+class SnapshotManager:
+    """Hardlink snapshots under ``backups/snapshots/<timestamp>``, the way
+    ``rsync --link-dest`` does it: files unchanged since the previous
+    snapshot (same size and mtime) are hardlinked, everything else is copied.
+    Each snapshot is a complete tree, so restoring is a plain copy."""
+
+    def __init__(self, username: str, retention: Optional[GFSRetention] = None):
+        self.username = username
+        self.repos_dir = ProjectPaths.get_repos_dir(username)
+        self.snapshots_dir = ProjectPaths.get_backups_dir(username) / "snapshots"
+        self.retention = retention or GFSRetention()
+
+    def list_snapshots(self) -> List[str]:
+        if not self.snapshots_dir.exists():
+            return []
+        return sorted(
+            p.name for p in self.snapshots_dir.iterdir()
+            if p.is_dir() and not p.name.endswith(IN_PROGRESS_SUFFIX)
+        )
+
+    def create_snapshot(self) -> Optional[Path]:
+        print("\n🔗 Hardlink Snapshot")
+
+        if not self.repos_dir.exists():
+            print("   ❌ Repositories directory does not exist")
+            return None
+
+        work_path = None
+        try:
+            self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+            self._remove_stale()
+            snapshots = self.list_snapshots()
+            link_dest = self.snapshots_dir / snapshots[-1] if snapshots else None
+
+            snapshot_name = datetime.now().strftime(TIMESTAMP_FORMAT)
+            snapshot_path = self.snapshots_dir / snapshot_name
+            work_path = self.snapshots_dir / f"{snapshot_name}{IN_PROGRESS_SUFFIX}"
+
+            print(f"   Creating snapshot: {snapshot_name}")
+            if link_dest:
+                print(f"   Link base: {link_dest.name}")
+
+            linked = 0
+            copied = 0
+            copied_bytes = 0
+
+            for root, _, files in os.walk(self.repos_dir):
+                rel_root = Path(root).relative_to(self.repos_dir)
+                (work_path / rel_root).mkdir(parents=True, exist_ok=True)
+
+                for file in files:
+                    src = Path(root) / file
+                    dest = work_path / rel_root / file
+
+                    if src.is_symlink():
+                        os.symlink(os.readlink(src), dest)
+                        continue
+
+                    if link_dest and self._unchanged(src, link_dest / rel_root / file):
+                        try:
+                            os.link(link_dest / rel_root / file, dest)
+                            linked += 1
+                            continue
+                        except OSError:
+                            pass
+
+                    shutil.copy2(src, dest)
+                    copied += 1
+                    copied_bytes += dest.stat().st_size
+
+            work_path.rename(snapshot_path)
+
+            print(f"   ✅ Snapshot created: {snapshot_path}")
+            print(f"   🔗 Linked: {linked} files, 📄 copied: {copied} files "
+                  f"({copied_bytes / (1024 * 1024):.2f} MB)")
+
+            self.apply_retention()
+            return snapshot_path
+
+        except Exception as e:
+            if work_path is not None:
+                shutil.rmtree(work_path, ignore_errors=True)
+            print(f"   ❌ Snapshot creation failed: {e}")
+            return None
+
+    def _remove_stale(self):
+        for path in self.snapshots_dir.glob(f"*{IN_PROGRESS_SUFFIX}"):
+            print(f"   🧹 Removing unfinished snapshot: {path.name}")
+            shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _unchanged(src: Path, previous: Path) -> bool:
+        try:
+            src_stat = src.stat()
+            prev_stat = previous.lstat()
+        except OSError:
+            return False
+        return src_stat.st_size == prev_stat.st_size and src_stat.st_mtime_ns == prev_stat.st_mtime_ns
+
+    def apply_retention(self) -> List[str]:
+        to_prune = self.retention.select_prune(self.list_snapshots())
+        for name in to_prune:
+            shutil.rmtree(self.snapshots_dir / name, ignore_errors=True)
+        if to_prune:
+            print(f"   🧹 Pruned {len(to_prune)} snapshots (retention: {self.retention.describe()})")
+        return to_prune
@@ -0,0 +1,167 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional
+
+from core.config.settings import ProjectPaths
+from core.models import RepoInfo
+
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+RULE_KEYS = ('branches', 'clone_filter', 'depth', 'timeout', 'min_interval', 'archived')
+
+
+def parse_duration(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*', str(value))
+    if not match:
+        raise ValueError(f"Invalid duration '{value}', expected e.g. 90, 30m, 6h or 7d")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2) or 's']
+
+
+@dataclass
+class RepoPolicy:
+    branches: Optional[str] = None
+    branch_pattern: Optional[re.Pattern] = None
+    clone_filter: Optional[str] = None
+    depth: Optional[int] = None
+    timeout: Optional[int] = None
+    min_interval: Optional[float] = None
+    archived_check_once: bool = False
+
+    def all_branches(self, default: bool) -> bool:
+        return default if self.branches is None else self.branches != 'default'
+
+
+class SyncPolicies:
+    """Per-repository sync rules from ``<user>/policy.json``.
+
+    Rules are checked in file order and every key takes its value from the
+    first matching rule that sets it, so a trailing ``"*"`` rule can hold
+    defaults. ``match`` globs containing ``/`` are matched against
+    ``owner/name``, others against the name. The last successful sync of
+    each repository is kept in ``policy_state.json`` for ``min_interval``
+    and ``"archived": "check-once"``."""
+
+    FILE_NAME = "policy.json"
+    STATE_FILE_NAME = "policy_state.json"
+
+    def __init__(self, username: str, rules: Optional[List[dict]] = None):
+        user_dir = ProjectPaths.get_user_dir(username)
+        self.path = user_dir / self.FILE_NAME
+        self.state_path = user_dir / self.STATE_FILE_NAME
+        self.rules = [self._validate(rule, i) for i, rule in enumerate(rules or [], 1)]
+        self.state: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load_state()
+
+    @classmethod
+    def load(cls, username: str) -> Optional['SyncPolicies']:
+        path = ProjectPaths.get_user_dir(username) / cls.FILE_NAME
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Cannot read {path}: {e}")
+        rules = data.get('rules') if isinstance(data, dict) else None
+        if not isinstance(rules, list):
+            raise ValueError(f"{path}: expected {{\"rules\": [...]}}")
+        policies = cls(username, rules)
+        print(f"\n📜 Sync policy: {len(policies.rules)} rules from {path}")
+        return policies
+
+    @staticmethod
+    def _validate(rule: dict, index: int) -> dict:
+        if not isinstance(rule, dict) or not isinstance(rule.get('match'), str):
+            raise ValueError(f"policy rule {index}: 'match' pattern is required")
+        unknown = set(rule) - set(RULE_KEYS) - {'match'}
+        if unknown:
+            raise ValueError(f"policy rule {index}: unknown keys {', '.join(sorted(unknown))}")
+        rule = dict(rule)
+        branches = rule.get('branches')
+        if branches is not None:
+            if not isinstance(branches, str) or branches not in ('default', 'all') \
+                    and not branches.startswith('regex:'):
+                raise ValueError(f"policy rule {index}: branches must be 'default', 'all' or 'regex:<pattern>'")
+            if branches.startswith('regex:'):
+                try:
+                    rule['branch_pattern'] = re.compile(branches[len('regex:'):])
+                except re.error as e:
+                    raise ValueError(f"policy rule {index}: invalid branch regex: {e}")
+        if rule.get('archived') not in (None, 'sync', 'check-once'):
+            raise ValueError(f"policy rule {index}: archived must be 'sync' or 'check-once'")
+        for key in ('depth', 'timeout'):
+            if rule.get(key) is not None and (not isinstance(rule[key], int) or rule[key] < 1):
+                raise ValueError(f"policy rule {index}: {key} must be a positive integer")
+        if rule.get('min_interval') is not None:
+            try:
+                rule['min_interval'] = parse_duration(rule['min_interval'])
+            except ValueError as e:
+                raise ValueError(f"policy rule {index}: {e}")
+        return rule
+
+    @staticmethod
+    def _matches(repo: RepoInfo, pattern: str) -> bool:
+        target = repo.full_name if '/' in pattern else repo.name
+        return fnmatchcase(target.lower(), pattern.lower())
+
+    def resolve(self, repo: RepoInfo) -> RepoPolicy:
+        values = {}
+        for rule in self.rules:
+            if self._matches(repo, rule['match']):
+                for key in RULE_KEYS:
+                    if key in rule and key not in values:
+                        values[key] = rule[key]
+                        if key == 'branches':
+                            values['branch_pattern'] = rule.get('branch_pattern')
+        return RepoPolicy(
+            branches='regex' if values.get('branch_pattern') else values.get('branches'),
+            branch_pattern=values.get('branch_pattern'),
+            clone_filter=values.get('clone_filter'),
+            depth=values.get('depth'),
+            timeout=values.get('timeout'),
+            min_interval=values.get('min_interval'),
+            archived_check_once=values.get('archived') == 'check-once'
+        )
+
+    def skip_reason(self, repo: RepoInfo, policy: RepoPolicy, now: Optional[float] = None) -> Optional[str]:
+        with self._lock:
+            state = self.state.get(repo.full_name)
+        if not state:
+            return None
+        if policy.archived_check_once and repo.archived and state.get('pushed_at') == repo.pushed_at:
+            return 'archived'
+        if policy.min_interval and (now or time.time()) - state.get('synced', 0) < policy.min_interval:
+            return 'min_interval'
+        return None
+
+    def mark_synced(self, repo: RepoInfo, now: Optional[float] = None):
+        with self._lock:
+            self.state[repo.full_name] = {"synced": now or time.time(), "pushed_at": repo.pushed_at}
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            self.state = {}
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self.state, indent=2)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        try:
+            tmp_path.write_text(data, encoding='utf-8')
+            tmp_path.replace(self.state_path)
+        except OSError as e:
+            print(f"   ❌ Failed to save policy state: {e}")
@@ -0,0 +1,111 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from core.models import RepoInfo
+from core.utils.events import log_event
+
+
+class _PendingSync:
+
+    def __init__(self, repo: RepoInfo, now: float):
+        self.repo = repo
+        self.updated: Set[str] = set()
+        self.deleted: Set[str] = set()
+        self.first_seen = now
+        self.due_at = now
+
+
+class SyncQueue:
+    """Debounced, coalescing queue of targeted repository syncs.
+
+    Events for the same repository are merged into one pending sync that
+    runs ``debounce`` seconds after the last event. Bursts are capped at
+    ``max_delay`` after the first one. A repository is never synced by two
+    workers at once; events that arrive during a sync queue a follow-up."""
+
+    def __init__(self, handler: Callable[[RepoInfo, List[str], List[str]], None],
+                 debounce: float = 5.0, max_delay: float = 60.0, workers: int = 1):
+        self.handler = handler
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.workers = max(1, workers)
+        self._pending: Dict[str, _PendingSync] = {}
+        self._in_flight: Set[str] = set()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._threads: List[threading.Thread] = []
+
+    def add(self, repo: RepoInfo, updated: List[str], deleted: List[str]):
+        now = time.monotonic()
+        with self._condition:
+            pending = self._pending.get(repo.full_name)
+            if pending is None:
+                pending = self._pending[repo.full_name] = _PendingSync(repo, now)
+            pending.repo = repo
+            pending.updated.difference_update(deleted)
+            pending.deleted.difference_update(updated)
+            pending.updated.update(updated)
+            pending.deleted.update(deleted)
+            pending.due_at = min(now + self.debounce, pending.first_seen + self.max_delay)
+            self._condition.notify_all()
+
+    def _next_ready(self) -> Optional[_PendingSync]:
+        with self._condition:
+            while not self._stopped:
+                now = time.monotonic()
+                ready = [p for name, p in self._pending.items()
+                         if p.due_at <= now and name not in self._in_flight]
+                if ready:
+                    pending = min(ready, key=lambda p: p.due_at)
+                    del self._pending[pending.repo.full_name]
+                    self._in_flight.add(pending.repo.full_name)
+                    return pending
+                waiting = [p.due_at for name, p in self._pending.items() if name not in self._in_flight]
+                self._condition.wait(max(0.05, min(waiting) - now) if waiting else None)
+            return None
+
+    def _worker(self):
+        while True:
+            pending = self._next_ready()
+            if pending is None:
+                return
+            try:
+                self.handler(pending.repo, sorted(pending.updated), sorted(pending.deleted))
+            except Exception as e:
+                log_event('sync_error', logging.ERROR, repo=pending.repo.full_name, error=f"{type(e).__name__}: {e}")
+            finally:
+                with self._condition:
+                    self._in_flight.discard(pending.repo.full_name)
+                    self._condition.notify_all()
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"sync-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending) + len(self._in_flight)
+
+    def stop(self, drain: bool = True, timeout: Optional[float] = None):
+        if drain:
+            deadline = time.monotonic() + timeout if timeout else None
+            while self.pending_count() and (deadline is None or time.monotonic() < deadline):
+                with self._condition:
+                    for pending in self._pending.values():
+                        pending.due_at = 0
+                    self._condition.notify_all()
+                time.sleep(0.1)
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
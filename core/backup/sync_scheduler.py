@@ -0,0 +1,110 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Callable, Dict, List, Optional
+
+from core.models import RepoInfo
+
+MAX_PUSH_HISTORY = 10
+
+
+class SyncScheduler:
+    """Activity-weighted sync schedule for daemon mode.
+
+    Every repository is synced again after ``factor`` times its typical gap
+    between pushes, clamped to ``[min_interval, max_interval]``. A repository
+    pushed every hour is synced every 15 minutes and a dormant one once a
+    day. A push seen in the inventory makes the repository due at once. The
+    first sync of repositories that are already cloned is spread over their
+    interval by a stable hash, which avoids one big spike. State is kept in
+    ``scheduler_state.json`` so it survives restarts."""
+
+    def __init__(self, state_path: Path, min_interval: float = 300, max_interval: float = 86400,
+                 factor: float = 0.25):
+        self.state_path = state_path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.state: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        tmp_path.replace(self.state_path)
+
+    @staticmethod
+    def _timestamp(pushed_at: Optional[str]) -> float:
+        if not pushed_at:
+            return 0.0
+        return datetime.fromisoformat(pushed_at.replace('Z', '+00:00')).timestamp()
+
+    @staticmethod
+    def _spread(full_name: str) -> float:
+        return int(hashlib.sha1(full_name.encode('utf-8')).hexdigest()[:8], 16) / 0xFFFFFFFF
+
+    def interval(self, full_name: str, now: float) -> float:
+        pushes = self.state.get(full_name, {}).get('pushes', [])
+        if len(pushes) >= 2:
+            gap = median(b - a for a, b in zip(pushes, pushes[1:]))
+        elif pushes:
+            gap = now - pushes[-1]
+        else:
+            gap = self.max_interval / self.factor
+        return min(max(gap * self.factor, self.min_interval), self.max_interval)
+
+    def update_inventory(self, repos: List[RepoInfo], now: float, is_present: Callable[[RepoInfo], bool]):
+        names = set()
+        for repo in repos:
+            names.add(repo.full_name)
+            pushed = self._timestamp(repo.pushed_at)
+            entry = self.state.get(repo.full_name)
+
+            if entry is None:
+                entry = self.state[repo.full_name] = {"pushes": [pushed] if pushed else [], "last_sync": 0}
+                if is_present(repo):
+                    entry["next_due"] = now + self._spread(repo.full_name) * self.interval(repo.full_name, now)
+                else:
+                    entry["next_due"] = now
+                continue
+
+            if pushed and (not entry["pushes"] or pushed > entry["pushes"][-1]):
+                entry["pushes"] = (entry["pushes"] + [pushed])[-MAX_PUSH_HISTORY:]
+                if pushed > entry.get("last_sync", 0):
+                    entry["next_due"] = now
+
+        for full_name in set(self.state) - names:
+            del self.state[full_name]
+
+    def due(self, now: float) -> List[str]:
+        due = [name for name, entry in self.state.items() if entry.get("next_due", 0) <= now]
+        return sorted(due, key=lambda name: self.state[name].get("next_due", 0))
+
+    def mark_synced(self, full_name: str, success: bool, now: float):
+        entry = self.state.get(full_name)
+        if entry is None:
+            return
+        interval = self.interval(full_name, now)
+        if success:
+            entry["last_sync"] = now
+        else:
+            interval = min(interval, self.min_interval * 2)
+        entry["next_due"] = now + interval
+
+    def next_due(self) -> Optional[float]:
+        times = [entry.get("next_due", 0) for entry in self.state.values()]
+        return min(times) if times else None
@@ -5,6 +5,8 @@
 # --------------------------------------------------------
 import argparse
 
+from core.backup.archive_formats import ARCHIVE_FORMATS
+
 
 class ArgumentsManager:
     def __init__(self):
@@ -46,18 +48,437 @@ class ArgumentsManager:
             default=True,
             help="Disable backup archive creation"
         )
+        parser.add_argument(
+            "--archive-format",
+            choices=list(ARCHIVE_FORMATS),
+            default="zip",
+            help="Archive format: zip, tar.xz or tar.zst (tar.zst needs compression.zstd) (default: zip)"
+        )
+        parser.add_argument(
+            "--archive-mode",
+            choices=["full", "diff", "store", "snapshot"],
+            default="full",
+            help="full: archive the whole tree; diff: only files changed since the previous archive; "
+                 "store: deduplicated snapshot in backups/store; "
+                 "snapshot: hardlink snapshot in backups/snapshots (default: full)"
+        )
+        parser.add_argument(
+            "--full-every",
+            type=int,
+            default=7,
+            help="In diff mode, create a full archive after this many archives in a chain (default: 7)"
+        )
+        parser.add_argument(
+            "--compression-level",
+            type=int,
+            default=None,
+            help="Compression level for the selected archive format (default: format specific)"
+        )
         parser.add_argument(
             "--timeout",
             type=int,
             default=30,
             help="Timeout for git operations in seconds (default: 30)"
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of repositories processed in parallel (default: 1)"
+        )
+        parser.add_argument(
+            "--adaptive-workers",
+            action="store_true",
+            help="Tune the number of parallel repositories at runtime from observed throughput, starting from "
+                 "--workers or the level the previous run settled at"
+        )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=16,
+            help="Upper bound for --adaptive-workers (default: 16)"
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue an interrupted run, skipping repositories it already completed"
+        )
         parser.add_argument(
             "--all-branches",
             action="store_true",
             help="Enable full branch synchronization (slower, but clones ALL branches)"
         )
 
+        parser.add_argument(
+            "--trace",
+            metavar="FILE",
+            help="Write a Chrome/Perfetto trace-event JSON of every git subprocess and HTTP request"
+        )
+
+        accounts_group = parser.add_argument_group("accounts")
+        accounts_group.add_argument(
+            "--account",
+            metavar="LOGIN",
+            help="Use this configured account (with -t: update or add its token; default: the first one)"
+        )
+        accounts_group.add_argument(
+            "--all-accounts",
+            action="store_true",
+            help="Back up every configured account concurrently; --workers caps repositories in flight in total"
+        )
+
+        selection_group = parser.add_argument_group("repository selection")
+        selection_group.add_argument(
+            "--include-owner",
+            action="append",
+            metavar="OWNER",
+            help="Back up only repositories of this user or org (repeatable); other orgs are not listed at all"
+        )
+        selection_group.add_argument(
+            "--exclude-owner",
+            action="append",
+            metavar="OWNER",
+            help="Skip repositories of this user or org (repeatable)"
+        )
+        selection_group.add_argument(
+            "--include",
+            action="append",
+            metavar="GLOB",
+            help="Back up only matching repositories (repeatable); 'owner/name' globs match the full name, "
+                 "others the name"
+        )
+        selection_group.add_argument(
+            "--exclude",
+            action="append",
+            metavar="GLOB",
+            help="Skip matching repositories (repeatable)"
+        )
+        selection_group.add_argument(
+            "--repos-from",
+            metavar="FILE",
+            help="Back up only repositories listed in FILE, one name or glob per line ('#' starts a comment)"
+        )
+        selection_group.add_argument(
+            "--visibility",
+            choices=["all", "public", "private"],
+            default="all",
+            help="Repository visibility to back up (default: all)"
+        )
+        selection_group.add_argument(
+            "--forks",
+            choices=["include", "exclude", "only"],
+            default="include",
+            help="Forks (default: include)"
+        )
+        selection_group.add_argument(
+            "--archived",
+            choices=["include", "exclude", "only"],
+            default="include",
+            help="Archived repositories (default: include)"
+        )
+        selection_group.add_argument(
+            "--topic",
+            action="append",
+            metavar="TOPIC",
+            help="Back up only repositories with at least one of these topics (repeatable)"
+        )
+        selection_group.add_argument(
+            "--exclude-topic",
+            action="append",
+            metavar="TOPIC",
+            help="Skip repositories with this topic (repeatable)"
+        )
+        selection_group.add_argument(
+            "--max-size",
+            type=float,
+            metavar="MB",
+            help="Skip repositories larger than MB, by the size GitHub reports"
+        )
+
+        limits_group = parser.add_argument_group("resource limits")
+        limits_group.add_argument(
+            "--bandwidth",
+            metavar="RATE",
+            help="Cap the combined transfer rate of all git processes, in bytes/s (e.g. 500K, 20M)"
+        )
+        limits_group.add_argument(
+            "--nice",
+            type=int,
+            metavar="N",
+            help="Lower the CPU priority of the backup, git and compression by N (1-19)"
+        )
+        limits_group.add_argument(
+            "--ionice",
+            choices=["idle", "low"],
+            help="Lower the disk I/O priority: idle (only when the disk is otherwise unused) or low (Linux)"
+        )
+
+        disk_group = parser.add_argument_group("disk space")
+        disk_group.add_argument(
+            "--disk-check",
+            choices=["refuse", "fit", "off"],
+            default="refuse",
+            help="When the estimated space is not available: refuse to start, or fit updates and the smallest"
+                 " new clones and defer the rest (default: refuse)"
+        )
+        disk_group.add_argument(
+            "--min-free",
+            default="1G",
+            metavar="SIZE",
+            help="Free space to keep on the volume; new clones stop below it (default: 1G)"
+        )
+
+        maintenance_group = parser.add_argument_group("maintenance")
+        maintenance_group.add_argument(
+            "--maintenance",
+            action="store_true",
+            help="Repack, pack refs and write commit-graph/multi-pack-index for repositories that need it"
+                 " (after the backup with -r, otherwise on its own)"
+        )
+        maintenance_group.add_argument(
+            "--maintenance-budget",
+            type=int,
+            default=600,
+            metavar="SECONDS",
+            help="Start no new repository after this many seconds; the rest wait for the next run (default: 600)"
+        )
+        maintenance_group.add_argument(
+            "--maintenance-loose",
+            type=int,
+            default=1000,
+            metavar="N",
+            help="Maintain a repository with at least N loose objects (default: 1000)"
+        )
+        maintenance_group.add_argument(
+            "--maintenance-packs",
+            type=int,
+            default=20,
+            metavar="N",
+            help="Maintain a repository with at least N packs, using a geometric repack (default: 20)"
+        )
+        maintenance_group.add_argument(
+            "--maintenance-days",
+            type=float,
+            default=30,
+            metavar="DAYS",
+            help="Maintain a repository not maintained for this many days (default: 30)"
+        )
+
+        shard_group = parser.add_argument_group("sharding")
+        shard_group.add_argument(
+            "--shard",
+            metavar="I/N",
+            help="Back up only shard I of N (1-based), assigned by a stable hash of the repository name"
+        )
+        shard_group.add_argument(
+            "--shard-weighted",
+            action="store_true",
+            help="Balance shards by repository size instead of hashing (all nodes must use it)"
+        )
+        shard_group.add_argument(
+            "--merge-reports",
+            nargs="+",
+            metavar="FILE",
+            help="Merge backup_report_*.json files from several nodes into one fleet-wide report"
+        )
+        shard_group.add_argument(
+            "--merge-output",
+            metavar="FILE",
+            help="Path of the merged report (default: fleet_report_<timestamp>.json in the current directory)"
+        )
+
+        logging_group = parser.add_argument_group("logging")
+        logging_group.add_argument(
+            "--log-format",
+            choices=["text", "json"],
+            default="text",
+            help="text: interactive console output; json: one JSON event per line on stdout "
+                 "for unattended runs (default: text)"
+        )
+        logging_group.add_argument(
+            "--log-level",
+            choices=["debug", "info", "warning", "error"],
+            default="info",
+            help="Minimum level of JSON events; debug adds every git command and API request (default: info)"
+        )
+
+        metrics_group = parser.add_argument_group("metrics")
+        metrics_group.add_argument(
+            "--metrics-file",
+            metavar="FILE",
+            help="Write Prometheus metrics at the end of the run (e.g. a node_exporter textfile *.prom)"
+        )
+        metrics_group.add_argument(
+            "--metrics-port",
+            type=int,
+            default=None,
+            metavar="PORT",
+            help="Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics during the run"
+        )
+
+        metrics_group.add_argument(
+            "--stats",
+            action="store_true",
+            help="Show run history trends, growing and chronically failing repositories"
+        )
+
+        daemon_group = parser.add_argument_group("daemon")
+        daemon_group.add_argument(
+            "--daemon",
+            action="store_true",
+            help="Keep running: refresh the inventory periodically and sync each repository "
+                 "on an activity-weighted schedule"
+        )
+        daemon_group.add_argument(
+            "--refresh-interval",
+            type=int,
+            default=300,
+            help="Daemon: seconds between inventory refreshes (default: 300)"
+        )
+        daemon_group.add_argument(
+            "--min-interval",
+            type=int,
+            default=300,
+            help="Daemon: shortest sync interval for very active repositories in seconds (default: 300)"
+        )
+        daemon_group.add_argument(
+            "--max-interval",
+            type=int,
+            default=86400,
+            help="Daemon: longest sync interval for dormant repositories in seconds (default: 86400)"
+        )
+
+        webhook_group = parser.add_argument_group("webhook receiver")
+        webhook_group.add_argument(
+            "--webhook",
+            type=int,
+            metavar="PORT",
+            help="Listen for GitHub push/create/delete/repository webhooks on PORT and sync only "
+                 "the affected repository and refs"
+        )
+        webhook_group.add_argument(
+            "--webhook-host",
+            default="127.0.0.1",
+            help="Address the webhook receiver binds to (default: 127.0.0.1)"
+        )
+        webhook_group.add_argument(
+            "--webhook-secret",
+            help="Webhook secret used to validate X-Hub-Signature-256 (default: $GITHUB_WEBHOOK_SECRET)"
+        )
+        webhook_group.add_argument(
+            "--debounce",
+            type=float,
+            default=5.0,
+            help="Seconds to wait for more events for the same repository before syncing (default: 5)"
+        )
+
+        verify_group = parser.add_argument_group("archive verification")
+        verify_group.add_argument(
+            "--verify",
+            nargs="?",
+            const="latest",
+            metavar="ARCHIVE",
+            help="Verify an archive against its manifest (default: latest); with -r, verify the new archive"
+        )
+        verify_group.add_argument(
+            "--verify-mode",
+            choices=["auto", "sample", "full"],
+            default="auto",
+            help="auto: full verification every --verify-full-days, otherwise a sample (default: auto)"
+        )
+        verify_group.add_argument(
+            "--verify-sample",
+            type=float,
+            default=0.05,
+            help="Fraction of members checked by sample verification (default: 0.05)"
+        )
+        verify_group.add_argument(
+            "--verify-full-days",
+            type=int,
+            default=7,
+            help="Days between full verifications in auto mode (default: 7)"
+        )
+        verify_group.add_argument(
+            "--verify-workers",
+            type=int,
+            default=None,
+            help="Parallel verification processes (default: CPU count)"
+        )
+
+        retention_group = parser.add_argument_group("snapshot retention")
+        retention_group.add_argument(
+            "--keep-daily",
+            type=int,
+            default=7,
+            help="Hardlink snapshots: keep the newest snapshot of this many days (default: 7)"
+        )
+        retention_group.add_argument(
+            "--keep-weekly",
+            type=int,
+            default=4,
+            help="Hardlink snapshots: keep the newest snapshot of this many weeks (default: 4)"
+        )
+        retention_group.add_argument(
+            "--keep-monthly",
+            type=int,
+            default=12,
+            help="Hardlink snapshots: keep the newest snapshot of this many months (default: 12)"
+        )
+        retention_group.add_argument(
+            "--keep-yearly",
+            type=int,
+            default=0,
+            help="Hardlink snapshots: keep the newest snapshot of this many years (default: 0)"
+        )
+
+        store_group = parser.add_argument_group("deduplicated store")
+        store_group.add_argument(
+            "--store-list",
+            action="store_true",
+            help="List snapshots in the deduplicated store"
+        )
+        store_group.add_argument(
+            "--store-restore",
+            metavar="SNAPSHOT",
+            help="Restore a snapshot from the deduplicated store"
+        )
+        store_group.add_argument(
+            "--store-prune",
+            action="store_true",
+            help="Remove old snapshots and garbage-collect unreferenced chunks"
+        )
+        store_group.add_argument(
+            "--keep-last",
+            type=int,
+            default=30,
+            help="Number of most recent snapshots kept by --store-prune (default: 30)"
+        )
+
+        restore_group = parser.add_argument_group("restore")
+        restore_group.add_argument(
+            "--restore",
+            nargs="?",
+            const="latest",
+            metavar="ARCHIVE",
+            help="Restore from an archive (default: latest; differential chains are resolved)"
+        )
+        restore_group.add_argument(
+            "--restore-repo",
+            metavar="NAME",
+            help="Restore only this repository (with --restore or --store-restore)"
+        )
+        restore_group.add_argument(
+            "--restore-to",
+            metavar="DIR",
+            help="Directory to restore into (default: <user>/restored/<archive or snapshot>)"
+        )
+        restore_group.add_argument(
+            "--restore-workers",
+            type=int,
+            default=None,
+            help="Parallel writers used to extract zip members (default: 2x CPU count, max 8)"
+        )
+
         power_group = parser.add_mutually_exclusive_group()
         power_group.add_argument(
             "--shutdown",
@@ -86,6 +507,30 @@ class ArgumentsManager:
         print("\nParsed arguments:")
         print(f"   Backup: {', '.join(backup_items) if backup_items else 'None'}")
         print(f"   Timeout: {args.timeout}s")
+        if args.adaptive_workers:
+            print(f"   Workers: adaptive (up to {args.max_workers})")
+        else:
+            print(f"   Workers: {args.workers}")
+        if args.all_accounts:
+            print("   Accounts: all configured")
+        elif args.account:
+            print(f"   Account: {args.account}")
+        if args.shard:
+            print(f"   Shard: {args.shard}{' (size weighted)' if args.shard_weighted else ''}")
+        if args.archive:
+            level = args.compression_level if args.compression_level is not None else 'default'
+            print(f"   Archive format: {args.archive_format} (level {level})")
+            if args.archive_mode == 'diff':
+                print(f"   Archive mode: differential (full every {args.full_every})")
+            elif args.archive_mode == 'store':
+                print("   Archive mode: deduplicated store")
+            elif args.archive_mode == 'snapshot':
+                print(f"   Archive mode: hardlink snapshot (keep {args.keep_daily}d/{args.keep_weekly}w/"
+                      f"{args.keep_monthly}m/{args.keep_yearly}y)")
+        if args.bandwidth:
+            print(f"   Bandwidth: {args.bandwidth}/s")
+        if args.repos and args.disk_check != 'refuse':
+            print(f"   Disk check: {args.disk_check}")
         if args.all_branches:
             print("   Branches: 🔄 ALL branches (slower mode)")
         else:
@@ -6,21 +6,29 @@
 import urllib.request
 import urllib.error
 import json
+import logging
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from ..models import RepoInfo
+from ..utils.events import log_event
+from ..utils.tracing import NULL_TRACER
 
 
 class GitHubAPIClient:
+    DEFAULT_BASE_URL = 'https://api.github.com'
 
-    def __init__(self, token: str, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, token: str, timeout: int = 30, max_retries: int = 3, tracer=None,
+                 base_url: Optional[str] = None):
         self.token = token
+        self.tracer = tracer or NULL_TRACER
         self.timeout = timeout
         self.max_retries = max_retries
-        self.base_url = 'https://api.github.com'
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip('/')
         self.login = None
         self._rate_limit_remaining = 5000
         self._rate_limit_reset = 0
+        self._etag_cache: Dict[str, Tuple[str, object]] = {}
+        self.repo_filter = None
 
     def _create_request(self, url: str):
         req = urllib.request.Request(url)
@@ -37,56 +45,86 @@ class GitHubAPIClient:
                 time.sleep(wait_time + 5)
 
     def _make_request(self, url: str) -> Optional[Dict]:
+        endpoint = url.split('?')[0].replace(self.base_url, '')
         for attempt in range(self.max_retries):
+            attempt_info = f"attempt {attempt + 1}/{self.max_retries}"
+            start_time = time.perf_counter()
+            error = None
             try:
                 self._check_rate_limit()
 
-                print(f"   Attempt {attempt + 1}/{self.max_retries}...", end=' ')
-
                 req = self._create_request(url)
-
-                start_time = time.time()
-                with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                    request_time = time.time() - start_time
-
-                    self._rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
-                    self._rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
-
-                    if response.status == 200:
-                        print(f"✅ ({request_time:.1f}s)")
-                        data = json.loads(response.read().decode('utf-8'))
-                        return data
-                    else:
-                        print(f"❌ HTTP {response.status}")
+                cached = self._etag_cache.get(url)
+                if cached:
+                    req.add_header('If-None-Match', cached[0])
+
+                with self.tracer.span(f"GET {endpoint}", "http", url=url, attempt=attempt + 1) as span:
+                    try:
+                        with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                            span['status'] = response.status
+
+                            self._rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
+                            self._rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
+
+                            if response.status == 200:
+                                data = json.loads(response.read().decode('utf-8'))
+                                etag = response.headers.get('ETag')
+                                if etag:
+                                    self._etag_cache[url] = (etag, data)
+                                log_event('http_request', logging.DEBUG, endpoint=endpoint, status=200,
+                                          attempt=attempt + 1,
+                                          duration=round(time.perf_counter() - start_time, 3),
+                                          rate_limit_remaining=self._rate_limit_remaining)
+                                return data
+                            else:
+                                error = f"HTTP {response.status}"
+                                print(f"   ❌ {endpoint}: HTTP {response.status} ({attempt_info})")
+                    except urllib.error.HTTPError as e:
+                        span['status'] = e.code
+                        if e.code == 304 and cached:
+                            log_event('http_request', logging.DEBUG, endpoint=endpoint, status=304,
+                                      attempt=attempt + 1, duration=round(time.perf_counter() - start_time, 3))
+                            return cached[1]
+                        raise
 
             except urllib.error.HTTPError as e:
+                error = f"HTTP {e.code}"
                 if e.code == 403 and 'rate limit' in str(e).lower():
-                    print("⚠️ Rate limit hit")
+                    print(f"   ⚠️ {endpoint}: rate limit hit ({attempt_info})")
                     reset_time = int(e.headers.get('X-RateLimit-Reset', 0))
                     wait_time = max(0, reset_time - time.time())
                     if wait_time > 0:
                         print(f"   Waiting {wait_time / 60:.1f} minutes...")
                         time.sleep(wait_time + 5)
                 elif e.code == 401:
-                    print("❌ Unauthorized - invalid token")
+                    print(f"   ❌ {endpoint}: unauthorized - invalid token")
+                    log_event('http_failed', logging.ERROR, endpoint=endpoint, error=error)
                     return None
                 else:
-                    print(f"❌ HTTP {e.code}")
+                    print(f"   ❌ {endpoint}: HTTP {e.code} ({attempt_info})")
 
             except urllib.error.URLError as e:
-                print(f"🔌 Connection error: {e.reason}")
+                error = type(e).__name__
+                print(f"   🔌 {endpoint}: connection error: {e.reason} ({attempt_info})")
 
-            except TimeoutError:
-                print(f"⏱️ Timeout")
+            except TimeoutError as e:
+                error = type(e).__name__
+                print(f"   ⏱️ {endpoint}: timeout ({attempt_info})")
 
             except Exception as e:
-                print(f"❌ Error: {e}")
+                error = type(e).__name__
+                print(f"   ❌ {endpoint}: {e} ({attempt_info})")
+
+            log_event('http_retry', logging.WARNING, endpoint=endpoint, attempt=attempt + 1,
+                      max_attempts=self.max_retries, error=error,
+                      duration=round(time.perf_counter() - start_time, 3))
 
             if attempt < self.max_retries - 1:
                 wait = 2 ** attempt
                 print(f"   Waiting {wait}s before retry...")
                 time.sleep(wait)
 
+        log_event('http_failed', logging.ERROR, endpoint=endpoint, attempts=self.max_retries)
         return None
 
     def _get_paginated(self, url: str) -> List[Dict]:
@@ -118,38 +156,61 @@ class GitHubAPIClient:
             return True
         return False
 
+    @staticmethod
+    def _to_repo_info(repo: Dict) -> RepoInfo:
+        return RepoInfo(
+            name=repo['name'],
+            full_name=repo['full_name'],
+            clone_url=repo['clone_url'],
+            default_branch=repo['default_branch'],
+            private=repo['private'],
+            pushed_at=repo['pushed_at'],
+            size=repo.get('size', 0),
+            owner=(repo.get('owner') or {}).get('login') or repo['full_name'].split('/')[0],
+            fork=repo.get('fork', False),
+            archived=repo.get('archived', False),
+            topics=repo.get('topics') or []
+        )
+
+    def _filtered(self, repos: List[Dict]) -> List[RepoInfo]:
+        repo_infos = [self._to_repo_info(repo) for repo in repos]
+        return self.repo_filter.apply(repo_infos) if self.repo_filter else repo_infos
+
+    def get_user_repos(self, affiliation: Optional[str] = None) -> List[RepoInfo]:
+        if self.repo_filter:
+            query = self.repo_filter.user_repos_query(affiliation)
+        else:
+            query = f"affiliation={affiliation}" if affiliation else "type=all"
+        return self._filtered(self._get_paginated(f"{self.base_url}/user/repos?per_page=100&{query}"))
+
+    def get_orgs(self) -> List[str]:
+        orgs = [org['login'] for org in self._get_paginated(f"{self.base_url}/user/orgs?per_page=100")]
+        return [org for org in orgs if self.repo_filter.wants_owner(org)] if self.repo_filter else orgs
+
+    def get_org_repos(self, org: str) -> List[RepoInfo]:
+        query = self.repo_filter.org_repos_query() if self.repo_filter else "type=all"
+        return self._filtered(self._get_paginated(f"{self.base_url}/orgs/{org}/repos?per_page=100&{query}"))
+
     def get_all_repos(self) -> List[RepoInfo]:
         print("\n📦 Fetching all repositories...")
 
         repos = []
 
         print("   Fetching user repositories...")
-        user_repos = self._get_paginated(f"{self.base_url}/user/repos?per_page=100&type=all")
+        user_repos = self.get_user_repos()
         repos.extend(user_repos)
         print(f"   ✅ Found {len(user_repos)} user repositories")
 
         print("\n   Fetching organization repositories...")
-        orgs = self._get_paginated(f"{self.base_url}/user/orgs?per_page=100")
-
-        for org in orgs:
-            org_name = org['login']
+        for org_name in self.get_orgs():
             print(f"   Fetching {org_name} repositories...")
-            org_repos = self._get_paginated(f"{self.base_url}/orgs/{org_name}/repos?per_page=100")
+            org_repos = self.get_org_repos(org_name)
             repos.extend(org_repos)
             print(f"      ✅ Found {len(org_repos)} repositories")
 
-        repo_infos = []
-        for repo in repos:
-            repo_infos.append(RepoInfo(
-                name=repo['name'],
-                full_name=repo['full_name'],
-                clone_url=repo['clone_url'],
-                default_branch=repo['default_branch'],
-                private=repo['private'],
-                pushed_at=repo['pushed_at']
-            ))
-
-        unique_repos = {r.full_name: r for r in repo_infos}.values()
+        unique_repos = {r.full_name: r for r in repos}.values()
 
+        if self.repo_filter:
+            print(f"\n🔎 Filters: {self.repo_filter.summary()}")
         print(f"\n✅ Total unique repositories: {len(unique_repos)}")
         return list(unique_repos)
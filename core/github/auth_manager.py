@@ -43,10 +43,13 @@ class GitHubAuthManager:
                 return None
 
     @staticmethod
-    def authenticate(token: Optional[str] = None, timeout: int = 30) -> Optional[GitHubAPIClient]:
+    def authenticate(token: Optional[str] = None, timeout: int = 30,
+                     username: Optional[str] = None) -> Optional[GitHubAPIClient]:
         print("\n🔐 GitHub Authentication")
 
         users = ProjectPaths.get_all_users()
+        if username:
+            users = [username] if username in users else []
 
         if users and not token:
             print(f"   Found existing user: {users[0]}")
@@ -0,0 +1,143 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import threading
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.models import RepoInfo
+
+
+def _matches(repo: RepoInfo, pattern: str) -> bool:
+    target = repo.full_name if '/' in pattern else repo.name
+    return fnmatchcase(target.lower(), pattern.lower())
+
+
+class RepoFilter:
+    """Include/exclude rules for the repository inventory.
+
+    Visibility, fork status and the owners to list are sent to the API as
+    query parameters, so excluded orgs cost no pages at all. Everything
+    else (name globs, archived status, topics, size) is checked on the
+    listing, before any git work."""
+
+    CHOICES = ('include', 'exclude', 'only')
+
+    def __init__(self, include_owners: Optional[List[str]] = None, exclude_owners: Optional[List[str]] = None,
+                 include: Optional[List[str]] = None, exclude: Optional[List[str]] = None,
+                 visibility: str = 'all', forks: str = 'include', archived: str = 'include',
+                 topics: Optional[List[str]] = None, exclude_topics: Optional[List[str]] = None,
+                 max_size_mb: Optional[float] = None):
+        self.include_owners = {owner.lower() for owner in include_owners or []}
+        self.exclude_owners = {owner.lower() for owner in exclude_owners or []}
+        self.include = include or []
+        self.exclude = exclude or []
+        self.visibility = visibility
+        self.forks = forks
+        self.archived = archived
+        self.topics = {topic.lower() for topic in topics or []}
+        self.exclude_topics = {topic.lower() for topic in exclude_topics or []}
+        self.max_size_mb = max_size_mb
+        self.excluded: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_args(cls, args) -> Optional['RepoFilter']:
+        include = list(args.include or [])
+        if args.repos_from:
+            include.extend(cls.load_list(Path(args.repos_from)))
+            if not include:
+                raise ValueError(f"{args.repos_from} lists no repositories")
+        repo_filter = cls(
+            include_owners=args.include_owner,
+            exclude_owners=args.exclude_owner,
+            include=include,
+            exclude=args.exclude,
+            visibility=args.visibility,
+            forks=args.forks,
+            archived=args.archived,
+            topics=args.topic,
+            exclude_topics=args.exclude_topic,
+            max_size_mb=args.max_size
+        )
+        return repo_filter if repo_filter.active else None
+
+    @staticmethod
+    def load_list(path: Path) -> List[str]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = [line.split('#', 1)[0].strip() for line in f]
+        except OSError as e:
+            raise ValueError(f"Cannot read {path}: {e}")
+        return [line for line in lines if line]
+
+    @property
+    def active(self) -> bool:
+        return bool(self.include_owners or self.exclude_owners or self.include or self.exclude
+                    or self.visibility != 'all' or self.forks != 'include' or self.archived != 'include'
+                    or self.topics or self.exclude_topics or self.max_size_mb is not None)
+
+    def wants_owner(self, owner: str) -> bool:
+        owner = owner.lower()
+        if owner in self.exclude_owners:
+            return False
+        return not self.include_owners or owner in self.include_owners
+
+    def user_repos_query(self, affiliation: Optional[str] = None) -> str:
+        if self.visibility == 'all':
+            return f"affiliation={affiliation}" if affiliation else "type=all"
+        return f"visibility={self.visibility}&affiliation={affiliation or 'owner,collaborator,organization_member'}"
+
+    def org_repos_query(self) -> str:
+        if self.visibility != 'all':
+            return f"type={self.visibility}"
+        if self.forks == 'exclude':
+            return "type=sources"
+        if self.forks == 'only':
+            return "type=forks"
+        return "type=all"
+
+    def rejection(self, repo: RepoInfo) -> Optional[str]:
+        if not self.wants_owner(repo.owner or repo.full_name.split('/')[0]):
+            return 'owner'
+        if self.visibility != 'all' and repo.private != (self.visibility == 'private'):
+            return 'visibility'
+        if self.forks == 'exclude' and repo.fork or self.forks == 'only' and not repo.fork:
+            return 'fork'
+        if self.archived == 'exclude' and repo.archived or self.archived == 'only' and not repo.archived:
+            return 'archived'
+        if self.include and not any(_matches(repo, pattern) for pattern in self.include):
+            return 'name'
+        if any(_matches(repo, pattern) for pattern in self.exclude):
+            return 'name'
+        topics = {topic.lower() for topic in repo.topics}
+        if self.topics and not self.topics & topics or self.exclude_topics & topics:
+            return 'topic'
+        if self.max_size_mb is not None and repo.size > self.max_size_mb * 1024:
+            return 'size'
+        return None
+
+    def accepts(self, repo: RepoInfo) -> bool:
+        return self.rejection(repo) is None
+
+    def apply(self, repos: List[RepoInfo]) -> List[RepoInfo]:
+        kept = []
+        for repo in repos:
+            reason = self.rejection(repo)
+            if reason is None:
+                kept.append(repo)
+            else:
+                with self._lock:
+                    self.excluded[reason] = self.excluded.get(reason, 0) + 1
+        return kept
+
+    def summary(self) -> str:
+        with self._lock:
+            excluded, self.excluded = self.excluded, {}
+        if not excluded:
+            return "no repositories excluded"
+        details = ', '.join(f"{reason}: {count}" for reason, count in sorted(excluded.items()))
+        return f"{sum(excluded.values())} repositories excluded ({details})"
@@ -0,0 +1,85 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+from typing import Dict, List
+
+from core.backup.sharding import stable_hash
+from core.config.settings import Config, ProjectPaths
+from core.github.api_client import GitHubAPIClient
+from core.models import RepoInfo
+
+
+class TokenPool:
+    """Authenticated clients for every configured account.
+
+    Each client keeps its own rate-limit budget. Repositories owned by an
+    account, or shared with it as a collaborator, stay with that account.
+    An organization visible to several accounts is listed once, by one
+    member chosen by a stable hash of the org name. Listing cost is spread
+    across the tokens, and each org always lands in the same account's
+    directory."""
+
+    def __init__(self, clients: List[GitHubAPIClient]):
+        self.clients = sorted(clients, key=lambda client: client.login.lower())
+
+    def set_filter(self, repo_filter):
+        for client in self.clients:
+            client.repo_filter = repo_filter
+
+    @classmethod
+    def authenticate_all(cls, timeout: int = 30, tracer=None) -> 'TokenPool':
+        print("\n🔐 GitHub Authentication (all accounts)")
+        clients = []
+        for username in sorted(ProjectPaths.get_all_users()):
+            token = Config.load_token(username)
+            if not token:
+                continue
+            client = GitHubAPIClient(token, timeout=timeout, tracer=tracer)
+            if client.verify_token():
+                print(f"   ✅ {client.login}")
+                clients.append(client)
+            else:
+                print(f"   ⚠️ Token for {username} is invalid - skipped (update it with -t --account {username})")
+        return cls(clients)
+
+    def get_all_repos(self) -> Dict[str, List[RepoInfo]]:
+        print(f"\n📦 Fetching repositories for {len(self.clients)} accounts...")
+        own_repos = {}
+        members: Dict[str, List[GitHubAPIClient]] = {}
+        for client in self.clients:
+            own_repos[client.login] = client.get_user_repos(affiliation='owner,collaborator')
+            for org in client.get_orgs():
+                members.setdefault(org, []).append(client)
+
+        org_repos: Dict[str, List[RepoInfo]] = {client.login: [] for client in self.clients}
+        for org in sorted(members):
+            lister = members[org][stable_hash(org) % len(members[org])]
+            repos = lister.get_org_repos(org)
+            org_repos[lister.login].extend(repos)
+            print(f"   {org}: {len(repos)} repositories via {lister.login}"
+                  f" ({len(members[org])} tokens can see it)")
+
+        inventory: Dict[str, List[RepoInfo]] = {client.login: [] for client in self.clients}
+        claimed = set()
+
+        def claim(login: str, repos: List[RepoInfo]):
+            for repo in repos:
+                if repo.full_name not in claimed:
+                    claimed.add(repo.full_name)
+                    inventory[login].append(repo)
+
+        for login, repos in own_repos.items():
+            claim(login, [repo for repo in repos if repo.full_name.split('/')[0].lower() == login.lower()])
+        for login, repos in org_repos.items():
+            claim(login, repos)
+        for login, repos in own_repos.items():
+            claim(login, repos)
+
+        if self.clients[0].repo_filter:
+            print(f"   🔎 Filters: {self.clients[0].repo_filter.summary()}")
+        for client in self.clients:
+            print(f"   ✅ {client.login}: {len(inventory[client.login])} repositories"
+                  f" (rate limit remaining: {client._rate_limit_remaining})")
+        return inventory
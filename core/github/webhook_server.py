@@ -0,0 +1,168 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import hashlib
+import hmac
+import json
+import logging
+import re
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Tuple
+
+from ..models import RepoInfo
+from ..utils.events import log_event
+
+SUPPORTED_EVENTS = ('push', 'create', 'delete', 'repository')
+MAX_PAYLOAD_SIZE = 25 * 1024 * 1024
+CLONE_URL_BASE = 'https://github.com'
+FULL_NAME_PATTERN = re.compile(r'[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+')
+
+
+def verify_signature(secret: bytes, body: bytes, signature: Optional[str]) -> bool:
+    if not signature or not signature.startswith('sha256='):
+        return False
+    expected = 'sha256=' + hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def _repo_from_payload(repository: dict) -> RepoInfo:
+    full_name = repository['full_name']
+    if not isinstance(full_name, str) or not FULL_NAME_PATTERN.fullmatch(full_name):
+        raise ValueError(f"invalid repository name: {full_name!r}")
+    owner, _, name = full_name.partition('/')
+    if name in ('.', '..') or owner in ('.', '..'):
+        raise ValueError(f"invalid repository name: {full_name!r}")
+    pushed_at = repository.get('pushed_at')
+    if isinstance(pushed_at, (int, float)):
+        pushed_at = datetime.fromtimestamp(pushed_at, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return RepoInfo(
+        name=name,
+        full_name=full_name,
+        clone_url=f"{CLONE_URL_BASE}/{full_name}.git",
+        default_branch=repository.get('default_branch') or repository.get('master_branch') or 'master',
+        private=repository.get('private', False),
+        pushed_at=pushed_at or datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        size=repository.get('size', 0),
+        owner=owner,
+        fork=repository.get('fork', False),
+        archived=repository.get('archived', False),
+        topics=repository.get('topics') or []
+    )
+
+
+def parse_event(event: str, payload: dict) -> Optional[Tuple[RepoInfo, List[str], List[str]]]:
+    """Returns the repository and the refs updated and deleted by an event, or
+    None when the event needs no sync."""
+    if not isinstance(payload, dict):
+        raise ValueError("payload is not a JSON object")
+    repository = payload.get('repository')
+    if not repository:
+        return None
+    if not isinstance(repository, dict):
+        raise ValueError("repository is not a JSON object")
+    repo = _repo_from_payload(repository)
+
+    if event == 'push':
+        ref = payload.get('ref', '')
+        return (repo, [], [ref]) if payload.get('deleted') else (repo, [ref], [])
+
+    if event in ('create', 'delete'):
+        ref_type = payload.get('ref_type')
+        if ref_type not in ('branch', 'tag'):
+            return repo, [], []
+        ref = f"refs/{'heads' if ref_type == 'branch' else 'tags'}/{payload.get('ref', '')}"
+        return (repo, [ref], []) if event == 'create' else (repo, [], [ref])
+
+    if event == 'repository':
+        if payload.get('action') in ('deleted', 'archived', 'privatized', 'publicized', 'edited'):
+            return None
+        return repo, [], []
+
+    return None
+
+
+class WebhookServer:
+    """Receives GitHub webhooks and passes validated repository events to
+    ``on_event(repo, updated_refs, deleted_refs)``.
+
+    Every delivery must carry a valid ``X-Hub-Signature-256`` HMAC of the
+    body. Unsupported events are acknowledged with 204 and queued ones with
+    202. The server does no git work itself, so deliveries return at once."""
+
+    def __init__(self, secret: str, on_event: Callable[[RepoInfo, List[str], List[str]], None],
+                 host: str = '127.0.0.1', port: int = 8787):
+        self.secret = secret.encode('utf-8')
+        self.on_event = on_event
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def _make_handler(self):
+        server = self
+
+        class WebhookHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length > MAX_PAYLOAD_SIZE:
+                    self._reply(413)
+                    return
+                body = self.rfile.read(length)
+
+                if not verify_signature(server.secret, body, self.headers.get('X-Hub-Signature-256')):
+                    log_event('webhook_rejected', logging.WARNING, delivery=self.headers.get('X-GitHub-Delivery'))
+                    self._reply(401)
+                    return
+
+                event = self.headers.get('X-GitHub-Event', '')
+                if event == 'ping':
+                    self._reply(200)
+                    return
+                if event not in SUPPORTED_EVENTS:
+                    self._reply(204)
+                    return
+
+                try:
+                    parsed = parse_event(event, json.loads(body.decode('utf-8')))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    self._reply(400)
+                    return
+
+                if parsed is None:
+                    self._reply(204)
+                    return
+
+                repo, updated, deleted = parsed
+                log_event('webhook', github_event=event, repo=repo.full_name, updated=updated, deleted=deleted,
+                          delivery=self.headers.get('X-GitHub-Delivery'))
+                server.on_event(repo, updated, deleted)
+                self._reply(202)
+
+            def _reply(self, status: int):
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return WebhookHandler
+
+    def start(self) -> bool:
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        except OSError as e:
+            print(f"❌ Cannot listen on {self.host}:{self.port}: {e}")
+            return False
+        threading.Thread(target=self._server.serve_forever, name="webhook-http", daemon=True).start()
+        print(f"🪝 Webhook receiver: http://{self.host}:{self.port}/")
+        return True
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -4,10 +4,37 @@
 # https://github.com/smartlegionlab/
 # --------------------------------------------------------
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
+@dataclass
+class RepoRecord:
+    full_name: str
+    operation: str = ''
+    outcome: str = ''
+    duration: float = 0.0
+    retries: int = 0
+    bytes_received: int = 0
+    error: Optional[str] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    def add_phase(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "repo": self.full_name,
+            "operation": self.operation,
+            "outcome": self.outcome,
+            "duration_seconds": round(self.duration, 3),
+            "retries": self.retries,
+            "bytes_received": self.bytes_received,
+            "error": self.error if self.outcome == 'failed' else None,
+            "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()}
+        }
+
+
 @dataclass
 class BackupStats:
     total_repos: int = 0
@@ -20,6 +47,7 @@ class BackupStats:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     failed_repos: List[str] = field(default_factory=list)
+    repo_records: List[RepoRecord] = field(default_factory=list)
 
     @property
     def elapsed_time(self) -> str:
@@ -38,3 +66,45 @@ class RepoInfo:
     private: bool
     pushed_at: str
     branches: List[str] = field(default_factory=list)
+    size: int = 0
+    owner: str = ''
+    fork: bool = False
+    archived: bool = False
+    topics: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ArchiveStats:
+    format: str = ''
+    level: int = 0
+    kind: str = 'full'
+    path: Optional[str] = None
+    files: int = 0
+    deleted_files: int = 0
+    stored_files: int = 0
+    bytes_in: int = 0
+    stored_bytes: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        return self.bytes_out / self.bytes_in if self.bytes_in else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "format": self.format,
+            "level": self.level,
+            "kind": self.kind,
+            "path": self.path,
+            "files": self.files,
+            "deleted_files": self.deleted_files,
+            "stored_files": self.stored_files,
+            "bytes_in": self.bytes_in,
+            "stored_bytes": self.stored_bytes,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.ratio, 4),
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "wall_seconds": round(self.wall_seconds, 3)
+        }
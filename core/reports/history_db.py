@@ -0,0 +1,224 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+from core.config.settings import ProjectPaths
+from core.models import ArchiveStats, BackupStats
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT,
+    finished_at TEXT,
+    duration REAL,
+    total_repos INTEGER,
+    cloned INTEGER,
+    updated INTEGER,
+    synced INTEGER,
+    skipped INTEGER,
+    failed INTEGER,
+    branches INTEGER,
+    bytes_received INTEGER,
+    retries INTEGER,
+    archive_bytes INTEGER,
+    archive_seconds REAL
+);
+CREATE TABLE IF NOT EXISTS repo_runs (
+    run_id INTEGER REFERENCES runs(id) ON DELETE CASCADE,
+    full_name TEXT,
+    operation TEXT,
+    outcome TEXT,
+    duration REAL,
+    retries INTEGER,
+    bytes_received INTEGER,
+    size_bytes INTEGER,
+    phases TEXT
+);
+CREATE INDEX IF NOT EXISTS repo_runs_name ON repo_runs (full_name, run_id);
+"""
+
+
+class HistoryDB:
+    """SQLite history of every run (``<user>/history.db``): one row per run
+    and one per repository, used for trend reports, regression flags and
+    per-repository duration predictions."""
+
+    def __init__(self, username: str, path: Optional[Path] = None):
+        self.username = username
+        self.path = path or ProjectPaths.get_user_dir(username) / "history.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _pack_size(repo_dir: Path) -> int:
+        git_dir = repo_dir / '.git' if (repo_dir / '.git').is_dir() else repo_dir
+        pack_dir = git_dir / 'objects' / 'pack'
+        try:
+            return sum(p.stat().st_size for p in pack_dir.iterdir() if p.is_file())
+        except OSError:
+            return 0
+
+    def record_run(self, stats: BackupStats, archive_stats: Optional[ArchiveStats] = None) -> int:
+        repos_dir = ProjectPaths.get_repos_dir(self.username)
+        duration = (stats.end_time - stats.start_time).total_seconds() \
+            if stats.start_time and stats.end_time else 0.0
+        records = stats.repo_records
+
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (started_at, finished_at, duration, total_repos, cloned, updated, synced,"
+                " skipped, failed, branches, bytes_received, retries, archive_bytes, archive_seconds)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    stats.start_time.isoformat() if stats.start_time else datetime.now().isoformat(),
+                    stats.end_time.isoformat() if stats.end_time else None,
+                    duration,
+                    stats.total_repos,
+                    stats.cloned,
+                    stats.updated,
+                    stats.synced,
+                    stats.skipped,
+                    stats.failed,
+                    stats.total_branches,
+                    sum(r.bytes_received for r in records),
+                    sum(r.retries for r in records),
+                    archive_stats.bytes_out if archive_stats else None,
+                    archive_stats.wall_seconds if archive_stats else None
+                )
+            )
+            run_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO repo_runs (run_id, full_name, operation, outcome, duration, retries,"
+                " bytes_received, size_bytes, phases) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        r.full_name,
+                        r.operation,
+                        r.outcome,
+                        r.duration,
+                        r.retries,
+                        r.bytes_received,
+                        self._pack_size(repos_dir / r.full_name.split('/')[-1]),
+                        json.dumps(r.phases)
+                    )
+                    for r in records
+                ]
+            )
+        return run_id
+
+    def recent_runs(self, limit: int = 10) -> List[sqlite3.Row]:
+        rows = self._conn.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return list(reversed(rows))
+
+    def baseline(self, run_id: int, window: int = 5) -> Optional[float]:
+        rows = self._conn.execute(
+            "SELECT duration FROM runs WHERE id < ? AND duration > 0 ORDER BY id DESC LIMIT ?",
+            (run_id, window)
+        ).fetchall()
+        return median(row['duration'] for row in rows) if rows else None
+
+    def is_regression(self, run: sqlite3.Row, window: int = 5, factor: float = 1.5) -> bool:
+        base = self.baseline(run['id'], window)
+        return bool(base and run['duration'] > base * factor)
+
+    def _repo_history(self, window: int) -> Dict[Tuple[str, str], List[sqlite3.Row]]:
+        rows = self._conn.execute(
+            "SELECT rr.* FROM repo_runs rr"
+            " WHERE rr.run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)"
+            " ORDER BY rr.run_id",
+            (window,)
+        ).fetchall()
+        history: Dict[Tuple[str, str], List[sqlite3.Row]] = {}
+        for row in rows:
+            history.setdefault((row['full_name'], row['operation']), []).append(row)
+        return history
+
+    def growing_repos(self, window: int = 10, factor: float = 1.5) -> List[Tuple[str, str, float, float]]:
+        growing = []
+        for (full_name, operation), rows in self._repo_history(window).items():
+            rows = [row for row in rows if row['outcome'] == 'ok']
+            if len(rows) < 3:
+                continue
+            half = len(rows) // 2
+            old_time = median(row['duration'] for row in rows[:half])
+            new_time = median(row['duration'] for row in rows[half:])
+            old_size = rows[0]['size_bytes'] or 0
+            new_size = rows[-1]['size_bytes'] or 0
+            time_growth = new_time / old_time if old_time > 0 else 1.0
+            size_growth = new_size / old_size if old_size > 0 else 1.0
+            if time_growth >= factor or size_growth >= factor:
+                growing.append((full_name, operation, time_growth, size_growth))
+        return sorted(growing, key=lambda g: max(g[2], g[3]), reverse=True)
+
+    def chronic_failures(self, window: int = 5, min_failures: int = 3) -> List[Tuple[str, int]]:
+        rows = self._conn.execute(
+            "SELECT full_name, COUNT(*) AS failures FROM repo_runs"
+            " WHERE outcome = 'failed' AND run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)"
+            " GROUP BY full_name HAVING failures >= ? ORDER BY failures DESC, full_name",
+            (window, min_failures)
+        ).fetchall()
+        return [(row['full_name'], row['failures']) for row in rows]
+
+    def predict_durations(self, window: int = 5) -> Dict[str, float]:
+        samples: Dict[str, List[float]] = {}
+        rows = self._conn.execute(
+            "SELECT full_name, duration FROM repo_runs"
+            " WHERE outcome = 'ok' AND run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)",
+            (window,)
+        ).fetchall()
+        for row in rows:
+            samples.setdefault(row['full_name'], []).append(row['duration'])
+        return {name: median(values) for name, values in samples.items()}
+
+    def predict_run_duration(self, window: int = 5) -> Optional[float]:
+        runs = self.recent_runs(window)
+        return median(run['duration'] for run in runs) if runs else None
+
+    def show_stats(self, limit: int = 10):
+        print(f"\n📉 Run History: {self.path}")
+        runs = self.recent_runs(limit)
+        if not runs:
+            print("   ⚠️ No runs recorded yet")
+            return
+
+        print(f"\n   Last {len(runs)} runs:")
+        for run in runs:
+            flag = "  ⚠️ slower than baseline" if self.is_regression(run) else ''
+            archive = f", archive {run['archive_bytes'] / (1024 * 1024):.1f} MB" if run['archive_bytes'] else ''
+            print(f"   {run['started_at'][:19]}  {run['duration']:8.1f}s  {run['total_repos']:5} repos"
+                  f"  {run['failed']:3} failed  {(run['bytes_received'] or 0) / (1024 * 1024):8.1f} MB"
+                  f"{archive}{flag}")
+
+        growing = self.growing_repos()
+        print(f"\n   📈 Growing repositories ({len(growing)}):")
+        for full_name, operation, time_growth, size_growth in growing[:10]:
+            print(f"   • {full_name} ({operation}): time x{time_growth:.1f}, size x{size_growth:.1f}")
+
+        failures = self.chronic_failures()
+        print(f"\n   ❌ Chronically failing repositories ({len(failures)}):")
+        for full_name, count in failures:
+            print(f"   • {full_name}: failed in {count} of the last 5 runs")
+
+        predicted = self.predict_run_duration()
+        if predicted:
+            print(f"\n   ⏱️  Predicted next run: {predicted:.1f}s")
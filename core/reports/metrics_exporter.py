@@ -0,0 +1,184 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from core.models import ArchiveStats, BackupStats
+
+DURATION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+class _MetricsWriter:
+
+    def __init__(self, base_labels: Dict[str, str]):
+        self.base_labels = base_labels
+        self.lines: List[str] = []
+
+    def metric(self, name: str, metric_type: str, help_text: str, samples: Iterable):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            self.lines.append(f"{name}{_labels({**self.base_labels, **labels})} {value}")
+
+    def histogram(self, name: str, help_text: str, groups: Dict[str, List[float]], label: Optional[str] = None):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} histogram")
+        for key, values in sorted(groups.items()):
+            labels = {**self.base_labels, **({label: key} if label else {})}
+            for bound in DURATION_BUCKETS:
+                count = sum(1 for v in values if v <= bound)
+                self.lines.append(f"{name}_bucket{_labels({**labels, 'le': str(bound)})} {count}")
+            self.lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {len(values)}")
+            self.lines.append(f"{name}_sum{_labels(labels)} {sum(values):.6f}")
+            self.lines.append(f"{name}_count{_labels(labels)} {len(values)}")
+
+    def render(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+class MetricsExporter:
+    """Exposes run metrics in the Prometheus text format, either as a
+    node_exporter textfile written at the end of the run or live on a local
+    ``/metrics`` endpoint while the run is in progress."""
+
+    def __init__(self, username: str, github_client=None):
+        self.username = username
+        self.github_client = github_client
+        self.stats: Optional[BackupStats] = None
+        self.archive_stats: Optional[ArchiveStats] = None
+        self.started = time.time()
+        self.finished: Optional[float] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def render(self) -> str:
+        writer = _MetricsWriter({"user": self.username})
+        stats = self.stats or BackupStats()
+        records = list(stats.repo_records)
+
+        writer.metric("github_backup_running", "gauge", "1 while a run is in progress, 0 once it finished",
+                      [({}, 0 if self.finished else 1)])
+        writer.metric("github_backup_run_start_timestamp_seconds", "gauge", "Start time of the run",
+                      [({}, f"{self.started:.3f}")])
+        if self.finished:
+            writer.metric("github_backup_run_end_timestamp_seconds", "gauge", "End time of the run",
+                          [({}, f"{self.finished:.3f}")])
+            writer.metric("github_backup_run_duration_seconds", "gauge", "Wall time of the whole run",
+                          [({}, f"{self.finished - self.started:.3f}")])
+            if stats.failed == 0:
+                writer.metric("github_backup_last_success_timestamp_seconds", "gauge",
+                              "End time of the run if no repository failed", [({}, f"{self.finished:.3f}")])
+
+        writer.metric("github_backup_repositories", "gauge", "Repositories in the inventory",
+                      [({}, stats.total_repos)])
+        writer.metric("github_backup_repositories_processed", "gauge", "Repositories processed so far",
+                      [({}, len(records))])
+        writer.metric("github_backup_repositories_by_result", "gauge", "Repositories by result", [
+            ({"result": "cloned"}, stats.cloned),
+            ({"result": "updated"}, stats.updated),
+            ({"result": "synced"}, stats.synced),
+            ({"result": "skipped"}, stats.skipped),
+            ({"result": "failed"}, stats.failed),
+        ])
+        writer.metric("github_backup_branches", "gauge", "Local branches across all repositories",
+                      [({}, stats.total_branches)])
+        writer.metric("github_backup_received_bytes_total", "counter", "Bytes received by git",
+                      [({}, sum(r.bytes_received for r in records))])
+        writer.metric("github_backup_retries_total", "counter", "Git operation retries",
+                      [({}, sum(r.retries for r in records))])
+
+        if self.github_client is not None:
+            writer.metric("github_backup_rate_limit_remaining", "gauge", "GitHub API requests remaining",
+                          [({}, self.github_client._rate_limit_remaining)])
+            writer.metric("github_backup_rate_limit_reset_timestamp_seconds", "gauge",
+                          "When the GitHub API rate limit resets", [({}, self.github_client._rate_limit_reset)])
+
+        phases: Dict[str, List[float]] = {}
+        for record in records:
+            for phase, seconds in record.phases.items():
+                phases.setdefault(phase, []).append(seconds)
+        writer.histogram("github_backup_phase_duration_seconds", "Per-repository time spent in each phase",
+                         phases, label="phase")
+        writer.histogram("github_backup_repository_duration_seconds", "Per-repository wall time",
+                         {"all": [r.duration for r in records]})
+
+        archive = self.archive_stats
+        if archive:
+            labels = {"format": archive.format, "kind": archive.kind}
+            writer.metric("github_backup_archive_input_bytes", "gauge", "Bytes read into the archive",
+                          [(labels, archive.bytes_in)])
+            writer.metric("github_backup_archive_output_bytes", "gauge", "Size of the archive",
+                          [(labels, archive.bytes_out)])
+            writer.metric("github_backup_archive_cpu_seconds", "gauge", "CPU time spent archiving",
+                          [(labels, f"{archive.cpu_seconds:.3f}")])
+            throughput = archive.bytes_in / archive.cpu_seconds if archive.cpu_seconds else 0
+            writer.metric("github_backup_archive_throughput_bytes_per_second", "gauge",
+                          "Archive input bytes per CPU second", [(labels, f"{throughput:.1f}")])
+
+        return writer.render()
+
+    def write_textfile(self, path: Path) -> bool:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            tmp_path.replace(path)
+            print(f"📈 Metrics written: {path}")
+            return True
+        except Exception as e:
+            print(f"❌ Failed to write metrics: {e}")
+            return False
+
+    def serve(self, port: int, host: str = '127.0.0.1') -> bool:
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as e:
+            print(f"❌ Cannot serve metrics on {host}:{port}: {e}")
+            return False
+
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        print(f"📈 Metrics endpoint: http://{host}:{port}/metrics")
+        return True
+
+    def finish(self):
+        self.finished = time.time()
+
+    def shutdown(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
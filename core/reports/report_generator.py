@@ -4,21 +4,28 @@
 # https://github.com/smartlegionlab/
 # --------------------------------------------------------
 import json
-from datetime import datetime
+import socket
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from core.config.settings import ProjectPaths
 from core.github.api_client import GitHubAPIClient
-from core.models import BackupStats
+from core.models import ArchiveStats, BackupStats
 
 
 class ReportGenerator:
+    SLOWEST_COUNT = 10
 
-    def __init__(self, github_client: GitHubAPIClient, stats: BackupStats):
+    def __init__(self, github_client: GitHubAPIClient, stats: BackupStats,
+                 archive_stats: Optional[ArchiveStats] = None, shard: Optional[str] = None,
+                 disk: Optional[Dict[str, Any]] = None):
         self.github_client = github_client
         self.username = github_client.login
         self.stats = stats
+        self.archive_stats = archive_stats
+        self.shard = shard
+        self.disk = disk
         self.user_dir = ProjectPaths.get_user_dir(self.username)
         self.repos_dir = ProjectPaths.get_repos_dir(self.username)
 
@@ -59,6 +66,31 @@ class ReportGenerator:
             if len(self.stats.failed_repos) > 10:
                 print(f"   ... and {len(self.stats.failed_repos) - 10} more")
 
+        slowest = sorted(self.stats.repo_records, key=lambda r: r.duration, reverse=True)[:self.SLOWEST_COUNT]
+        if slowest:
+            print(f"\n🐢 SLOWEST REPOSITORIES (top {len(slowest)}):")
+            for i, record in enumerate(slowest, 1):
+                top_phase = max(record.phases.items(), key=lambda p: p[1])[0] if record.phases else '-'
+                print(f"   {i:2}. {record.duration:8.2f}s  {record.operation:6} {record.full_name}"
+                      f" (slowest phase: {top_phase}, retries: {record.retries},"
+                      f" {record.bytes_received / (1024 * 1024):.2f} MB)")
+
+        if self.archive_stats:
+            print("\n📦 ARCHIVE:")
+            print(f"   {'Format:':15} {self.archive_stats.format} (level {self.archive_stats.level})")
+            print(f"   {'Kind:':15} {self.archive_stats.kind}")
+            print(f"   {'Bytes in:':15} {self.archive_stats.bytes_in / (1024 * 1024):.2f} MB")
+            print(f"   {'Bytes out:':15} {self.archive_stats.bytes_out / (1024 * 1024):.2f} MB")
+            print(f"   {'CPU:':15} {self.archive_stats.cpu_seconds:.2f}s")
+
+        if self.disk:
+            print("\n💾 DISK:")
+            print(f"   {'Projected:':15} {self.disk['current_bytes'] / (1024 * 1024):.2f} MB →"
+                  f" {self.disk['projected_bytes'] / (1024 * 1024):.2f} MB")
+            print(f"   {'Free before:':15} {self.disk['free_bytes'] / (1024 * 1024):.2f} MB")
+            if self.disk['deferred_repos']:
+                print(f"   {'Deferred:':15} {len(self.disk['deferred_repos'])} new clones (over budget)")
+
         print("\n" + "=" * 60)
         if self.stats.failed == 0:
             print("✅ ALL REPOSITORIES BACKED UP SUCCESSFULLY!")
@@ -66,9 +98,11 @@ class ReportGenerator:
             print(f"⚠️  Backup completed with {self.stats.failed} failures")
         print("=" * 60)
 
-        return {
+        report = {
             "timestamp": datetime.now().isoformat(),
             "user": self.github_client.login,
+            "node": socket.gethostname(),
+            "shard": self.shard,
             "app_directory": str(ProjectPaths.get_app_dir()),
             "user_directory": str(self.user_dir),
             "repositories_directory": str(self.repos_dir),
@@ -81,6 +115,10 @@ class ReportGenerator:
                 "failed": self.stats.failed,
                 "total_branches": self.stats.total_branches,
                 "failed_repos": self.stats.failed_repos,
+                "started_at": self.stats.start_time.astimezone(timezone.utc).isoformat()
+                if self.stats.start_time else None,
+                "finished_at": self.stats.end_time.astimezone(timezone.utc).isoformat()
+                if self.stats.end_time else None,
                 "duration_seconds": (self.stats.end_time - self.stats.start_time).total_seconds()
                 if self.stats.start_time and self.stats.end_time else 0,
                 "success_rate": ((self.stats.total_repos - self.stats.failed) / self.stats.total_repos * 100)
@@ -88,6 +126,24 @@ class ReportGenerator:
             }
         }
 
+        phase_totals = {}
+        for record in self.stats.repo_records:
+            for phase, seconds in record.phases.items():
+                phase_totals[phase] = phase_totals.get(phase, 0.0) + seconds
+
+        report["stats"]["bytes_received"] = sum(r.bytes_received for r in self.stats.repo_records)
+        report["stats"]["retries"] = sum(r.retries for r in self.stats.repo_records)
+        report["phase_totals"] = {phase: round(seconds, 3) for phase, seconds in sorted(phase_totals.items())}
+        report["slowest_repos"] = [record.to_dict() for record in slowest]
+        report["repos"] = [record.to_dict() for record in self.stats.repo_records]
+
+        if self.archive_stats:
+            report["archive"] = self.archive_stats.to_dict()
+        if self.disk:
+            report["disk"] = self.disk
+
+        return report
+
     def save(self, report_data: Dict[str, Any]) -> Path:
         backups_dir = ProjectPaths.get_backups_dir(self.username)
         backups_dir.mkdir(exist_ok=True)
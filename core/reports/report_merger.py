@@ -0,0 +1,101 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+COUNTERS = ('total', 'cloned', 'updated', 'synced', 'skipped', 'failed', 'total_branches', 'bytes_received',
+            'retries')
+
+
+class ReportMerger:
+    """Combines ``backup_report_*.json`` files from several shard nodes into
+    one fleet-wide report."""
+
+    SLOWEST_COUNT = 10
+
+    def __init__(self, report_paths: List[Path]):
+        self.report_paths = report_paths
+
+    @staticmethod
+    def _load(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️ Skipping {path}: {e}")
+            return None
+
+    def merge(self) -> Optional[Dict[str, Any]]:
+        loaded = [(path, self._load(path)) for path in self.report_paths]
+        loaded = [(path, report) for path, report in loaded if report]
+        if not loaded:
+            return None
+        reports = [report for _, report in loaded]
+
+        stats = {counter: sum(r.get('stats', {}).get(counter, 0) for r in reports) for counter in COUNTERS}
+        stats['failed_repos'] = [name for r in reports for name in r.get('stats', {}).get('failed_repos', [])]
+
+        starts = [r['stats']['started_at'] for r in reports if r.get('stats', {}).get('started_at')]
+        ends = [r['stats']['finished_at'] for r in reports if r.get('stats', {}).get('finished_at')]
+        start_times = [datetime.fromisoformat(ts) for ts in starts]
+        end_times = [datetime.fromisoformat(ts) for ts in ends]
+        if starts and ends and all(ts.tzinfo is not None for ts in start_times + end_times):
+            stats['started_at'] = min(start_times).isoformat()
+            stats['finished_at'] = max(end_times).isoformat()
+            stats['duration_seconds'] = (max(end_times) - min(start_times)).total_seconds()
+        else:
+            stats['started_at'] = min(starts) if starts else None
+            stats['finished_at'] = max(ends) if ends else None
+            stats['duration_seconds'] = max(r.get('stats', {}).get('duration_seconds', 0) for r in reports)
+        stats['success_rate'] = (stats['total'] - stats['failed']) / stats['total'] * 100 if stats['total'] else 0
+
+        phase_totals: Dict[str, float] = {}
+        for report in reports:
+            for phase, seconds in report.get('phase_totals', {}).items():
+                phase_totals[phase] = phase_totals.get(phase, 0.0) + seconds
+
+        repos = [repo for report in reports for repo in report.get('repos', [])]
+        nodes = [{
+            "node": report.get('node'),
+            "shard": report.get('shard'),
+            "user": report.get('user'),
+            "total": report.get('stats', {}).get('total', 0),
+            "failed": report.get('stats', {}).get('failed', 0),
+            "duration_seconds": report.get('stats', {}).get('duration_seconds', 0),
+            "source": str(path)
+        } for path, report in loaded]
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "merged_reports": len(reports),
+            "users": sorted({r.get('user') for r in reports if r.get('user')}),
+            "nodes": nodes,
+            "stats": stats,
+            "phase_totals": {phase: round(seconds, 3) for phase, seconds in sorted(phase_totals.items())},
+            "slowest_repos": sorted(repos, key=lambda r: r.get('duration_seconds', 0),
+                                    reverse=True)[:self.SLOWEST_COUNT],
+            "repos": repos
+        }
+
+    @staticmethod
+    def print_summary(merged: Dict[str, Any]):
+        stats = merged['stats']
+        print(f"\n🧩 Merged {merged['merged_reports']} reports")
+        for node in merged['nodes']:
+            print(f"   • {node['node'] or '?'} shard {node['shard'] or '-'}: {node['total']} repositories,"
+                  f" {node['failed']} failed, {node['duration_seconds']:.0f}s")
+        print(f"   Total: {stats['total']} repositories, {stats['failed']} failed,"
+              f" {stats['success_rate']:.1f}% success, wall time {stats['duration_seconds']:.0f}s")
+
+    @staticmethod
+    def save(merged: Dict[str, Any], output: Path) -> Path:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=2, ensure_ascii=False)
+        print(f"📄 Merged report saved: {output}")
+        return output
@@ -0,0 +1,64 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+import logging
+from datetime import datetime, timezone
+
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+}
+
+EVENT_LOGGER = logging.getLogger("github_backup.events")
+EVENT_LOGGER.addHandler(logging.NullHandler())
+EVENT_LOGGER.propagate = False
+EVENT_LOGGER.setLevel(logging.CRITICAL + 1)
+
+
+class JsonLinesFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            "level": record.levelname.lower(),
+            "event": record.getMessage(),
+            "thread": record.threadName,
+        }
+        data.update(getattr(record, 'fields', {}))
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class NullStream:
+    """Stands in for stdout in JSON mode so console prints are dropped."""
+
+    encoding = 'utf-8'
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+def configure_events(stream, level: str = 'info'):
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonLinesFormatter())
+    EVENT_LOGGER.handlers = [handler]
+    EVENT_LOGGER.setLevel(LOG_LEVELS[level])
+
+
+def events_enabled(level: int = logging.INFO) -> bool:
+    return EVENT_LOGGER.isEnabledFor(level)
+
+
+def log_event(event: str, level: int = logging.INFO, **fields):
+    if EVENT_LOGGER.isEnabledFor(level):
+        EVENT_LOGGER.log(level, event, extra={"fields": fields})
@@ -5,43 +5,144 @@
 # --------------------------------------------------------
 import sys
 import shutil
+import threading
+import time
+from typing import Dict, List, Optional
 
+from core.utils.events import log_event
 
-class ProgressBar:
-    @staticmethod
-    def _clear_line():
-        sys.stdout.write('\r\033[K')
-        sys.stdout.flush()
 
-    @staticmethod
-    def _get_console_width():
-        return shutil.get_terminal_size().columns
+def _format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
 
-    def update(self, current: int, total: int, failed: int = 0, message: str = ""):
-        self._clear_line()
 
-        console_width = self._get_console_width()
-        percent = (current / total) * 100 if total > 0 else 0
+class ProgressDashboard:
+    """Progress display shared by all repository workers.
 
-        progress_info = f' {percent:.1f}% | {current}/{total}/{failed} | '
+    Workers only update shared state; a render thread redraws it at a fixed
+    rate: an aggregate line (progress, repos/s, MB/s, ETA) and one line per
+    active worker. When stdout is not a TTY the dashboard prints a summary
+    line every ``SUMMARY_INTERVAL`` seconds instead. The ETA uses per-repository
+    durations from previous runs when available."""
 
-        if message:
-            max_msg_len = console_width - len(progress_info) - 20
-            if len(message) > max_msg_len:
-                message = message[:max_msg_len - 3] + '...'
-            progress_info += message
+    REFRESH_INTERVAL = 0.2
+    SUMMARY_INTERVAL = 30.0
 
-        bar_length = console_width - len(progress_info) - 5
+    def __init__(self, total: int, workers: int = 1, predictions: Optional[Dict[str, float]] = None,
+                 stream=None, interactive: Optional[bool] = None, label: str = ''):
+        self.total = total
+        self.label = label
+        self.workers = max(1, workers)
+        self.predictions = predictions or {}
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty() if interactive is None else interactive
+        self.done = 0
+        self.failed = 0
+        self.bytes_received = 0
+        self._pending: Dict[str, None] = {}
+        self._active: Dict[str, tuple] = {}
+        self._durations: List[float] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._drawn_lines = 0
+        self._started = 0.0
+
+    def start(self, names: List[str]):
+        self._pending = dict.fromkeys(names)
+        self._started = time.perf_counter()
+        interval = self.REFRESH_INTERVAL if self.interactive else self.SUMMARY_INTERVAL
+        self._thread = threading.Thread(target=self._render_loop, args=(interval,), name="progress", daemon=True)
+        self._thread.start()
+
+    def begin(self, full_name: str, operation: str):
+        with self._lock:
+            self._pending.pop(full_name, None)
+            self._active[threading.current_thread().name] = (operation, full_name, time.perf_counter())
+
+    def set_operation(self, operation: str):
+        with self._lock:
+            slot = self._active.get(threading.current_thread().name)
+            if slot:
+                self._active[threading.current_thread().name] = (operation,) + slot[1:]
+
+    def end(self, success: bool, bytes_received: int = 0):
+        with self._lock:
+            slot = self._active.pop(threading.current_thread().name, None)
+            if slot:
+                self._durations.append(time.perf_counter() - slot[2])
+            self.done += 1
+            self.failed += 0 if success else 1
+            self.bytes_received += bytes_received
+
+    def _eta(self, now: float) -> Optional[float]:
+        average = sum(self._durations) / len(self._durations) if self._durations else None
+        remaining = 0.0
+        for full_name in self._pending:
+            estimate = self.predictions.get(full_name, average)
+            if estimate is None:
+                return None
+            remaining += estimate
+        for _, full_name, started in self._active.values():
+            estimate = self.predictions.get(full_name, average)
+            if estimate is None:
+                return None
+            remaining += max(estimate - (now - started), 0.0)
+        return remaining / self.workers
+
+    def _summary(self, now: float) -> str:
+        elapsed = max(now - self._started, 1e-6)
+        percent = self.done / self.total * 100 if self.total else 100.0
+        eta = self._eta(now)
+        return (f"{percent:5.1f}% | {self.done}/{self.total} done, {self.failed} failed | "
+                f"{self.done / elapsed:.1f} repos/s | {self.bytes_received / elapsed / (1024 * 1024):.2f} MB/s | "
+                f"ETA {_format_duration(eta) if eta is not None else '--'}")
+
+    def _render(self, final: bool = False):
+        now = time.perf_counter()
+        with self._lock:
+            summary = self._summary(now)
+            active = sorted(self._active.items())
+            eta = self._eta(now)
+
+        if not self.interactive:
+            self.stream.write(f"   {self.label + ': ' if self.label else ''}{summary}\n")
+            self.stream.flush()
+            log_event('progress', label=self.label or None, done=self.done, total=self.total, failed=self.failed,
+                      active=len(active), bytes_received=self.bytes_received,
+                      elapsed=round(now - self._started, 1), eta=round(eta, 1) if eta is not None else None)
+            return
+
+        width = shutil.get_terminal_size().columns
+        bar_length = max(width - len(summary) - 5, 0)
         if bar_length > 10:
-            filled = int(bar_length * current // total) if total > 0 else 0
-            bar = '█' * filled + '░' * (bar_length - filled)
-            line = f'\r[{bar}] {progress_info}'
-        else:
-            line = f'\r{progress_info}'
+            filled = int(bar_length * self.done // self.total) if self.total else bar_length
+            summary = f"[{'█' * filled}{'░' * (bar_length - filled)}] {summary}"
+
+        lines = [summary[:width - 1]]
+        if not final:
+            for worker, (operation, full_name, started) in active:
+                lines.append(f"   {worker:>14} {operation:15} {now - started:6.1f}s  {full_name}"[:width - 1])
+
+        cursor_up = f"\033[{self._drawn_lines - 1}A" if self._drawn_lines > 1 else ''
+        self.stream.write(cursor_up + '\r' + '\n'.join(f"\033[K{line}" for line in lines) + '\033[J')
+        self.stream.flush()
+        self._drawn_lines = len(lines)
 
-        sys.stdout.write(line)
-        sys.stdout.flush()
+    def _render_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            self._render()
 
     def finish(self, message: str = "Complete!"):
-        self._clear_line()
-        print(f"\n✅ {message}")
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self._render(final=True)
+        if self.interactive:
+            self.stream.write('\n')
+        print(f"✅ {message}", file=self.stream)
@@ -0,0 +1,179 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import os
+import re
+import selectors
+import shutil
+import socket
+import socketserver
+import subprocess
+import threading
+import time
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+RATE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+IONICE_CLASSES = {'idle': ['-c', '3'], 'low': ['-c', '2', '-n', '7']}
+CHUNK_SIZE = 16 * 1024
+ALLOWED_PORT = 443
+DEFAULT_ALLOWED_HOSTS = ('github.com',)
+
+
+def parse_rate(value: str) -> int:
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?)(?:i?B)?(?:/s)?\s*', value, re.IGNORECASE)
+    if not match or float(match.group(1)) <= 0:
+        raise ValueError(f"Invalid bandwidth '{value}', expected bytes per second such as 500K or 20M")
+    return int(float(match.group(1)) * RATE_UNITS[match.group(2).upper()])
+
+
+def set_process_priority(nice: Optional[int] = None, ionice: Optional[str] = None):
+    """Lowers CPU and I/O priority of this process. Git subprocesses and
+    archive threads started afterwards inherit it."""
+    if nice:
+        try:
+            os.nice(nice)
+            print(f"   🐢 CPU priority: nice +{nice}")
+        except (AttributeError, OSError) as e:
+            print(f"   ⚠️ Cannot change CPU priority: {e}")
+    if ionice:
+        if not shutil.which('ionice'):
+            print("   ⚠️ ionice not available - I/O priority unchanged")
+            return
+        result = subprocess.run(['ionice'] + IONICE_CLASSES[ionice] + ['-p', str(os.getpid())],
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            print(f"   🐢 I/O priority: {ionice}")
+        else:
+            print(f"   ⚠️ Cannot change I/O priority: {result.stderr.strip()}")
+
+
+class TokenBucket:
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst or max(rate / 4, CHUNK_SIZE)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ThrottlingProxy:
+    """Local HTTPS (CONNECT) proxy that shares one bandwidth budget between
+    all tunnels.
+
+    Git is pointed at it with ``-c http.proxy``, so every clone and fetch
+    in every worker draws from the same token bucket. TLS passes through
+    untouched. Plain HTTP requests are refused, and so are tunnels to
+    anything but port 443 on the hosts of the repositories' clone URLs."""
+
+    def __init__(self, rate: int, host: str = '127.0.0.1', port: int = 0,
+                 allowed_hosts: Iterable[str] = DEFAULT_ALLOWED_HOSTS):
+        self.rate = rate
+        self.bucket = TokenBucket(rate)
+        self.host = host
+        self.port = port
+        self.allowed_hosts = {h.lower() for h in allowed_hosts}
+        self.bytes_relayed = 0
+        self._lock = threading.Lock()
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def allow_clone_urls(self, urls: Iterable[str]):
+        hosts = {urlparse(url).hostname for url in urls if url}
+        with self._lock:
+            self.allowed_hosts.update(host.lower() for host in hosts if host)
+
+    def _allowed(self, host: str, port: int) -> bool:
+        with self._lock:
+            return port == ALLOWED_PORT and host.lower() in self.allowed_hosts
+
+    def _count(self, amount: int):
+        with self._lock:
+            self.bytes_relayed += amount
+
+    def _make_handler(self):
+        proxy = self
+
+        class TunnelHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                request_line = self.rfile.readline(65537).decode('latin-1').split()
+                while self.rfile.readline(65537) not in (b'\r\n', b'\n', b''):
+                    pass
+                if len(request_line) < 2 or request_line[0].upper() != 'CONNECT':
+                    self.wfile.write(b"HTTP/1.1 405 Method Not Allowed\r\nContent-Length: 0\r\n\r\n")
+                    return
+                host, _, port = request_line[1].rpartition(':')
+                host = host.strip('[]')
+                if not port.isdigit() or not proxy._allowed(host, int(port)):
+                    self.wfile.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+                    return
+                try:
+                    upstream = socket.create_connection((host, int(port)), timeout=30)
+                except OSError:
+                    self.wfile.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\n\r\n")
+                    return
+                self.wfile.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+                self.wfile.flush()
+                with upstream:
+                    proxy._relay(self.connection, upstream)
+
+        return TunnelHandler
+
+    def _relay(self, client: socket.socket, upstream: socket.socket):
+        peers = {client: upstream, upstream: client}
+        with selectors.DefaultSelector() as selector:
+            for sock in peers:
+                sock.setblocking(True)
+                selector.register(sock, selectors.EVENT_READ)
+            while True:
+                events = selector.select(timeout=300)
+                if not events:
+                    return
+                for key, _ in events:
+                    try:
+                        data = key.fileobj.recv(CHUNK_SIZE)
+                    except OSError:
+                        return
+                    if not data:
+                        return
+                    self.bucket.consume(len(data))
+                    self._count(len(data))
+                    try:
+                        peers[key.fileobj].sendall(data)
+                    except OSError:
+                        return
+
+    def start(self) -> bool:
+        try:
+            self._server = socketserver.ThreadingTCPServer((self.host, self.port), self._make_handler())
+        except OSError as e:
+            print(f"❌ Cannot start bandwidth proxy on {self.host}:{self.port}: {e}")
+            return False
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="bandwidth-proxy", daemon=True).start()
+        print(f"🚦 Bandwidth cap: {self.rate / (1024 * 1024):.2f} MB/s for all git transfers (proxy {self.url})")
+        return True
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            print(f"🚦 Bandwidth proxy relayed {self.bytes_relayed / (1024 * 1024):.2f} MB")
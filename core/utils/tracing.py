@@ -0,0 +1,95 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CREDENTIALS_PATTERN = re.compile(r'(https?://)[^/@\s]+@')
+
+
+def redact(text: str) -> str:
+    return CREDENTIALS_PATTERN.sub(r'\1***@', text)
+
+
+class Tracer:
+    """Collects spans and writes them as Chrome trace-event JSON, which can be
+    opened in chrome://tracing or https://ui.perfetto.dev."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._events: List[Dict] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        thread = threading.current_thread()
+        start = self._now_us()
+        try:
+            yield args
+        except BaseException as e:
+            args.setdefault('error', type(e).__name__)
+            raise
+        finally:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round(start, 1),
+                "dur": round(self._now_us() - start, 1),
+                "pid": self._pid,
+                "tid": thread.ident,
+                "args": args
+            }
+            with self._lock:
+                self._events.append(event)
+                self._threads.setdefault(thread.ident, thread.name)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._threads.items()
+            ]
+            metadata.append({"name": "process_name", "ph": "M", "pid": self._pid, "tid": 0,
+                             "args": {"name": "github-repos-backup-tools"}})
+            return {"traceEvents": metadata + list(self._events), "displayTimeUnit": "ms"}
+
+    def save(self) -> Optional[Path]:
+        if not self.path:
+            return None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f)
+            print(f"🧭 Trace saved: {self.path} ({len(self._events)} spans)")
+            return self.path
+        except Exception as e:
+            print(f"❌ Failed to save trace: {e}")
+            return None
+
+
+class NullTracer:
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        yield args
+
+    def save(self) -> Optional[Path]:
+        return None
+
+
+NULL_TRACER = NullTracer()
@@ -0,0 +1,109 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+# https://github.com/smartlegionlab/
+# --------------------------------------------------------
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from core.backup.restore_manager import RestoreManager
+
+
+def _tar_member(tf: tarfile.TarFile, name: str, data: bytes = b'', linkname: str = None):
+    info = tarfile.TarInfo(name)
+    if linkname is not None:
+        info.type = tarfile.SYMTYPE
+        info.linkname = linkname
+        tf.addfile(info)
+    else:
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+
+
+class RestoreContainmentTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.target = self.root / 'out' / 'a' / 'b'
+        home = mock.patch.object(Path, 'home', return_value=self.root / 'home')
+        home.start()
+        self.addCleanup(home.stop)
+        self.addCleanup(self._tmp.cleanup)
+        self.manager = RestoreManager('alice', workers=2)
+
+    def test_zip_member_with_parent_components_is_refused(self):
+        archive = self.root / 'evil.zip'
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('repositories/r/../../../escaped.txt', b'owned')
+
+        self.assertFalse(self.manager.restore(archive, self.target, repo='r'))
+        self.assertFalse((self.root / 'out' / 'escaped.txt').exists())
+
+    def test_tar_member_with_parent_components_is_refused(self):
+        archive = self.root / 'evil.tar.xz'
+        with tarfile.open(archive, 'w:xz') as tf:
+            _tar_member(tf, 'repositories/r/../../../escaped.txt', b'owned')
+
+        self.assertFalse(self.manager.restore(archive, self.target, repo='r'))
+        self.assertFalse((self.root / 'out' / 'escaped.txt').exists())
+
+    def test_tar_symlink_outside_target_is_not_created(self):
+        archive = self.root / 'evil.tar.xz'
+        outside = self.root / 'outside'
+        outside.mkdir()
+        members = ['repositories/r/link', 'repositories/r/up', 'repositories/r/inner', 'repositories/r/link/x.txt']
+        with tarfile.open(archive, 'w:xz') as tf:
+            _tar_member(tf, members[0], linkname=str(outside))
+            _tar_member(tf, members[1], linkname='../../../../outside')
+            _tar_member(tf, members[2], linkname='file.txt')
+            _tar_member(tf, members[3], b'data')
+
+        self.target.mkdir(parents=True)
+        target = self.target.resolve()
+        self.manager._extract_tar(archive, members, target)
+        self.assertFalse(os.path.lexists(target / 'r' / 'up'))
+        self.assertFalse((target / 'r' / 'link').is_symlink())
+        self.assertEqual(os.readlink(target / 'r' / 'inner'), 'file.txt')
+        self.assertEqual(list(outside.iterdir()), [])
+
+    def test_tar_member_through_archived_symlink_is_refused(self):
+        archive = self.root / 'evil.tar.xz'
+        members = ['repositories/r/link', 'repositories/r/link/x.txt']
+        with tarfile.open(archive, 'w:xz') as tf:
+            _tar_member(tf, members[0], linkname='sub')
+            _tar_member(tf, members[1], b'data')
+
+        self.target.mkdir(parents=True)
+        with self.assertRaises(ValueError):
+            self.manager._extract_tar(archive, members, self.target.resolve())
+
+    def test_write_through_existing_symlink_is_refused(self):
+        archive = self.root / 'repo.zip'
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('repositories/r/sub/file.txt', b'data')
+        outside = self.root / 'outside'
+        outside.mkdir()
+        (self.target / 'r').mkdir(parents=True)
+        os.symlink(outside, self.target / 'r' / 'sub')
+
+        self.assertFalse(self.manager.restore(archive, self.target, repo='r'))
+        self.assertEqual(list(outside.iterdir()), [])
+
+    def test_regular_members_are_restored(self):
+        archive = self.root / 'repo.zip'
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('repositories/r/sub/file.txt', b'data')
+
+        self.assertTrue(self.manager.restore(archive, self.target, repo='r'))
+        self.assertEqual((self.target / 'r' / 'sub' / 'file.txt').read_bytes(), b'data')
+
+
+if __name__ == '__main__':
+    unittest.main()